@@ -0,0 +1,62 @@
+"""Benchmark bulk transaction signing and serialization throughput.
+
+Compares signing one transaction at a time with `Transaction.sign` + `serialize()` against
+`sign_and_serialize` on a thread pool and on a process pool, and reports transactions per
+second per core.
+
+Usage:
+    python benchmarks/bench_bulk_signing.py [n_txs]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import solana.system_program as sp
+from solana.blockhash import Blockhash
+from solana.bulk_signing import sign_and_serialize
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import Transaction
+
+
+def _serial(instruction_sets, blockhash, payer):
+    for instructions in instruction_sets:
+        txn = Transaction(recent_blockhash=blockhash).add(*instructions)
+        txn.sign(payer)
+        txn.serialize()
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(n_txs: int = 20000) -> None:
+    """Run the benchmark."""
+    cores = os.cpu_count() or 1
+    payer = Keypair()
+    blockhash = Blockhash(str(PublicKey(3)))
+    instruction_sets = [
+        [sp.transfer(sp.TransferParams(from_pubkey=payer.public_key, to_pubkey=Keypair().public_key, lamports=1))]
+        for _ in range(n_txs)
+    ]
+
+    serial = _time(lambda: _serial(instruction_sets, blockhash, payer))
+    with ThreadPoolExecutor(max_workers=cores) as executor:
+        threaded = _time(lambda: list(sign_and_serialize(instruction_sets, blockhash, [payer], executor=executor)))
+    processes = _time(lambda: list(sign_and_serialize(instruction_sets, blockhash, [payer])))
+
+    print(f"transactions:                {n_txs}")
+    print(f"cores:                       {cores}")
+    for name, elapsed, n_cores in (
+        ("serial sign + serialize", serial, 1),
+        ("sign_and_serialize threads", threaded, cores),
+        ("sign_and_serialize procs", processes, cores),
+    ):
+        print(f"{name + ':':<29}{n_txs / elapsed:10.0f} tx/s  {n_txs / elapsed / n_cores:10.0f} tx/s/core")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,65 @@
+"""Benchmark per-call latency of the HTTP provider against a local stub RPC server.
+
+Compares a fresh connection per request (the old module-level `requests.post` behaviour)
+with the provider's pooled keep-alive session.
+
+Usage:
+    python benchmarks/bench_http_provider.py [n_calls]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from solana.rpc.providers.http import HTTPProvider
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Answer every JSON-RPC call with a slot number."""
+        req = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        data = json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": 1}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Silence request logging."""
+
+
+def _time_calls(func, n_calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        func()
+    return (time.perf_counter() - start) / n_calls
+
+
+def main(n_calls: int = 2000) -> None:
+    """Run the benchmark."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = "http://{}:{}".format(*httpd.server_address[:2])
+    body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "getSlot", "params": []})
+    headers = {"Content-Type": "application/json"}
+
+    unpooled = _time_calls(lambda: requests.post(url, data=body, headers=headers, timeout=10), n_calls)
+    with HTTPProvider(url) as provider:
+        pooled = _time_calls(lambda: provider.make_request("getSlot"), n_calls)
+    httpd.shutdown()
+
+    print(f"calls per variant:           {n_calls}")
+    print(f"new connection per call:     {unpooled * 1e6:8.1f} us/call")
+    print(f"pooled keep-alive session:   {pooled * 1e6:8.1f} us/call")
+    print(f"speedup:                     {unpooled / pooled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,70 @@
+"""Benchmark decoding SPL token mint and account data.
+
+Compares parsing through the `construct` layouts (the previous implementation of
+`_create_mint_info` / `_create_account_info`) with the precompiled `struct` decoders.
+
+Usage:
+    python benchmarks/bench_token_layouts.py [n_accounts]
+"""
+import os
+import sys
+import time
+
+from solana.publickey import PublicKey
+from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT
+from spl.token.core import AccountInfo, MintInfo, _parse_account_info, _parse_mint_info
+
+
+def _construct_mint_info(bytes_data):
+    decoded = MINT_LAYOUT.parse(bytes_data)
+    return MintInfo(
+        PublicKey(decoded.mint_authority) if decoded.mint_authority_option else None,
+        decoded.supply,
+        decoded.decimals,
+        decoded.is_initialized != 0,
+        PublicKey(decoded.freeze_authority) if decoded.freeze_authority_option else None,
+    )
+
+
+def _construct_account_info(bytes_data):
+    decoded = ACCOUNT_LAYOUT.parse(bytes_data)
+    native = decoded.is_native_option == 1
+    return AccountInfo(
+        PublicKey(decoded.mint),
+        PublicKey(decoded.owner),
+        decoded.amount,
+        PublicKey(decoded.delegate) if decoded.delegate_option else None,
+        decoded.delegated_amount if decoded.delegate_option else 0,
+        decoded.state != 0,
+        decoded.state == 2,
+        native,
+        decoded.is_native if native else None,
+        PublicKey(decoded.close_authority) if decoded.close_authority_option else None,
+    )
+
+
+def _time(func, payloads) -> float:
+    start = time.perf_counter()
+    for data in payloads:
+        func(data)
+    return time.perf_counter() - start
+
+
+def main(n_accounts: int = 20000) -> None:
+    """Run the benchmark."""
+    mints = [os.urandom(MINT_LAYOUT.sizeof()) for _ in range(n_accounts)]
+    accounts = [os.urandom(ACCOUNT_LAYOUT.sizeof()) for _ in range(n_accounts)]
+    print(f"accounts: {n_accounts}")
+    for name, slow, fast, payloads in (
+        ("mint", _construct_mint_info, _parse_mint_info, mints),
+        ("account", _construct_account_info, _parse_account_info, accounts),
+    ):
+        slow_s, fast_s = _time(slow, payloads), _time(fast, payloads)
+        print(
+            f"{name + ':':<9}construct {n_accounts / slow_s:9.0f}/s  struct {n_accounts / fast_s:9.0f}/s"
+            f"  speedup {slow_s / fast_s:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
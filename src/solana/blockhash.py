@@ -5,16 +5,37 @@ Example:
     >>> Blockhash("EETubP5AKHgjPAhzPAFcb8BAY1hMH639CWCFTqi3hq1k")
     'EETubP5AKHgjPAhzPAFcb8BAY1hMH639CWCFTqi3hq1k'
 """
-from typing import NewType
+import threading
+from typing import NamedTuple, NewType, Optional
 
 from cachetools import TTLCache
 
 Blockhash = NewType("Blockhash", str)
 """Type for blockhash."""
 
+MAX_PROCESSING_AGE = 150
+"""Number of blocks a blockhash stays valid for after the block it was fetched at."""
+
+
+class BlockhashCacheEntry(NamedTuple):
+    """A cached blockhash and the metadata returned alongside it by `getLatestBlockhash`."""
+
+    blockhash: Blockhash
+    """The cached blockhash."""
+    slot: int
+    """The slot the blockhash was fetched at."""
+    last_valid_block_height: Optional[int] = None
+    """The last block height at which the blockhash is still valid, if known."""
+
 
 class BlockhashCache:
-    """A recent blockhash cache that expires after a given number of seconds.
+    """A recent blockhash cache that expires after a given number of seconds or blocks.
+
+    Entries stored with a `last_valid_block_height` are evicted as soon as the cache learns that the
+    chain has moved past it. The cache learns the current block height from every `set` call
+    (`getLatestBlockhash` returns a `lastValidBlockHeight` of the current block height plus
+    `MAX_PROCESSING_AGE`) and from `update_block_height`. Entries without a block height only
+    expire after `ttl` seconds.
 
     Args:
         ttl: Seconds until cached blockhash expires.
@@ -25,36 +46,86 @@ class BlockhashCache:
         maxsize = 300
         self.unused_blockhashes: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
         self.used_blockhashes: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # The cache may be refilled from a background thread while the send path reads it.
+        self._lock = threading.Lock()
+        self.block_height: Optional[int] = None
+        """The highest block height the cache knows of, if any."""
 
-    def set(self, blockhash: Blockhash, slot: int, used_immediately: bool = False) -> None:
+    def set(
+        self,
+        blockhash: Blockhash,
+        slot: int,
+        used_immediately: bool = False,
+        last_valid_block_height: Optional[int] = None,
+    ) -> None:
         """Update the cache.
 
         Args:
             blockhash: new Blockhash value.
             slot: the slot which the blockhash came from.
             used_immediately: whether the client used the blockhash immediately after fetching it.
+            last_valid_block_height: (optional) the last block height at which the blockhash is valid.
 
         """
-        if used_immediately:
-            if slot not in self.used_blockhashes:
-                self.used_blockhashes[slot] = blockhash
-            return
-        if slot in self.used_blockhashes or slot in self.unused_blockhashes:
-            return
-        self.unused_blockhashes[slot] = blockhash
+        entry = BlockhashCacheEntry(blockhash, slot, last_valid_block_height)
+        with self._lock:
+            if last_valid_block_height is not None:
+                self._advance_block_height(last_valid_block_height - MAX_PROCESSING_AGE)
+            if used_immediately:
+                if slot not in self.used_blockhashes:
+                    self.used_blockhashes[slot] = entry
+                return
+            if slot in self.used_blockhashes or slot in self.unused_blockhashes:
+                return
+            self.unused_blockhashes[slot] = entry
+
+    def update_block_height(self, block_height: int) -> None:
+        """Tell the cache the current block height, evicting every entry that is no longer valid.
+
+        Args:
+            block_height: the current block height, e.g. from `getBlockHeight`.
+
+        """
+        with self._lock:
+            self._advance_block_height(block_height)
 
     def get(self) -> Blockhash:
-        """Get the cached Blockhash. Raises KeyError if cache has expired.
+        """Get the cached Blockhash. Raises ValueError if cache has expired.
 
         Returns:
             cached Blockhash.
 
         """
-        try:
-            slot, blockhash = self.unused_blockhashes.popitem()
-            self.used_blockhashes[slot] = blockhash
-        except KeyError:
-            with self.used_blockhashes.timer:  # type: ignore
-                blockhash = self.used_blockhashes[min(self.used_blockhashes)]
-                # raises ValueError if used_blockhashes is empty
-        return blockhash
+        return self.get_entry().blockhash
+
+    def get_entry(self) -> BlockhashCacheEntry:
+        """Get the cached Blockhash along with its slot and last valid block height.
+
+        Raises ValueError if cache has expired.
+
+        Returns:
+            cached entry.
+
+        """
+        with self._lock:
+            try:
+                slot, entry = self.unused_blockhashes.popitem()
+                self.used_blockhashes[slot] = entry
+            except KeyError:
+                with self.used_blockhashes.timer:  # type: ignore
+                    entry = self.used_blockhashes[min(self.used_blockhashes)]
+                    # raises ValueError if used_blockhashes is empty
+        return entry
+
+    def _advance_block_height(self, block_height: int) -> None:
+        if self.block_height is not None and block_height <= self.block_height:
+            return
+        self.block_height = block_height
+        for cache in (self.unused_blockhashes, self.used_blockhashes):
+            expired = [
+                slot
+                for slot, entry in cache.items()
+                if entry.last_valid_block_height is not None and entry.last_valid_block_height < block_height
+            ]
+            for slot in expired:
+                del cache[slot]
@@ -0,0 +1,101 @@
+"""Sign and serialize many transactions in parallel.
+
+Example:
+    >>> from solana.keypair import Keypair
+    >>> from solana.publickey import PublicKey
+    >>> from solana.system_program import transfer, TransferParams
+    >>> payer = Keypair()
+    >>> instruction_sets = [
+    ...     [transfer(TransferParams(from_pubkey=payer.public_key, to_pubkey=PublicKey(i + 1), lamports=1000))]
+    ...     for i in range(100)
+    ... ]
+    >>> blockhash = Blockhash(str(PublicKey(3)))
+    >>> wire_txs = list(sign_and_serialize(instruction_sets, blockhash, [payer]))  # doctest: +SKIP
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence
+
+from solana.blockhash import Blockhash
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import TransactionBuilder, TransactionInstruction
+
+DEFAULT_CHUNK_SIZE = 256
+"""Default number of transactions handed to a worker at a time."""
+
+
+def _sign_chunk(
+    instruction_sets: List[Sequence[TransactionInstruction]],
+    recent_blockhash: Blockhash,
+    signers: Sequence[Keypair],
+    fee_payer: Optional[PublicKey],
+    verify_sample: bool,
+) -> List[bytes]:
+    wire_txs = []
+    for idx, instructions in enumerate(instruction_sets):
+        builder = TransactionBuilder(recent_blockhash=recent_blockhash, fee_payer=fee_payer, instructions=instructions)
+        txn = builder.sign(*signers)
+        wire_txs.append(txn.serialize(verify_signatures=verify_sample and idx == 0))
+    return wire_txs
+
+
+def sign_and_serialize(  # pylint: disable=too-many-arguments
+    instruction_sets: Iterable[Sequence[TransactionInstruction]],
+    recent_blockhash: Blockhash,
+    signers: Sequence[Keypair],
+    fee_payer: Optional[PublicKey] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    verify_sample: bool = True,
+) -> Iterator[bytes]:
+    """Build, sign and serialize one transaction per instruction set using a pool of workers.
+
+    The instruction sets are consumed lazily in chunks of `chunk_size`, and only a bounded number of
+    chunks is in flight at a time, so arbitrarily long inputs can be streamed straight to
+    `send_raw_transaction`. The wire-format transactions are yielded in input order.
+
+    Args:
+        instruction_sets: The instructions for each transaction.
+        recent_blockhash: The blockhash every transaction is compiled with.
+        signers: The keypairs that sign every transaction.
+        fee_payer: (optional) The fee payer. Defaults to the first signer required by the instructions.
+        executor: (optional) The executor to run the work on. Defaults to a `ProcessPoolExecutor` that is
+            shut down when the iterator is exhausted. A `ThreadPoolExecutor` avoids the cost of pickling
+            instructions to worker processes, but only scales if the signing library releases the GIL.
+        max_workers: Number of workers of the default executor, and the basis for how many chunks are
+            kept in flight. Defaults to `os.cpu_count()`.
+        chunk_size: Number of transactions per unit of work.
+        verify_sample: If True, verify the signatures of the first transaction of every chunk.
+            The remaining transactions are serialized without re-verifying their signatures.
+
+    Returns:
+        An iterator over the serialized transactions.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    workers = max_workers or os.cpu_count() or 1
+    own_executor = executor is None
+    pool = ProcessPoolExecutor(max_workers=workers) if executor is None else executor
+    pending: Deque[Future[List[bytes]]] = deque()
+    sets_iter = iter(instruction_sets)
+    try:
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(sets_iter, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_sign_chunk, chunk, recent_blockhash, signers, fee_payer, verify_sample))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            pool.shutdown(wait=True)
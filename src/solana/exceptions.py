@@ -23,6 +23,9 @@ class SolanaRpcException(SolanaExceptionBase):
     @staticmethod
     def _build_error_message(exc: Exception, func: Callable[[Any], Any], *args: Any, **kwargs: Any) -> str:
         rpc_method = args[1]
+        if not isinstance(rpc_method, str):
+            # Batch requests pass a sequence of (method, *params) tuples.
+            rpc_method = ", ".join(req[0] for req in rpc_method)
         return f'{type(exc)} raised in "{rpc_method}" endpoint request'
 
 
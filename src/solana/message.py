@@ -1,7 +1,7 @@
 """Library for generating a message from a sequence of instructions."""
 from __future__ import annotations
 
-from typing import List, NamedTuple
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Tuple
 
 from solders.hash import Hash
 from solders.instruction import CompiledInstruction
@@ -10,8 +10,36 @@ from solders.message import MessageHeader
 from solders.pubkey import Pubkey
 
 from solana.blockhash import Blockhash
+from solana.keypair import Keypair
 from solana.publickey import PublicKey
 
+if TYPE_CHECKING:
+    from solana.transaction import TransactionInstruction
+
+
+def _encode_length(value: int) -> bytes:
+    """Encode a compact-u16 ("shortvec") length prefix."""
+    encoded = bytearray()
+    while True:
+        elem = value & 0x7F
+        value >>= 7
+        if not value:
+            encoded.append(elem)
+            return bytes(encoded)
+        encoded.append(elem | 0x80)
+
+
+def _decode_length(raw: bytes, offset: int) -> Tuple[int, int]:
+    """Decode a compact-u16 length prefix starting at `offset`, returning the value and the next offset."""
+    value = size = 0
+    while True:
+        elem = raw[offset]
+        offset += 1
+        value |= (elem & 0x7F) << (size * 7)
+        size += 1
+        if not elem & 0x80:
+            return value, offset
+
 
 class MessageArgs(NamedTuple):
     """Message constructor arguments."""
@@ -163,3 +191,122 @@ class Message:
         """
         msg = SoldersMessage.from_bytes(raw_message)
         return cls.from_solders(msg)
+
+
+class MessageTemplate:
+    """A compiled message whose blockhash and instruction data can be replaced without recompiling it.
+
+    Compiling a message orders the account keys and builds the header, which is the expensive part
+    of building a transaction. When the same instruction shape is sent repeatedly and only the
+    blockhash and the instruction data (e.g. amounts) change, the template compiles once and then
+    patches those bytes directly in the serialized message.
+
+    The patched instruction data must have the same length as in the template.
+
+    Args:
+        message: The compiled message to use as the template. Its blockhash and instruction data are placeholders.
+
+    Example:
+        >>> from solana.keypair import Keypair
+        >>> from solana.system_program import transfer, TransferParams
+        >>> from solana.transaction import Transaction
+        >>> sender, receiver = Keypair.from_seed(bytes(PublicKey(1))), PublicKey(2)
+        >>> ixn = transfer(TransferParams(from_pubkey=sender.public_key, to_pubkey=receiver, lamports=1000))
+        >>> template = MessageTemplate.from_instructions([ixn])
+        >>> new_ixn = transfer(TransferParams(from_pubkey=sender.public_key, to_pubkey=receiver, lamports=2000))
+        >>> wire_tx = template.sign(Blockhash(str(PublicKey(3))), [sender], [new_ixn.data])
+        >>> Transaction.deserialize(wire_tx).instructions[0] == new_ixn
+        True
+    """
+
+    def __init__(self, message: Message) -> None:
+        """Init message template object."""
+        raw = message.serialize()
+        num_keys, offset = _decode_length(raw, 3)
+        self._blockhash_offset = offset + num_keys * PublicKey.LENGTH
+        offset = self._blockhash_offset + PublicKey.LENGTH
+        num_instructions, offset = _decode_length(raw, offset)
+        data_spans = []
+        for _ in range(num_instructions):
+            num_accounts, offset = _decode_length(raw, offset + 1)  # skip the program id index
+            data_len, offset = _decode_length(raw, offset + num_accounts)
+            data_spans.append((offset, offset + data_len))
+            offset += data_len
+        self._raw = raw
+        self._data_spans: List[Tuple[int, int]] = data_spans
+        self._signers = message.account_keys[: message.header.num_required_signatures]
+
+    @classmethod
+    def from_instructions(
+        cls, instructions: Sequence[TransactionInstruction], fee_payer: Optional[PublicKey] = None
+    ) -> MessageTemplate:
+        """Compile a template from instructions.
+
+        Args:
+            instructions: The instructions, with placeholder data of the right length.
+            fee_payer: (optional) The transaction fee payer. Defaults to the first signer of the instructions.
+
+        Returns:
+            The message template.
+        """
+        msg = SoldersMessage.new_with_blockhash(
+            [ixn.to_solders() for ixn in instructions],
+            None if fee_payer is None else fee_payer.to_solders(),
+            Hash.default(),
+        )
+        return cls(Message.from_solders(msg))
+
+    @property
+    def signers(self) -> List[PublicKey]:
+        """The public keys that must sign, in signature order."""
+        return list(self._signers)
+
+    @property
+    def data_lengths(self) -> List[int]:
+        """The fixed length of each instruction's data."""
+        return [end - start for start, end in self._data_spans]
+
+    def serialize_message(self, recent_blockhash: Blockhash, data: Optional[Sequence[Optional[bytes]]] = None) -> bytes:
+        """Serialize the template with a new blockhash and instruction data.
+
+        Args:
+            recent_blockhash: The blockhash to use.
+            data: (optional) The new data of each instruction, in order. `None` keeps an instruction's template data.
+
+        Returns:
+            The serialized message.
+        """
+        buf = bytearray(self._raw)
+        buf[self._blockhash_offset : self._blockhash_offset + PublicKey.LENGTH] = bytes(  # noqa: E203
+            Hash.from_string(recent_blockhash)
+        )
+        if data is not None:
+            if len(data) != len(self._data_spans):
+                raise ValueError(f"expected data for {len(self._data_spans)} instructions, got {len(data)}")
+            for idx, ((start, end), ixn_data) in enumerate(zip(self._data_spans, data)):
+                if ixn_data is None:
+                    continue
+                if len(ixn_data) != end - start:
+                    raise ValueError(f"instruction {idx} data must be {end - start} bytes, got {len(ixn_data)}")
+                buf[start:end] = ixn_data
+        return bytes(buf)
+
+    def sign(
+        self, recent_blockhash: Blockhash, signers: Sequence[Keypair], data: Optional[Sequence[Optional[bytes]]] = None
+    ) -> bytes:
+        """Patch the template, sign it and serialize it in the transaction wire format.
+
+        Args:
+            recent_blockhash: The blockhash to use.
+            signers: The keypairs for every required signer, in any order.
+            data: (optional) The new data of each instruction, in order. `None` keeps an instruction's template data.
+
+        Returns:
+            The serialized, signed transaction, ready for `send_raw_transaction`.
+        """
+        msg = self.serialize_message(recent_blockhash, data)
+        by_pubkey = {signer.public_key: signer for signer in signers}
+        if len(by_pubkey) != len(self._signers) or any(pubkey not in by_pubkey for pubkey in self._signers):
+            raise ValueError(f"expected signers {[str(pubkey) for pubkey in self._signers]}")
+        signatures = b"".join(bytes(by_pubkey[pubkey].sign(msg)) for pubkey in self._signers)
+        return _encode_length(len(self._signers)) + signatures + msg
@@ -0,0 +1,170 @@
+"""Derive many program addresses at once, optionally in parallel and through an on-disk cache.
+
+Example:
+    >>> program_id = PublicKey(9)
+    >>> seeds = [[b"vault", bytes(PublicKey(i))] for i in range(1, 4)]
+    >>> with ProgramAddressCache() as cache:
+    ...     derived = find_program_addresses(seeds, program_id, cache=cache)
+    ...     len(cache)
+    3
+    >>> derived[0] == PublicKey.find_program_address(seeds[0], program_id)
+    True
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from solders.pubkey import Pubkey
+
+from solana.publickey import PublicKey
+
+DEFAULT_CHUNK_SIZE = 4096
+"""Default number of seed sets handed to a worker at a time."""
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+def _seeds_key(seeds: Sequence[bytes]) -> bytes:
+    # Seeds are at most 32 bytes each, so a length byte before each one keeps keys unambiguous.
+    return b"".join(bytes((len(seed),)) + seed for seed in seeds)
+
+
+def _derive_chunk(seed_sets: List[List[bytes]], program_id: bytes) -> List[Tuple[bytes, int]]:
+    program = Pubkey(program_id)
+    derived = []
+    for seeds in seed_sets:
+        address, bump = Pubkey.find_program_address(seeds, program)
+        derived.append((bytes(address), bump))
+    return derived
+
+
+class ProgramAddressCache:
+    """A persistent cache of derived program addresses, keyed by seeds and program id, in SQLite.
+
+    The cache can be shared between threads; its database connection is used by one at a time.
+
+    Args:
+        path: The database file. Defaults to an in-memory database.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Open (and create if needed) the cache database."""
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS program_addresses ("
+            "program_id BLOB NOT NULL, seeds BLOB NOT NULL, address BLOB NOT NULL, bump INTEGER NOT NULL, "
+            "PRIMARY KEY (program_id, seeds)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        """Number of cached addresses."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM program_addresses").fetchone()[0]
+
+    def get_many(self, program_id: PublicKey, seed_keys: Sequence[bytes]) -> Dict[bytes, Tuple[bytes, int]]:
+        """Look up cached addresses.
+
+        Args:
+            program_id: The program the addresses belong to.
+            seed_keys: Encoded seed sets to look up.
+
+        Returns:
+            The raw address and bump of every seed set that is cached.
+        """
+        found: Dict[bytes, Tuple[bytes, int]] = {}
+        raw_program_id = bytes(program_id)
+        for start in range(0, len(seed_keys), _SQLITE_MAX_VARIABLES):
+            chunk = seed_keys[start : start + _SQLITE_MAX_VARIABLES]  # noqa: E203
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seeds, address, bump FROM program_addresses "
+                    f"WHERE program_id = ? AND seeds IN ({', '.join('?' * len(chunk))})",
+                    (raw_program_id, *chunk),
+                ).fetchall()
+            for seeds, address, bump in rows:
+                found[seeds] = (address, bump)
+        return found
+
+    def put_many(self, program_id: PublicKey, entries: Iterable[Tuple[bytes, bytes, int]]) -> None:
+        """Store derived addresses.
+
+        Args:
+            program_id: The program the addresses belong to.
+            entries: (encoded seed set, raw address, bump) triples.
+        """
+        raw_program_id = bytes(program_id)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO program_addresses VALUES (?, ?, ?, ?)",
+                ((raw_program_id, seeds, address, bump) for seeds, address, bump in entries),
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> ProgramAddressCache:
+        """Use the cache as a context manager."""
+        return self
+
+    def __exit__(self, _exc_type, _exc, _tb):
+        """Close the database."""
+        self.close()
+
+
+def find_program_addresses(
+    seed_sets: Iterable[Sequence[bytes]],
+    program_id: PublicKey,
+    executor: Optional[Executor] = None,
+    cache: Optional[ProgramAddressCache] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Tuple[PublicKey, int]]:
+    """Find the program address and bump of many seed sets for one program.
+
+    Equivalent to calling `PublicKey.find_program_address` for each seed set, but seed sets found in
+    `cache` are not derived again and the rest can be derived on a pool of workers.
+
+    Args:
+        seed_sets: The seeds of each address.
+        program_id: The program the addresses belong to.
+        executor: (optional) Executor to derive the addresses on, in chunks of `chunk_size` seed sets.
+            Pass a `ProcessPoolExecutor` to use every core. By default they are derived in the calling thread.
+        cache: (optional) Cache to look addresses up in first. Newly derived addresses are added to it.
+        chunk_size: Number of seed sets per unit of work handed to `executor`.
+
+    Returns:
+        The program address and bump of each seed set, in order.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    seed_lists = [[bytes(seed) for seed in seeds] for seeds in seed_sets]
+    keys = [_seeds_key(seeds) for seeds in seed_lists]
+    known = cache.get_many(program_id, list(set(keys))) if cache is not None else {}
+    missing: Dict[bytes, List[bytes]] = {}
+    for key, seeds in zip(keys, seed_lists):
+        if key not in known:
+            missing.setdefault(key, seeds)
+    if missing:
+        derived = _derive_missing(missing, program_id, executor, chunk_size)
+        known.update(derived)
+        if cache is not None:
+            cache.put_many(program_id, ((key, address, bump) for key, (address, bump) in derived.items()))
+    return [(PublicKey(known[key][0]), known[key][1]) for key in keys]
+
+
+def _derive_missing(
+    missing: Dict[bytes, List[bytes]], program_id: PublicKey, executor: Optional[Executor], chunk_size: int
+) -> Dict[bytes, Tuple[bytes, int]]:
+    missing_seeds = list(missing.values())
+    starts = range(0, len(missing_seeds), chunk_size)
+    chunks = [missing_seeds[start : start + chunk_size] for start in starts]  # noqa: E203
+    derive = partial(_derive_chunk, program_id=bytes(program_id))
+    derived_chunks = map(derive, chunks) if executor is None else executor.map(derive, chunks)
+    return dict(zip(missing, (entry for chunk in derived_chunks for entry in chunk)))
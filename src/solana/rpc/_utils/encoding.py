@@ -1,7 +1,69 @@
 """Friendly JSON serializer & deserializer for Requests."""
 import collections.abc
+import importlib
 import json
-from typing import Any, Dict, Iterable, Optional, Type
+import os
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+JSON_BACKENDS = ("orjson", "msgspec", "ujson", "json")
+"""Supported JSON libraries, in order of preference."""
+
+
+class JsonBackend(NamedTuple):
+    """A JSON library used to encode requests and decode responses."""
+
+    name: str
+    """The library's module name."""
+    dumps: Callable[[Any], str]
+    """Serialize an object to a JSON `str`."""
+    loads: Callable[[Union[str, bytes]], Any]
+    """Deserialize a JSON document from `str` or `bytes`."""
+    errors: Tuple[Type[Exception], ...]
+    """Exceptions the library raises on invalid JSON."""
+
+
+def load_json_backend(name: str) -> JsonBackend:
+    """Load a JSON backend by name.
+
+    Args:
+        name: One of `JSON_BACKENDS`.
+
+    Returns:
+        The backend. Raises `ImportError` if the library is not installed.
+    """
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}, expected one of {JSON_BACKENDS}")
+    if name == "json":
+        return JsonBackend("json", json.dumps, json.loads, (json.JSONDecodeError,))
+    if name == "msgspec":
+        msgspec_json = importlib.import_module("msgspec.json")
+        msgspec = importlib.import_module("msgspec")
+        encoder, decoder = msgspec_json.Encoder(), msgspec_json.Decoder()
+        return JsonBackend("msgspec", lambda obj: encoder.encode(obj).decode(), decoder.decode, (msgspec.DecodeError,))
+    lib = importlib.import_module(name)
+    if name == "orjson":
+        return JsonBackend("orjson", lambda obj: lib.dumps(obj).decode(), lib.loads, (lib.JSONDecodeError,))
+    return JsonBackend(name, lib.dumps, lib.loads, (ValueError,))
+
+
+def default_json_backend() -> JsonBackend:
+    """Pick the JSON backend to use.
+
+    The `SOLANARPC_JSON_BACKEND` environment variable selects a backend explicitly.
+    Otherwise the first installed library in `JSON_BACKENDS` is used.
+
+    Returns:
+        The backend.
+    """
+    requested = os.environ.get("SOLANARPC_JSON_BACKEND")
+    if requested:
+        return load_json_backend(requested)
+    for name in JSON_BACKENDS:
+        try:
+            return load_json_backend(name)
+        except ImportError:
+            continue
+    raise AssertionError("unreachable: the stdlib json backend is always available")
 
 
 # Original source:
@@ -12,8 +74,13 @@ class FriendlyJsonSerde:
     When encoding or decoding fails, this class collects
     information on which fields failed, to show more
     helpful information in the raised error messages.
+
+    Encoding and decoding go through `json_backend`, which defaults to the fastest
+    installed JSON library (see `default_json_backend`).
     """
 
+    json_backend: JsonBackend = default_json_backend()
+
     def _json_mapping_errors(self, mapping: Dict[Any, Any]) -> Iterable[str]:
         for key, val in mapping.items():
             try:
@@ -32,10 +99,11 @@ class FriendlyJsonSerde:
     def _is_list_like(obj: Any) -> bool:
         return not isinstance(obj, (bytes, str, bytearray)) and isinstance(obj, collections.abc.Sequence)
 
-    def _friendly_json_encode(self, obj: Dict[Any, Any], cls: Optional[Type[json.JSONEncoder]] = None) -> str:
+    def _friendly_json_encode(self, obj: Any, cls: Optional[Type[json.JSONEncoder]] = None) -> str:
         try:
-            encoded = json.dumps(obj, cls=cls)
-            return encoded
+            if cls is not None:
+                return json.dumps(obj, cls=cls)
+            return self.json_backend.dumps(obj)
         except TypeError as full_exception:
             if hasattr(obj, "items"):
                 item_errors = "; ".join(self._json_mapping_errors(obj))
@@ -45,18 +113,26 @@ class FriendlyJsonSerde:
                 raise TypeError(f"list had unencodable value at index: [{element_errors}]") from full_exception
             raise full_exception
 
-    def json_decode(self, json_str: str) -> Dict[Any, Any]:  # pylint: disable=no-self-use
-        """Deserialize JSON document to a Python object with friendly error messages."""
+    def json_decode(self, json_str: Union[str, bytes]) -> Dict[Any, Any]:
+        """Deserialize JSON document to a Python object with friendly error messages.
+
+        Pass the raw response `bytes` where possible, which saves decoding them to `str` first.
+        """
+        try:
+            return self.json_backend.loads(json_str)
+        except self.json_backend.errors:
+            pass
+        # Fall back to the stdlib, both for its error message and for documents the faster
+        # libraries reject but the stdlib accepts (e.g. integers wider than 64 bits).
         try:
-            decoded = json.loads(json_str)
-            return decoded
+            return json.loads(json_str)
         except json.decoder.JSONDecodeError as exc:
             err_msg = f"Could not decode {repr(json_str)} because of {exc}."
             # Calling code may rely on catching JSONDecodeError to recognize bad json
             # so we have to re-raise the same type.
             raise json.decoder.JSONDecodeError(err_msg, exc.doc, exc.pos)
 
-    def json_encode(self, obj: Dict[Any, Any], cls: Optional[Type[json.JSONEncoder]] = None) -> str:
+    def json_encode(self, obj: Union[Dict[Any, Any], List[Any]], cls: Optional[Type[json.JSONEncoder]] = None) -> str:
         """Serialize obj to a JSON formatted `str` with friendly error messages."""
         try:
             return self._friendly_json_encode(obj, cls=cls)
@@ -0,0 +1,320 @@
+"""Incremental parser that streams the elements of one array out of a JSON-RPC response."""
+import codecs
+import json
+import re
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
+_STRUCTURAL = re.compile(r'["{}\[\],:]')
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_NOT_BRACKET = re.compile(r"[^{}\[\]]+")
+_BRACKET_DEPTH = {"{": 1, "[": 1, "}": -1, "]": -1}
+_STRING_SPECIAL = re.compile(r'["\\]')
+_DELIMITER = re.compile(r"[,\]]")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def _skip_whitespace(buf: str, pos: int) -> int:
+    match = _WHITESPACE.match(buf, pos)
+    return pos if match is None else match.end()
+
+
+class _Frame:  # pylint: disable=too-few-public-methods
+    """An open JSON object or array outside the streamed array's elements."""
+
+    __slots__ = ("is_object", "path", "key", "expect_key", "value_start")
+
+    def __init__(self, is_object: bool, path: Optional[Tuple[str, ...]]) -> None:
+        self.is_object = is_object
+        # Keys leading to this container, or None once it is off the path to the streamed array.
+        self.path = path
+        self.key: Optional[str] = None
+        self.expect_key = is_object
+        # Start of the top-level member value being collected into the envelope.
+        self.value_start: Optional[int] = None
+
+
+class _ElementScanner:  # pylint: disable=too-few-public-methods
+    """Tracks whether an object, array or string element is complete as its chunks arrive.
+
+    Each chunk is looked at once, and only by C code except for the escapes of a string cut by a chunk
+    boundary: complete strings are dropped with a regex, then the bracket depth is summed by `accumulate`.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        # Whether the chunk so far ended with the backslash of an escape inside a string.
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Scan the next chunk of the element. Returns True once the element is complete."""
+        if not text:
+            return False
+        if self.in_string:
+            end = self._string_end(text)
+            if end is None:
+                return False
+            self.in_string = False
+            if not self.depth:
+                return True
+            text = text[end:]
+        outside = _STRING.sub("", text)
+        quote = outside.find('"')
+        if quote >= 0:
+            # A string starts but does not end in this chunk.
+            outside = outside[:quote]
+        brackets = _NOT_BRACKET.sub("", outside)
+        if brackets:
+            depths = list(accumulate(map(_BRACKET_DEPTH.__getitem__, brackets)))
+            if self.depth + min(depths) <= 0:
+                return True
+            self.depth += depths[-1]
+        if quote >= 0:
+            self.in_string = True
+            self.escaped = (len(text) - len(text.rstrip("\\"))) % 2 == 1
+        return False
+
+    def _string_end(self, text: str) -> Optional[int]:
+        pos = 1 if self.escaped else 0
+        self.escaped = False
+        while True:
+            match = _STRING_SPECIAL.search(text, pos)
+            if match is None:
+                return None
+            idx = match.start()
+            if text[idx] == '"':
+                return idx + 1
+            if idx + 1 >= len(text):
+                self.escaped = True
+                return None
+            pos = idx + 2
+
+
+class JsonArrayStream:  # pylint: disable=too-many-instance-attributes
+    """Extract the elements of the array at `path` from a JSON document fed in chunks.
+
+    Only the element currently being received is buffered, so the peak memory of parsing a
+    response is bounded by its largest element instead of its total size. Each element is
+    decoded by the stdlib's C scanner as soon as it is complete. The chunks of an element that
+    spans several of them are only scanned for its end, and joined and decoded once.
+
+    The other top-level members of the document (`jsonrpc`, `id`, `error`, ...) are collected into
+    `envelope`; sibling members of the array below the top level (e.g. `context`) are skipped.
+
+    Args:
+        path: Object keys leading to the array, e.g. `("result",)` or `("result", "transactions")`.
+
+    Example:
+        >>> stream = JsonArrayStream(("result",))
+        >>> stream.feed(b'{"jsonrpc": "2.0", "result": [{"a": 1}, {"a"')
+        [{'a': 1}]
+        >>> stream.feed(b': 2}], "id": 1}')
+        [{'a': 2}]
+        >>> stream.close()
+        {'jsonrpc': '2.0', 'id': 1}
+    """
+
+    def __init__(self, path: Tuple[str, ...]) -> None:
+        """Init an empty stream."""
+        if not path:
+            raise ValueError("path must name at least one key")
+        self.path = path
+        self.envelope: Dict[str, Any] = {}
+        """Top-level members of the document other than the one containing the array."""
+        self.found = False
+        """Whether the array at `path` was encountered."""
+        self.done = False
+        """Whether the whole document has been parsed."""
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._string_start: Optional[int] = None
+        self._in_array = False
+        # Scanner of the incomplete element at `_pos`, whose later chunks wait in `_tail` unjoined.
+        self._element: Optional[_ElementScanner] = None
+        self._tail: List[str] = []
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the document.
+
+        Args:
+            chunk: The next bytes of the document.
+
+        Returns:
+            The array elements completed by this chunk, in order.
+        """
+        items: List[Any] = []
+        if self.done:
+            return items
+        text = self._utf8.decode(chunk)
+        if self._element is not None:
+            self._tail.append(text)
+            if not self._element.feed(text):
+                return items
+            self._element = None
+            text = "".join(self._tail)
+            self._tail = []
+        self._buf += text
+        while not self.done and self._pos < len(self._buf):
+            progressed = self._scan_array(items) if self._in_array else self._scan_structure()
+            if not progressed:
+                break
+        self._trim()
+        return items
+
+    def close(self) -> Dict[str, Any]:
+        """Finish parsing.
+
+        Returns:
+            The envelope of the document. Raises `ValueError` if the document was truncated.
+        """
+        if not self.done:
+            raise ValueError("JSON document ended before it was complete")
+        return self.envelope
+
+    def _scan_array(self, items: List[Any]) -> bool:
+        """Decode whole elements of the streamed array. Returns False when more input is needed."""
+        buf = self._buf
+        while True:
+            pos = _skip_whitespace(buf, self._pos)
+            if pos >= len(buf):
+                return False
+            char = buf[pos]
+            if char == "]":
+                self._in_array = False
+                self._pos = pos + 1
+                self._close_frame()
+                return True
+            if char == ",":
+                pos = _skip_whitespace(buf, pos + 1)
+                if pos >= len(buf):
+                    self._pos = pos
+                    return False
+            self._pos = pos
+            if buf[pos] in '{["':
+                try:
+                    item, end = _DECODER.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    scanner = _ElementScanner()
+                    if scanner.feed(buf[pos:]):
+                        raise
+                    self._element = scanner
+                    return False
+            else:
+                # A number cut by a chunk boundary still decodes (`-2500.` as `-2500`), so a scalar
+                # is only complete once the delimiter after it has arrived.
+                match = _DELIMITER.search(buf, pos)
+                if match is None:
+                    return False
+                item, end = _DECODER.raw_decode(buf, pos)
+                if _skip_whitespace(buf, end) < match.start():
+                    raise ValueError(f"Unexpected data after array element at {end}")
+            items.append(item)
+            self._pos = end
+
+    def _scan_structure(self) -> bool:  # pylint: disable=too-many-branches
+        """Track the document structure outside the streamed array. Returns False when more input is needed."""
+        buf = self._buf
+        size = len(buf)
+        pos = self._pos
+        while pos < size and not self.done and not self._in_array:
+            if self._string_start is not None:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = size
+                    break
+                idx = match.start()
+                if buf[idx] == "\\":
+                    if idx + 1 >= size:
+                        pos = idx
+                        break
+                    pos = idx + 2
+                    continue
+                self._end_string(idx)
+                pos = idx + 1
+                continue
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = size
+                break
+            idx = match.start()
+            pos = idx + 1
+            char = buf[idx]
+            frame = self._stack[-1] if self._stack else None
+            if char == '"':
+                self._string_start = idx
+            elif char in "{[":
+                self._open(char == "{")
+            elif frame is None:
+                raise ValueError(f"Unexpected {char!r} at top level")
+            elif char == ":":
+                if len(self._stack) == 1 and frame.key != self.path[0]:
+                    frame.value_start = pos
+            elif char == ",":
+                if frame.value_start is not None:
+                    self._take_value(frame, idx)
+                frame.expect_key = frame.is_object
+            else:
+                if frame.value_start is not None:
+                    self._take_value(frame, idx)
+                self._close_frame()
+        progressed = pos != self._pos
+        self._pos = pos
+        return progressed
+
+    def _open(self, is_object: bool) -> None:
+        if not self._stack:
+            self._stack.append(_Frame(is_object, ()))
+            return
+        parent = self._stack[-1]
+        path = None
+        if (
+            parent.is_object
+            and parent.path is not None
+            and len(parent.path) < len(self.path)
+            and parent.key == self.path[len(parent.path)]
+        ):
+            path = parent.path + (parent.key,)
+        self._stack.append(_Frame(is_object, path))
+        if not is_object and path == self.path:
+            self.found = True
+            self._in_array = True
+
+    def _close_frame(self) -> None:
+        self._stack.pop()
+        self.done = not self._stack
+
+    def _end_string(self, idx: int) -> None:
+        start = self._string_start
+        self._string_start = None
+        frame = self._stack[-1]
+        if frame.is_object and frame.expect_key:
+            frame.expect_key = False
+            if frame.path is not None:
+                frame.key = json.loads(self._buf[start : idx + 1])  # noqa: E203
+
+    def _take_value(self, frame: _Frame, end: int) -> None:
+        self.envelope[frame.key or ""] = json.loads(self._buf[frame.value_start : end])  # noqa: E203
+        frame.value_start = None
+
+    def _trim(self) -> None:
+        keep = self._pos
+        if self._string_start is not None:
+            keep = min(keep, self._string_start)
+        for frame in self._stack:
+            if frame.value_start is not None:
+                keep = min(keep, frame.value_start)
+        if not keep:
+            return
+        self._buf = self._buf[keep:]
+        self._pos -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
+        for frame in self._stack:
+            if frame.value_start is not None:
+                frame.value_start -= keep
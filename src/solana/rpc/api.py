@@ -1,26 +1,40 @@
 """API client to interact with the Solana JSON RPC Endpoint."""  # pylint: disable=too-many-lines
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep, time
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, cast
 from warnings import warn
 
+from websockets.exceptions import WebSocketException
+
 from solana.blockhash import Blockhash, BlockhashCache
 from solana.keypair import Keypair
 from solana.message import Message
 from solana.publickey import PublicKey
 from solana.rpc import types
-from solana.transaction import Transaction
+from solana.transaction import Transaction, TransactionSignature
 
+from ._utils.json_stream import JsonArrayStream
 from .commitment import COMMITMENT_RANKS, Commitment, Finalized
 from .core import (
+    BLOCKHASH_REFRESH_SECONDS,
+    MAX_MULTIPLE_ACCOUNTS,
+    SUBSCRIPTION_CHECK_SECONDS,
     RPCException,
     TransactionExpiredBlockheightExceededError,
     TransactionUncompiledError,
     UnconfirmedTxError,
     _ClientCore,
+    _RequestBatchCore,
 )
-from .providers import http
+from .providers import http, multi_http
+from .providers.cache import ResponseCache
+from .providers.core import TraceHook
+from .providers.rate_limit import RateLimit
+from .providers.retry import RetryPolicy
 
 
 def DataSliceOpt(*args, **kwargs) -> types.DataSliceOpts:  # pylint: disable=invalid-name
@@ -38,11 +52,53 @@ def MemcmpOpt(*args, **kwargs) -> types.MemcmpOpts:  # pylint: disable=invalid-n
     return types.MemcmpOpts(*args, **kwargs)
 
 
+class RequestBatch(_RequestBatchCore):
+    """Batch of RPC calls sent in a single HTTP request. Create one with `Client.batch`.
+
+    Example:
+        >>> from solana.publickey import PublicKey
+        >>> solana_client = Client("http://localhost:8899")
+        >>> with solana_client.batch() as batch:
+        ...     first = batch.get_balance(PublicKey(1))
+        ...     second = batch.get_balance(PublicKey(2)) # doctest: +SKIP
+        >>> batch.results[second] # doctest: +SKIP
+        {'jsonrpc': '2.0', 'result': {'context': {'slot': 228}, 'value': 0}, 'id': 2}
+    """
+
+    def __init__(self, client: Client) -> None:
+        """Init an empty batch."""
+        super().__init__(client)
+        self._provider = client._provider  # pylint: disable=protected-access
+
+    def __enter__(self) -> RequestBatch:
+        """Use as a context manager. The batch is executed on exit."""
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb):
+        """Execute the batch unless the block raised."""
+        if exc_type is None:
+            self.execute()
+
+    def execute(self) -> List[types.RPCResponse]:
+        """Send the queued calls and clear the queue.
+
+        Responses are matched to their calls by JSON-RPC id, so they are returned in call order.
+        An error in one call does not affect the others; it shows up as an `"error"` entry in
+        that call's response.
+
+        Returns:
+            One response per queued call. Also stored in `results`.
+        """
+        reqs, self._requests = self._requests, []
+        self.results = self._provider.make_batch_request(reqs)
+        return self.results
+
+
 class Client(_ClientCore):  # pylint: disable=too-many-public-methods
     """Client class.
 
     Args:
-        endpoint: URL of the RPC endpoint.
+        endpoint: URL of the RPC endpoint, or a list of URLs to spread requests over with a `MultiHTTPProvider`.
         commitment: Default bank state to query. It can be either "finalized", "confirmed" or "processed".
         blockhash_cache: (Experimental) If True, keep a cache of recent blockhashes to make
             `send_transaction` calls faster.
@@ -61,19 +117,122 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
             If you want something tailored to your use case, run your own loop that fetches the recent blockhash,
             and pass that value in your `.send_transaction` calls.
         timeout: HTTP request timeout in seconds.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of keep-alive connections per host.
+            Raise this if the client is shared between many threads.
+        trace_hook: (optional) Called with an `RPCTrace` of the method, payload sizes and timings of every request.
+        rate_limit: (optional) A `RateLimit` on all requests. Requests over it wait instead of failing.
+        method_rate_limits: (optional) Additional `RateLimit`s per RPC method, e.g. for `getProgramAccounts`.
+        retry_policy: (optional) A `RetryPolicy` for retrying idempotent requests that failed transiently.
+        response_cache: (optional) A `ResponseCache` that read-only requests are answered from when possible.
 
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
-        endpoint: Optional[str] = None,
+        endpoint: Union[str, Sequence[str], None] = None,
         commitment: Optional[Commitment] = None,
         blockhash_cache: Union[BlockhashCache, bool] = False,
         timeout: float = 10,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        trace_hook: Optional[TraceHook] = None,
+        rate_limit: Optional[RateLimit] = None,
+        method_rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         """Init API client."""
         super().__init__(commitment, blockhash_cache)
-        self._provider = http.HTTPProvider(endpoint, timeout=timeout)
+        self._provider: Union[http.HTTPProvider, multi_http.MultiHTTPProvider]
+        if endpoint is None or isinstance(endpoint, str):
+            self._provider = http.HTTPProvider(
+                endpoint,
+                timeout=timeout,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                trace_hook=trace_hook,
+                rate_limit=rate_limit,
+                method_rate_limits=method_rate_limits,
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+            )
+        else:
+            self._provider = multi_http.MultiHTTPProvider(
+                endpoint,
+                timeout=timeout,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                trace_hook=trace_hook,
+                rate_limit=rate_limit,
+                method_rate_limits=method_rate_limits,
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+            )
+        self._blockhash_refresher: Optional[threading.Thread] = None
+        self._blockhash_refresher_stop = threading.Event()
+
+    def __enter__(self) -> "Client":
+        """Use as a context manager."""
+        return self
+
+    def __exit__(self, _exc_type, _exc, _tb):
+        """Exits the context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Use this when you are done with the client."""
+        self.stop_blockhash_refresher()
+        self._provider.close()
+
+    def start_blockhash_refresher(self, interval: float = BLOCKHASH_REFRESH_SECONDS) -> None:
+        """Keep the blockhash cache filled from a background thread.
+
+        The cache is filled once before this method returns and then refreshed every `interval` seconds.
+        While the refresher runs, `send_transaction` takes its blockhash from the cache and no longer
+        fetches a new one after sending. If the client was created without a blockhash cache, a default
+        `BlockhashCache` is attached.
+
+        Args:
+            interval: Seconds between `getLatestBlockhash` calls. Keep this well below the cache's `ttl`.
+        """
+        if self._blockhash_refresher is not None:
+            return
+        if not self.blockhash_cache:
+            self.blockhash_cache = BlockhashCache()
+        self.__refresh_blockhash()
+        self._blockhash_refresher_stop.clear()
+        self._blockhash_refresher = threading.Thread(
+            target=self.__run_blockhash_refresher, args=(interval,), name="BlockhashRefresher", daemon=True
+        )
+        self._blockhash_refresher.start()
+
+    def stop_blockhash_refresher(self) -> None:
+        """Stop the background blockhash refresher, if running."""
+        if self._blockhash_refresher is None:
+            return
+        self._blockhash_refresher_stop.set()
+        self._blockhash_refresher.join()
+        self._blockhash_refresher = None
+
+    def __refresh_blockhash(self) -> None:
+        blockhash_resp = self.get_latest_blockhash(Finalized)
+        self._process_blockhash_resp(blockhash_resp, used_immediately=False)
+
+    def __run_blockhash_refresher(self, interval: float) -> None:
+        while not self._blockhash_refresher_stop.wait(interval):
+            try:
+                self.__refresh_blockhash()
+            except Exception as err:  # pylint: disable=broad-except
+                self._provider.logger.warning("Failed to refresh blockhash cache: %s", err)
+
+    def batch(self) -> RequestBatch:
+        """Start a batch of RPC calls to be sent in a single HTTP request.
+
+        Returns:
+            An empty `RequestBatch`.
+        """
+        return RequestBatch(self)
 
     def is_connected(self) -> bool:
         """Health check.
@@ -385,6 +544,30 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
         args = self._get_block_args(slot, encoding)
         return self._provider.make_request(*args)
 
+    def iter_block_transactions(self, slot: int, encoding: str = "json") -> Iterator[Dict[str, Any]]:
+        """Stream the transactions of a confirmed block, one at a time.
+
+        Unlike `get_block`, the response is parsed incrementally as it arrives, so memory use stays
+        bounded by the largest transaction rather than the size of the whole block. Block metadata
+        such as `blockhash` and `parentSlot` is not returned.
+
+        Args:
+            slot: Slot, as u64 integer.
+            encoding: (optional) Encoding for the returned Transaction, either "json", "jsonParsed",
+                "base58" (slow), or "base64". If parameter not provided, the default encoding is JSON.
+
+        Example:
+            >>> solana_client = Client("http://localhost:8899")
+            >>> for txn in solana_client.iter_block_transactions(1): # doctest: +SKIP
+            ...     print(txn["meta"]["fee"])
+            5000
+
+        Yields:
+            The block's transactions. Raises `RPCException` after the stream ends if the node returned an error.
+        """
+        args = self._get_block_args(slot, encoding)
+        return self.__iter_result_array(args, ("result", "transactions"))
+
     def get_block_height(self, commitment: Optional[Commitment] = None) -> types.RPCResponse:
         """Returns the current block height of the node.
 
@@ -918,6 +1101,53 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
         )
         return self._provider.make_request(*args)
 
+    def get_multiple_accounts_chunked(  # pylint: disable=too-many-arguments
+        self,
+        pubkeys: List[Union[PublicKey, str]],
+        commitment: Optional[Commitment] = None,
+        encoding: str = "base64",
+        data_slice: Optional[types.DataSliceOpts] = None,
+        chunk_size: int = MAX_MULTIPLE_ACCOUNTS,
+        max_concurrency: int = 4,
+    ) -> types.RPCResponse:
+        """Returns the account info for any number of public keys.
+
+        The pubkeys are split into chunks of at most `chunk_size` (the RPC node rejects more than
+        100 keys per request), the chunks are requested concurrently and the results are merged back
+        into a single response in the same order as `pubkeys`.
+
+        Args:
+            pubkeys: list of Pubkeys to query, as base-58 encoded string or PublicKey object.
+            commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
+            encoding: (optional) Encoding for Account data, either "base58" (slow), "base64", or
+                "jsonParsed". Default is "base64".
+            data_slice: (optional) Option to limit the returned account data using the provided `offset`: <usize> and
+                `length`: <usize> fields; only available for "base58" or "base64" encoding.
+            chunk_size: Number of pubkeys per request, at most 100.
+            max_concurrency: Maximum number of chunk requests in flight at once.
+
+        Returns:
+            A `getMultipleAccounts`-shaped response. Since the chunks may be served from different slots,
+            the context slot is the lowest one among them.
+
+        Raises:
+            RPCException: if any chunk request returns an error.
+
+        Example:
+            >>> from solana.publickey import PublicKey
+            >>> solana_client = Client("http://localhost:8899")
+            >>> pubkeys = [PublicKey(i) for i in range(250)]
+            >>> len(solana_client.get_multiple_accounts_chunked(pubkeys)["result"]["value"]) # doctest: +SKIP
+            250
+        """
+        chunk_args = self._get_multiple_accounts_chunked_args(pubkeys, commitment, encoding, data_slice, chunk_size)
+        if len(chunk_args) <= 1 or max_concurrency <= 1:
+            resps = [self._provider.make_request(*args) for args in chunk_args]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunk_args))) as executor:
+                resps = list(executor.map(lambda args: self._provider.make_request(*args), chunk_args))
+        return self._merge_multiple_accounts_resps(resps)
+
     def get_program_accounts(  # pylint: disable=too-many-arguments
         self,
         pubkey: Union[str, PublicKey],
@@ -966,6 +1196,49 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
         )
         return self._provider.make_request(*args)
 
+    def iter_program_accounts(  # pylint: disable=too-many-arguments
+        self,
+        pubkey: Union[str, PublicKey],
+        commitment: Optional[Commitment] = Finalized,
+        encoding: Optional[str] = None,
+        data_slice: Optional[types.DataSliceOpts] = None,
+        data_size: Optional[int] = None,
+        memcmp_opts: Optional[List[types.MemcmpOpts]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the accounts owned by the provided program Pubkey, one at a time.
+
+        Unlike `get_program_accounts`, the response is parsed incrementally as it arrives, so memory use
+        stays bounded by the largest account rather than the size of the whole result.
+
+        Args:
+            pubkey: Pubkey of program, as base-58 encoded string or PublicKey object.
+            commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
+            encoding: (optional) Encoding for the returned Transaction, either jsonParsed",
+                "base58" (slow), or "base64". If parameter not provided, the default encoding is JSON.
+            data_slice: (optional) Limit the returned account data using the provided `offset`: <usize> and
+            `   length`: <usize> fields; only available for "base58" or "base64" encoding.
+            data_size: (optional) Option to compare the program account data length with the provided data size.
+            memcmp_opts: (optional) Options to compare a provided series of bytes with program account data at a particular offset.
+
+        Example:
+            >>> solana_client = Client("http://localhost:8899")
+            >>> for keyed_account in solana_client.iter_program_accounts("4Nd1mBQtrMJVYVfKf2PJy9NZUZdTAsp7D4xWLs4gDB4T", encoding="base64"): # doctest: +SKIP
+            ...     print(keyed_account["pubkey"])
+            CxELquR1gPP8wHe33gZ4QxqGB3sZ9RSwsJ2KshVewkFY
+
+        Yields:
+            `{"pubkey": ..., "account": ...}` entries. Raises `RPCException` after the stream ends if the node returned an error.
+        """  # noqa: E501 # pylint: disable=line-too-long
+        args = self._get_program_accounts_args(
+            pubkey=pubkey,
+            commitment=commitment,
+            encoding=encoding,
+            data_slice=data_slice,
+            data_size=data_size,
+            memcmp_opts=memcmp_opts,
+        )
+        return self.__iter_result_array(args, ("result",))
+
     def get_recent_blockhash(self, commitment: Optional[Commitment] = None) -> types.RPCResponse:
         """Returns a recent block hash from the ledger.
 
@@ -1364,7 +1637,7 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
         if recent_blockhash is None:
             if self.blockhash_cache:
                 try:
-                    recent_blockhash = self.blockhash_cache.get()
+                    recent_blockhash, _, last_valid_block_height = self.blockhash_cache.get_entry()
                 except ValueError:
                     blockhash_resp = self.get_latest_blockhash(Finalized)
                     recent_blockhash = self._process_blockhash_resp(blockhash_resp, used_immediately=True)
@@ -1385,7 +1658,7 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
         )
 
         txn_resp = self.send_raw_transaction(txn.serialize(), opts=opts_to_use)
-        if self.blockhash_cache:
+        if self.blockhash_cache and self._blockhash_refresher is None:
             blockhash_resp = self.get_latest_blockhash(Finalized)
             self._process_blockhash_resp(blockhash_resp, used_immediately=False)
         return txn_resp
@@ -1513,3 +1786,82 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
                     raise RPCException(maybe_rpc_error)
                 raise UnconfirmedTxError(f"Unable to confirm transaction {tx_sig}")
             return resp
+
+    def confirm_transaction_subscribe(
+        self,
+        tx_sig: str,
+        commitment: Optional[Commitment] = None,
+        sleep_seconds: float = 0.5,
+        last_valid_block_height: Optional[int] = None,
+        ws_endpoint: Optional[str] = None,
+    ) -> types.RPCResponse:
+        """Confirm a transaction by waiting for a `signatureSubscribe` notification instead of polling.
+
+        The method subscribes to the signature over the node's websocket endpoint and returns as soon
+        as the notification arrives. If the websocket connection cannot be established or drops before
+        the notification, it falls back to polling with `confirm_transaction`.
+
+        Args:
+            tx_sig: the transaction signature to confirm.
+            commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
+            sleep_seconds: The number of seconds to sleep when falling back to polling.
+            last_valid_block_height: The block height by which the transaction would become invalid.
+            ws_endpoint: (optional) Websocket endpoint of the RPC node. Defaults to the HTTP endpoint
+                with a `ws(s)://` scheme and, if it has one, the port bumped by one.
+
+        Returns:
+            A response shaped like `get_signature_statuses` for the transaction.
+
+        Note:
+            This runs its own event loop, so it cannot be called from inside a running one.
+            Use `AsyncClient.confirm_transaction_subscribe` there instead.
+        """
+        commitment_to_use = self._commitment if commitment is None else commitment
+        ws_uri = ws_endpoint or self._default_ws_endpoint(self._provider.endpoint_uri)
+        try:
+            return asyncio.run(
+                self.__await_signature_notification(tx_sig, commitment_to_use, last_valid_block_height, ws_uri)
+            )
+        except (WebSocketException, OSError) as err:
+            self._provider.logger.warning("Signature subscription failed, falling back to polling: %s", err)
+            return self.confirm_transaction(tx_sig, commitment, sleep_seconds, last_valid_block_height)
+
+    def __iter_result_array(self, args: Tuple[Any, ...], path: Tuple[str, ...]) -> Iterator[Dict[str, Any]]:
+        stream = JsonArrayStream(path)
+        for chunk in self._provider.stream_request(*args):
+            yield from stream.feed(chunk)
+        self._check_stream_envelope(stream.close())
+
+    async def __await_signature_notification(
+        self, tx_sig: str, commitment: Commitment, last_valid_block_height: Optional[int], ws_endpoint: str
+    ) -> types.RPCResponse:
+        # Imported here so that plain HTTP usage does not pull in the websocket parsing stack.
+        from .responses import SignatureNotification  # pylint: disable=import-outside-toplevel
+        from .websocket_api import SolanaWsClientProtocol, connect  # pylint: disable=import-outside-toplevel
+
+        async with connect(ws_endpoint) as connection:
+            websocket = cast(SolanaWsClientProtocol, connection)
+            await websocket.signature_subscribe(TransactionSignature(tx_sig), commitment)
+            await websocket.recv()
+            # The transaction may have landed before the subscription was registered.
+            resp = self.get_signature_statuses([tx_sig])
+            if self._signature_status_reached(resp, commitment):
+                return resp
+            timeout = time() + 30
+            while True:
+                try:
+                    msg = await asyncio.wait_for(websocket.recv(), SUBSCRIPTION_CHECK_SECONDS)
+                except asyncio.TimeoutError:
+                    if last_valid_block_height:
+                        current_blockheight = (self.get_block_height(commitment))["result"]
+                        if current_blockheight > last_valid_block_height:
+                            raise TransactionExpiredBlockheightExceededError(  # pylint: disable=raise-missing-from
+                                f"{tx_sig} has expired: block height exceeded"
+                            )
+                    elif time() > timeout:
+                        raise UnconfirmedTxError(  # pylint: disable=raise-missing-from
+                            f"Unable to confirm transaction {tx_sig}"
+                        )
+                    continue
+                if isinstance(msg, SignatureNotification):
+                    return self._signature_notification_resp(msg, commitment)
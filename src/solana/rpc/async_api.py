@@ -1,31 +1,88 @@
 """Async API client to interact with the Solana JSON RPC Endpoint."""  # pylint: disable=too-many-lines
 import asyncio
 from time import time
-from typing import List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union, cast
+
+from websockets.exceptions import WebSocketException
 
 from solana.blockhash import Blockhash, BlockhashCache
 from solana.keypair import Keypair
 from solana.message import Message
 from solana.publickey import PublicKey
 from solana.rpc import types
-from solana.transaction import Transaction
+from solana.transaction import Transaction, TransactionSignature
 
+from ._utils.json_stream import JsonArrayStream
 from .commitment import COMMITMENT_RANKS, Commitment, Finalized
 from .core import (
+    BLOCKHASH_REFRESH_SECONDS,
+    MAX_MULTIPLE_ACCOUNTS,
+    SUBSCRIPTION_CHECK_SECONDS,
+    RPCBroadcastException,
     RPCException,
     TransactionExpiredBlockheightExceededError,
     TransactionUncompiledError,
     UnconfirmedTxError,
     _ClientCore,
+    _RequestBatchCore,
 )
-from .providers import async_http
+from .providers import async_http, async_multi_http
+from .providers.cache import ResponseCache
+from .providers.core import TraceHook
+from .providers.rate_limit import RateLimit
+from .providers.retry import RetryPolicy
+
+
+class AsyncRequestBatch(_RequestBatchCore):
+    """Batch of RPC calls sent in a single HTTP request. Create one with `AsyncClient.batch`.
+
+    Example:
+        >>> from solana.publickey import PublicKey
+        >>> async def main():
+        ...     async with AsyncClient("http://localhost:8899") as client:
+        ...         async with client.batch() as batch:
+        ...             first = batch.get_balance(PublicKey(1))
+        ...             second = batch.get_balance(PublicKey(2))
+        ...         return batch.results[second]
+        >>> asyncio.run(main()) # doctest: +SKIP
+        {'jsonrpc': '2.0', 'result': {'context': {'slot': 228}, 'value': 0}, 'id': 2}
+    """
+
+    def __init__(self, client: "AsyncClient") -> None:
+        """Init an empty batch."""
+        super().__init__(client)
+        self._provider = client._provider  # pylint: disable=protected-access
+
+    async def __aenter__(self) -> "AsyncRequestBatch":
+        """Use as a context manager. The batch is executed on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, _exc, _tb):
+        """Execute the batch unless the block raised."""
+        if exc_type is None:
+            await self.execute()
+
+    async def execute(self) -> List[types.RPCResponse]:
+        """Send the queued calls and clear the queue.
+
+        Responses are matched to their calls by JSON-RPC id, so they are returned in call order.
+        An error in one call does not affect the others; it shows up as an `"error"` entry in
+        that call's response.
+
+        Returns:
+            One response per queued call. Also stored in `results`.
+        """
+        reqs, self._requests = self._requests, []
+        self.results = await self._provider.make_batch_request(reqs)
+        return self.results
 
 
 class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
     """Async client class.
 
     Args:
-        endpoint: URL of the RPC endpoint.
+        endpoint: URL of the RPC endpoint, or a list of URLs to spread requests over with an
+            `AsyncMultiHTTPProvider`.
         commitment: Default bank state to query. It can be either "finalized", "confirmed" or "processed".
         blockhash_cache: (Experimental) If True, keep a cache of recent blockhashes to make
             `send_transaction` calls faster.
@@ -44,18 +101,73 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
             If you want something tailored to your use case, run your own loop that fetches the recent blockhash,
             and pass that value in your `.send_transaction` calls.
         timeout: HTTP request timeout in seconds.
+        trace_hook: (optional) Called with an `RPCTrace` of the method, payload sizes and timings of every request.
+        rate_limit: (optional) A `RateLimit` on all requests. Requests over it wait instead of failing.
+        method_rate_limits: (optional) Additional `RateLimit`s per RPC method, e.g. for `getProgramAccounts`.
+        retry_policy: (optional) A `RetryPolicy` for retrying idempotent requests that failed transiently.
+        response_cache: (optional) A `ResponseCache` that read-only requests are answered from when possible.
+        broadcast_endpoints: (optional) URLs of further RPC endpoints that `broadcast_raw_transaction`
+            sends transactions to, in addition to `endpoint`.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
-        endpoint: Optional[str] = None,
+        endpoint: Union[str, Sequence[str], None] = None,
         commitment: Optional[Commitment] = None,
         blockhash_cache: Union[BlockhashCache, bool] = False,
         timeout: float = 10,
+        trace_hook: Optional[TraceHook] = None,
+        rate_limit: Optional[RateLimit] = None,
+        method_rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        broadcast_endpoints: Optional[Sequence[str]] = None,
     ) -> None:
         """Init API client."""
         super().__init__(commitment, blockhash_cache)
-        self._provider = async_http.AsyncHTTPProvider(endpoint, timeout=timeout)
+        self._provider: Union[async_http.AsyncHTTPProvider, async_multi_http.AsyncMultiHTTPProvider]
+        if endpoint is None or isinstance(endpoint, str):
+            self._provider = async_http.AsyncHTTPProvider(
+                endpoint,
+                timeout=timeout,
+                trace_hook=trace_hook,
+                rate_limit=rate_limit,
+                method_rate_limits=method_rate_limits,
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+            )
+        else:
+            self._provider = async_multi_http.AsyncMultiHTTPProvider(
+                endpoint,
+                timeout=timeout,
+                trace_hook=trace_hook,
+                rate_limit=rate_limit,
+                method_rate_limits=method_rate_limits,
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+            )
+        own_providers = (
+            self._provider.providers
+            if isinstance(self._provider, async_multi_http.AsyncMultiHTTPProvider)
+            else [self._provider]
+        )
+        own_endpoints = {provider.endpoint_uri for provider in own_providers}
+        self._broadcast_providers = [
+            async_http.AsyncHTTPProvider(
+                broadcast_endpoint,
+                timeout=timeout,
+                trace_hook=trace_hook,
+                rate_limit=rate_limit,
+                method_rate_limits=method_rate_limits,
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+            )
+            for broadcast_endpoint in dict.fromkeys(broadcast_endpoints or ())
+            if broadcast_endpoint not in own_endpoints
+        ]
+        self._broadcast_targets = own_providers + self._broadcast_providers
+        self._broadcast_stragglers: Set["asyncio.Task[types.RPCResponse]"] = set()
+        self._blockhash_refresher: Optional["asyncio.Task[None]"] = None
 
     async def __aenter__(self) -> "AsyncClient":
         """Use as a context manager."""
@@ -68,7 +180,64 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
 
     async def close(self) -> None:
         """Use this when you are done with the client."""
+        await self.stop_blockhash_refresher()
+        for task in self._broadcast_stragglers:
+            task.cancel()
+        await asyncio.gather(*self._broadcast_stragglers, return_exceptions=True)
         await self._provider.close()
+        await asyncio.gather(*(provider.close() for provider in self._broadcast_providers))
+
+    async def start_blockhash_refresher(self, interval: float = BLOCKHASH_REFRESH_SECONDS) -> None:
+        """Keep the blockhash cache filled from a background task.
+
+        The cache is filled once before this method returns and then refreshed every `interval` seconds.
+        While the refresher runs, `send_transaction` takes its blockhash from the cache and no longer
+        fetches a new one after sending. If the client was created without a blockhash cache, a default
+        `BlockhashCache` is attached.
+
+        Args:
+            interval: Seconds between `getLatestBlockhash` calls. Keep this well below the cache's `ttl`.
+        """
+        if self._blockhash_refresher is not None:
+            return
+        if not self.blockhash_cache:
+            self.blockhash_cache = BlockhashCache()
+        await self.__refresh_blockhash()
+        self._blockhash_refresher = asyncio.get_running_loop().create_task(self.__run_blockhash_refresher(interval))
+
+    async def stop_blockhash_refresher(self) -> None:
+        """Stop the background blockhash refresher, if running."""
+        if self._blockhash_refresher is None:
+            return
+        self._blockhash_refresher.cancel()
+        try:
+            await self._blockhash_refresher
+        except asyncio.CancelledError:
+            pass
+        self._blockhash_refresher = None
+
+    async def __refresh_blockhash(self) -> None:
+        blockhash_resp = await self.get_latest_blockhash(Finalized)
+        self._process_blockhash_resp(blockhash_resp, used_immediately=False)
+
+    async def __run_blockhash_refresher(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.__refresh_blockhash()
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                # An Exception subclass before Python 3.8; `stop_blockhash_refresher` must not be swallowed.
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                self._provider.logger.warning("Failed to refresh blockhash cache: %s", err)
+
+    def batch(self) -> AsyncRequestBatch:
+        """Start a batch of RPC calls to be sent in a single HTTP request.
+
+        Returns:
+            An empty `AsyncRequestBatch`.
+        """
+        return AsyncRequestBatch(self)
 
     async def is_connected(self) -> bool:
         """Health check.
@@ -381,6 +550,31 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
         args = self._get_block_args(slot, encoding)
         return await self._provider.make_request(*args)
 
+    async def iter_block_transactions(self, slot: int, encoding: str = "json") -> AsyncIterator[Dict[str, Any]]:
+        """Stream the transactions of a confirmed block, one at a time.
+
+        Unlike `get_block`, the response is parsed incrementally as it arrives, so memory use stays
+        bounded by the largest transaction rather than the size of the whole block. Block metadata
+        such as `blockhash` and `parentSlot` is not returned.
+
+        Args:
+            slot: Slot, as u64 integer.
+            encoding: (optional) Encoding for the returned Transaction, either "json", "jsonParsed",
+                "base58" (slow), or "base64". If parameter not provided, the default encoding is JSON.
+
+        Example:
+            >>> solana_client = AsyncClient("http://localhost:8899")
+            >>> async for txn in solana_client.iter_block_transactions(1): # doctest: +SKIP
+            ...     print(txn["meta"]["fee"])
+            5000
+
+        Yields:
+            The block's transactions. Raises `RPCException` after the stream ends if the node returned an error.
+        """
+        args = self._get_block_args(slot, encoding)
+        async for txn in self.__iter_result_array(args, ("result", "transactions")):
+            yield txn
+
     async def get_block_height(self, commitment: Optional[Commitment] = None) -> types.RPCResponse:
         """Returns the current block height of the node.
 
@@ -914,6 +1108,56 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
         )
         return await self._provider.make_request(*args)
 
+    async def get_multiple_accounts_chunked(  # pylint: disable=too-many-arguments
+        self,
+        pubkeys: List[Union[PublicKey, str]],
+        commitment: Optional[Commitment] = None,
+        encoding: str = "base64",
+        data_slice: Optional[types.DataSliceOpts] = None,
+        chunk_size: int = MAX_MULTIPLE_ACCOUNTS,
+        max_concurrency: int = 4,
+    ) -> types.RPCResponse:
+        """Returns the account info for any number of public keys.
+
+        The pubkeys are split into chunks of at most `chunk_size` (the RPC node rejects more than
+        100 keys per request), the chunks are requested concurrently and the results are merged back
+        into a single response in the same order as `pubkeys`.
+
+        Args:
+            pubkeys: list of Pubkeys to query, as base-58 encoded string or PublicKey object.
+            commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
+            encoding: (optional) Encoding for Account data, either "base58" (slow), "base64", or
+                "jsonParsed". Default is "base64".
+            data_slice: (optional) Option to limit the returned account data using the provided `offset`: <usize> and
+                `length`: <usize> fields; only available for "base58" or "base64" encoding.
+            chunk_size: Number of pubkeys per request, at most 100.
+            max_concurrency: Maximum number of chunk requests in flight at once.
+
+        Returns:
+            A `getMultipleAccounts`-shaped response. Since the chunks may be served from different slots,
+            the context slot is the lowest one among them.
+
+        Raises:
+            RPCException: if any chunk request returns an error.
+
+        Example:
+            >>> from solana.publickey import PublicKey
+            >>> solana_client = AsyncClient("http://localhost:8899")
+            >>> pubkeys = [PublicKey(i) for i in range(250)]
+            >>> resp = asyncio.run(solana_client.get_multiple_accounts_chunked(pubkeys)) # doctest: +SKIP
+            >>> len(resp["result"]["value"]) # doctest: +SKIP
+            250
+        """
+        chunk_args = self._get_multiple_accounts_chunked_args(pubkeys, commitment, encoding, data_slice, chunk_size)
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def fetch(args) -> types.RPCResponse:
+            async with semaphore:
+                return await self._provider.make_request(*args)
+
+        resps = await asyncio.gather(*(fetch(args) for args in chunk_args))
+        return self._merge_multiple_accounts_resps(list(resps))
+
     async def get_program_accounts(  # pylint: disable=too-many-arguments
         self,
         pubkey: Union[str, PublicKey],
@@ -962,6 +1206,50 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
         )
         return await self._provider.make_request(*args)
 
+    async def iter_program_accounts(  # pylint: disable=too-many-arguments
+        self,
+        pubkey: Union[str, PublicKey],
+        commitment: Optional[Commitment] = Finalized,
+        encoding: Optional[str] = None,
+        data_slice: Optional[types.DataSliceOpts] = None,
+        data_size: Optional[int] = None,
+        memcmp_opts: Optional[List[types.MemcmpOpts]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the accounts owned by the provided program Pubkey, one at a time.
+
+        Unlike `get_program_accounts`, the response is parsed incrementally as it arrives, so memory use
+        stays bounded by the largest account rather than the size of the whole result.
+
+        Args:
+            pubkey: Pubkey of program, as base-58 encoded string or PublicKey object.
+            commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
+            encoding: (optional) Encoding for the returned Transaction, either jsonParsed",
+                "base58" (slow), or "base64". If parameter not provided, the default encoding is JSON.
+            data_slice: (optional) Limit the returned account data using the provided `offset`: <usize> and
+            `   length`: <usize> fields; only available for "base58" or "base64" encoding.
+            data_size: (optional) Option to compare the program account data length with the provided data size.
+            memcmp_opts: (optional) Options to compare a provided series of bytes with program account data at a particular offset.
+
+        Example:
+            >>> solana_client = AsyncClient("http://localhost:8899")
+            >>> async for keyed_account in solana_client.iter_program_accounts("4Nd1mBQtrMJVYVfKf2PJy9NZUZdTAsp7D4xWLs4gDB4T", encoding="base64"): # doctest: +SKIP
+            ...     print(keyed_account["pubkey"])
+            CxELquR1gPP8wHe33gZ4QxqGB3sZ9RSwsJ2KshVewkFY
+
+        Yields:
+            `{"pubkey": ..., "account": ...}` entries. Raises `RPCException` after the stream ends if the node returned an error.
+        """  # noqa: E501 # pylint: disable=line-too-long
+        args = self._get_program_accounts_args(
+            pubkey=pubkey,
+            commitment=commitment,
+            encoding=encoding,
+            data_slice=data_slice,
+            data_size=data_size,
+            memcmp_opts=memcmp_opts,
+        )
+        async for keyed_account in self.__iter_result_array(args, ("result",)):
+            yield keyed_account
+
     async def get_recent_blockhash(self, commitment: Optional[Commitment] = None) -> types.RPCResponse:
         """Returns a recent block hash from the ledger.
 
@@ -1329,6 +1617,70 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
         post_send_args = self._send_raw_transaction_post_send_args(resp, opts_to_use)
         return await self.__post_send_with_confirm(*post_send_args)
 
+    async def broadcast_raw_transaction(
+        self, txn: Union[bytes, str], opts: Optional[types.TxOpts] = None
+    ) -> types.RPCResponse:
+        """Send a signed transaction to every endpoint at once and return the first successful response.
+
+        The same wire bytes go to `endpoint` (every one of them, if it is a list) and to `broadcast_endpoints`,
+        which improves the chance and speed of the transaction landing. Signatures are deterministic, so every
+        node that accepts it returns the same signature: once one has, the remaining sends keep running in the
+        background and their duplicate responses are dropped.
+
+        Args:
+            txn: A fully signed transaction in wire format, or as a base-64 encoded string.
+            opts: (optional) Transaction options.
+
+        Returns:
+            The first successful response. Raises `RPCBroadcastException` with the error of each endpoint
+            if every one of them failed.
+
+        Example:
+            >>> solana_client = AsyncClient("http://localhost:8899", broadcast_endpoints=["http://localhost:8900"])
+            >>> asyncio.run(solana_client.broadcast_raw_transaction(wire_tx))  # doctest: +SKIP
+            {'jsonrpc': '2.0',
+             'result': 'CMwyESM2NE74mghfbvsHJDERF7xMYKshwwm6VgH6GFqXzx8LfBFuP5ruccumfhTguha6seUHPpiHzzHUQXzq2kN',
+             'id': 1}
+        """
+        opts_to_use = types.TxOpts(preflight_commitment=self._commitment) if opts is None else opts
+        args = self._send_raw_transaction_args(txn, opts_to_use)
+
+        async def send(provider: async_http.AsyncHTTPProvider) -> types.RPCResponse:
+            return self._post_send(await provider.make_request(*args))
+
+        pending = {asyncio.ensure_future(send(provider)): provider for provider in self._broadcast_targets}
+        errors: Dict[str, Exception] = {}
+        resp: Optional[types.RPCResponse] = None
+        while pending and resp is None:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                endpoint = pending.pop(task).endpoint_uri
+                if task.cancelled():
+                    errors[endpoint] = RPCException(f"Broadcast to {endpoint} was cancelled")
+                    continue
+                error = task.exception()
+                if error is None:
+                    resp = resp or task.result()
+                elif isinstance(error, Exception):
+                    errors[endpoint] = error
+        if resp is None:
+            raise RPCBroadcastException(errors)
+        for task in pending:
+            self._broadcast_stragglers.add(task)
+            task.add_done_callback(self.__drop_broadcast_straggler)
+        if opts_to_use.skip_confirmation:
+            return resp
+        post_send_args = self._send_raw_transaction_post_send_args(resp, opts_to_use)
+        return await self.__post_send_with_confirm(*post_send_args)
+
+    def __drop_broadcast_straggler(self, task: "asyncio.Task[types.RPCResponse]") -> None:
+        self._broadcast_stragglers.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._provider.logger.debug("Broadcast to a further endpoint failed: %s", error)
+
     async def send_transaction(
         self,
         txn: Transaction,
@@ -1362,7 +1714,7 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
         if recent_blockhash is None:
             if self.blockhash_cache:
                 try:
-                    recent_blockhash = self.blockhash_cache.get()
+                    recent_blockhash, _, last_valid_block_height = self.blockhash_cache.get_entry()
                 except ValueError:
                     blockhash_resp = await self.get_latest_blockhash(Finalized)
                     recent_blockhash = self._process_blockhash_resp(blockhash_resp, used_immediately=True)
@@ -1381,7 +1733,7 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
             else opts
         )
         txn_resp = await self.send_raw_transaction(txn.serialize(), opts=opts_to_use)
-        if self.blockhash_cache:
+        if self.blockhash_cache and self._blockhash_refresher is None:
             blockhash_resp = await self.get_latest_blockhash(Finalized)
             self._process_blockhash_resp(blockhash_resp, used_immediately=False)
         return txn_resp
@@ -1509,3 +1861,77 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
                     raise RPCException(maybe_rpc_error)
                 raise UnconfirmedTxError(f"Unable to confirm transaction {tx_sig}")
             return resp
+
+    async def confirm_transaction_subscribe(
+        self,
+        tx_sig: str,
+        commitment: Optional[Commitment] = None,
+        sleep_seconds: float = 0.5,
+        last_valid_block_height: Optional[int] = None,
+        ws_endpoint: Optional[str] = None,
+    ) -> types.RPCResponse:
+        """Confirm a transaction by waiting for a `signatureSubscribe` notification instead of polling.
+
+        The method subscribes to the signature over the node's websocket endpoint and returns as soon
+        as the notification arrives. If the websocket connection cannot be established or drops before
+        the notification, it falls back to polling with `confirm_transaction`.
+
+        Args:
+            tx_sig: the transaction signature to confirm.
+            commitment: Bank state to query. It can be either "finalized", "confirmed" or "processed".
+            sleep_seconds: The number of seconds to sleep when falling back to polling.
+            last_valid_block_height: The block height by which the transaction would become invalid.
+            ws_endpoint: (optional) Websocket endpoint of the RPC node. Defaults to the HTTP endpoint
+                with a `ws(s)://` scheme and, if it has one, the port bumped by one.
+
+        Returns:
+            A response shaped like `get_signature_statuses` for the transaction.
+        """
+        commitment_to_use = self._commitment if commitment is None else commitment
+        ws_uri = ws_endpoint or self._default_ws_endpoint(self._provider.endpoint_uri)
+        try:
+            return await self.__await_signature_notification(tx_sig, commitment_to_use, last_valid_block_height, ws_uri)
+        except (WebSocketException, OSError) as err:
+            self._provider.logger.warning("Signature subscription failed, falling back to polling: %s", err)
+            return await self.confirm_transaction(tx_sig, commitment, sleep_seconds, last_valid_block_height)
+
+    async def __iter_result_array(self, args: Tuple[Any, ...], path: Tuple[str, ...]) -> AsyncIterator[Dict[str, Any]]:
+        stream = JsonArrayStream(path)
+        async for chunk in self._provider.stream_request(*args):
+            for item in stream.feed(chunk):
+                yield item
+        self._check_stream_envelope(stream.close())
+
+    async def __await_signature_notification(
+        self, tx_sig: str, commitment: Commitment, last_valid_block_height: Optional[int], ws_endpoint: str
+    ) -> types.RPCResponse:
+        # Imported here so that plain HTTP usage does not pull in the websocket parsing stack.
+        from .responses import SignatureNotification  # pylint: disable=import-outside-toplevel
+        from .websocket_api import SolanaWsClientProtocol, connect  # pylint: disable=import-outside-toplevel
+
+        async with connect(ws_endpoint) as connection:
+            websocket = cast(SolanaWsClientProtocol, connection)
+            await websocket.signature_subscribe(TransactionSignature(tx_sig), commitment)
+            await websocket.recv()
+            # The transaction may have landed before the subscription was registered.
+            resp = await self.get_signature_statuses([tx_sig])
+            if self._signature_status_reached(resp, commitment):
+                return resp
+            timeout = time() + 30
+            while True:
+                try:
+                    msg = await asyncio.wait_for(websocket.recv(), SUBSCRIPTION_CHECK_SECONDS)
+                except asyncio.TimeoutError:
+                    if last_valid_block_height:
+                        current_blockheight = (await self.get_block_height(commitment))["result"]
+                        if current_blockheight > last_valid_block_height:
+                            raise TransactionExpiredBlockheightExceededError(  # pylint: disable=raise-missing-from
+                                f"{tx_sig} has expired: block height exceeded"
+                            )
+                    elif time() > timeout:
+                        raise UnconfirmedTxError(  # pylint: disable=raise-missing-from
+                            f"Unable to confirm transaction {tx_sig}"
+                        )
+                    continue
+                if isinstance(msg, SignatureNotification):
+                    return self._signature_notification_resp(msg, commitment)
@@ -0,0 +1,337 @@
+"""Bulk confirmation of many in-flight transactions.
+
+Instead of polling `getSignatureStatuses` once per transaction, the trackers in this module
+collect every pending signature and check them together: each tick sends a single batched HTTP
+request containing one `getSignatureStatuses` call per 256 signatures plus, if needed, one shared
+`getBlockHeight` call for expiry checks.
+
+Example:
+    >>> from solana.rpc.api import Client
+    >>> solana_client = Client("http://localhost:8899")
+    >>> with ConfirmationTracker(solana_client) as tracker:  # doctest: +SKIP
+    ...     futures = [tracker.add(solana_client.send_raw_transaction(tx)["result"]) for tx in signed_txs]
+    ...     statuses = [future.result() for future in futures]
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from solana.rpc import types
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import COMMITMENT_RANKS, Commitment
+from solana.rpc.core import (
+    MAX_SIGNATURE_STATUSES,
+    TransactionExpiredBlockheightExceededError,
+    UnconfirmedTxError,
+    _chunk_bounds,
+    _RequestBatchCore,
+)
+
+_AnyFuture = Union["Future[Dict[str, Any]]", "asyncio.Future[Dict[str, Any]]"]
+
+
+@dataclass
+class _PendingConfirmation:
+    futures: List[Any]
+    last_valid_block_height: Optional[int]
+    deadline: float
+
+
+_Resolution = Tuple[Any, Union[Dict[str, Any], Exception]]
+"""A pending future and the status or error to resolve it with."""
+
+
+class _ConfirmationTrackerCore:  # pylint: disable=too-few-public-methods
+    logger = logging.getLogger("solanaweb3.rpc.confirmation")
+
+    def __init__(self, commitment: Commitment, sleep_seconds: float, timeout: float) -> None:
+        self._commitment = commitment
+        self._commitment_rank = COMMITMENT_RANKS[commitment]
+        self.sleep_seconds = sleep_seconds
+        self.timeout = timeout
+        self._pending: Dict[str, _PendingConfirmation] = {}
+
+    def __len__(self) -> int:
+        """Number of signatures still awaiting confirmation."""
+        return len(self._pending)
+
+    def _track(self, tx_sig: str, future: _AnyFuture, last_valid_block_height: Optional[int]) -> None:
+        pending = self._pending.get(tx_sig)
+        if pending is not None:
+            # The same transaction tracked again, e.g. after a rebroadcast: resolve both futures together.
+            pending.futures.append(future)
+            return
+        self._pending[tx_sig] = _PendingConfirmation(
+            futures=[future], last_valid_block_height=last_valid_block_height, deadline=time() + self.timeout
+        )
+
+    def _queue_requests(self, batch: _RequestBatchCore) -> Tuple[List[Tuple[List[str], int]], Optional[int]]:
+        sigs = list(self._pending)
+        chunks = [sigs[start:end] for start, end in _chunk_bounds(len(sigs), MAX_SIGNATURE_STATUSES)]
+        status_calls = [(chunk, batch.get_signature_statuses(list(chunk))) for chunk in chunks]
+        needs_block_height = any(self._pending[sig].last_valid_block_height for sig in sigs)
+        block_height_call = batch.get_block_height(self._commitment) if needs_block_height else None
+        return status_calls, block_height_call
+
+    def _process_results(
+        self,
+        results: List[types.RPCResponse],
+        status_calls: List[Tuple[List[str], int]],
+        block_height_call: Optional[int],
+    ) -> List[_Resolution]:
+        resolutions: List[_Resolution] = []
+        for chunk, idx in status_calls:
+            resp = results[idx]
+            if resp.get("error") is not None:
+                # Leave the chunk pending; it is retried on the next tick until it expires.
+                self.logger.warning("getSignatureStatuses failed: %s", resp["error"])
+                continue
+            for tx_sig, status in zip(chunk, resp["result"]["value"]):
+                if status is None or COMMITMENT_RANKS[status["confirmationStatus"]] < self._commitment_rank:
+                    continue
+                pending = self._pending.pop(tx_sig, None)
+                if pending is not None:
+                    resolutions += [(future, status) for future in pending.futures]
+        block_height = None
+        if block_height_call is not None:
+            block_height = results[block_height_call].get("result")
+        return resolutions + self._expire(block_height)
+
+    def _expire(self, block_height: Optional[int]) -> List[_Resolution]:
+        resolutions: List[_Resolution] = []
+        now = time()
+        for tx_sig, pending in list(self._pending.items()):
+            err: Optional[Exception] = None
+            if pending.last_valid_block_height:
+                if block_height is not None and block_height > pending.last_valid_block_height:
+                    err = TransactionExpiredBlockheightExceededError(f"{tx_sig} has expired: block height exceeded")
+            elif now > pending.deadline:
+                err = UnconfirmedTxError(f"Unable to confirm transaction {tx_sig}")
+            if err is not None:
+                del self._pending[tx_sig]
+                resolutions += [(future, err) for future in pending.futures]
+        return resolutions
+
+    @staticmethod
+    def _resolve(resolutions: List[_Resolution]) -> None:
+        """Resolve futures. Called without holding any lock, since done-callbacks may call `add`."""
+        for future, outcome in resolutions:
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+class ConfirmationTracker(_ConfirmationTrackerCore):
+    """Confirms many transactions with one batched status request per tick.
+
+    Call `start` (or use the tracker as a context manager) to poll from a background thread,
+    or call `poll` yourself.
+
+    Args:
+        client: The client used to query signature statuses.
+        commitment: Commitment level the transactions must reach. Defaults to the client's commitment.
+        sleep_seconds: Seconds between ticks of the background thread.
+        timeout: Seconds to wait for transactions added without a `last_valid_block_height`.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        commitment: Optional[Commitment] = None,
+        sleep_seconds: float = 0.5,
+        timeout: float = 30,
+    ) -> None:
+        """Init a tracker with no pending signatures."""
+        super().__init__(commitment or client.commitment, sleep_seconds, timeout)
+        self._client = client
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(
+        self,
+        tx_sig: str,
+        last_valid_block_height: Optional[int] = None,
+        callback: Optional[Callable[["Future[Dict[str, Any]]"], None]] = None,
+    ) -> "Future[Dict[str, Any]]":
+        """Start tracking a signature.
+
+        Args:
+            tx_sig: The transaction signature to confirm.
+            last_valid_block_height: The block height by which the transaction would become invalid.
+                Without it, the transaction fails after `timeout` seconds.
+            callback: (optional) Called with the future once it is resolved.
+
+        Returns:
+            A future resolving to the transaction's signature status, or failing with
+            `TransactionExpiredBlockheightExceededError` / `UnconfirmedTxError`. Adding a signature that
+            is already tracked returns a new future that resolves together with the first.
+        """
+        future: "Future[Dict[str, Any]]" = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        with self._lock:
+            self._track(tx_sig, future, last_valid_block_height)
+        return future
+
+    def poll(self) -> None:
+        """Check every pending signature once."""
+        with self._lock:
+            if not self._pending:
+                return
+            batch = self._client.batch()
+            status_calls, block_height_call = self._queue_requests(batch)
+        try:
+            results = batch.execute()
+        except Exception:
+            # The node is unreachable; signatures past their wall-clock deadline still expire.
+            with self._lock:
+                resolutions = self._expire(None)
+            self._resolve(resolutions)
+            raise
+        with self._lock:
+            resolutions = self._process_results(results, status_calls, block_height_call)
+        self._resolve(resolutions)
+
+    def start(self) -> None:
+        """Start polling from a background thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ConfirmationTracker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread. Pending signatures stay tracked."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.sleep_seconds):
+            try:
+                self.poll()
+            except Exception as err:  # pylint: disable=broad-except
+                self.logger.warning("Confirmation tick failed: %s", err)
+
+    def __enter__(self) -> ConfirmationTracker:
+        """Start the background thread."""
+        self.start()
+        return self
+
+    def __exit__(self, _exc_type, _exc, _tb):
+        """Stop the background thread."""
+        self.stop()
+
+
+class AsyncConfirmationTracker(_ConfirmationTrackerCore):
+    """Confirms many transactions with one batched status request per tick.
+
+    Call `start` (or use the tracker as an async context manager) to poll from a background task,
+    or await `poll` yourself.
+
+    Args:
+        client: The client used to query signature statuses.
+        commitment: Commitment level the transactions must reach. Defaults to the client's commitment.
+        sleep_seconds: Seconds between ticks of the background task.
+        timeout: Seconds to wait for transactions added without a `last_valid_block_height`.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        commitment: Optional[Commitment] = None,
+        sleep_seconds: float = 0.5,
+        timeout: float = 30,
+    ) -> None:
+        """Init a tracker with no pending signatures."""
+        super().__init__(commitment or client.commitment, sleep_seconds, timeout)
+        self._client = client
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def add(
+        self,
+        tx_sig: str,
+        last_valid_block_height: Optional[int] = None,
+        callback: Optional[Callable[["asyncio.Future[Dict[str, Any]]"], None]] = None,
+    ) -> "asyncio.Future[Dict[str, Any]]":
+        """Start tracking a signature. Must be called from a running event loop.
+
+        Args:
+            tx_sig: The transaction signature to confirm.
+            last_valid_block_height: The block height by which the transaction would become invalid.
+                Without it, the transaction fails after `timeout` seconds.
+            callback: (optional) Called with the future once it is resolved.
+
+        Returns:
+            A future resolving to the transaction's signature status, or failing with
+            `TransactionExpiredBlockheightExceededError` / `UnconfirmedTxError`. Adding a signature that
+            is already tracked returns a new future that resolves together with the first.
+        """
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self._track(tx_sig, future, last_valid_block_height)
+        return future
+
+    async def poll(self) -> None:
+        """Check every pending signature once."""
+        if not self._pending:
+            return
+        batch = self._client.batch()
+        status_calls, block_height_call = self._queue_requests(batch)
+        try:
+            results = await batch.execute()
+        except Exception:
+            # The node is unreachable; signatures past their wall-clock deadline still expire.
+            self._resolve(self._expire(None))
+            raise
+        self._resolve(self._process_results(results, status_calls, block_height_call))
+
+    def start(self) -> None:
+        """Start polling from a background task."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task. Pending signatures stay tracked."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sleep_seconds)
+            try:
+                await self.poll()
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                # An Exception subclass before Python 3.8; `stop` must not be mistaken for a failed tick.
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                self.logger.warning("Confirmation tick failed: %s", err)
+
+    async def __aenter__(self) -> AsyncConfirmationTracker:
+        """Start the background task."""
+        self.start()
+        return self
+
+    async def __aexit__(self, _exc_type, _exc, _tb):
+        """Stop the background task."""
+        await self.stop()
@@ -1,13 +1,14 @@
 # pylint: disable=too-many-arguments
 """Helper code for api.py and async_api.py."""
 from base64 import b64encode
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 try:
     from typing import Literal  # type: ignore
 except ImportError:
     from typing_extensions import Literal  # type: ignore
 
+from urllib.parse import urlsplit, urlunsplit
 from warnings import warn
 
 from based58 import b58decode, b58encode
@@ -19,7 +20,27 @@ from solana.publickey import PublicKey
 from solana.rpc import types
 from solana.transaction import Transaction
 
-from .commitment import Commitment, Finalized
+from .commitment import COMMITMENT_RANKS, Commitment, Finalized
+
+if TYPE_CHECKING:
+    from .responses import SignatureNotification  # noqa: F401
+
+
+MAX_MULTIPLE_ACCOUNTS = 100
+"""Maximum number of pubkeys the RPC node accepts in a single `getMultipleAccounts` request."""
+
+MAX_SIGNATURE_STATUSES = 256
+"""Maximum number of signatures the RPC node accepts in a single `getSignatureStatuses` request."""
+
+SUBSCRIPTION_CHECK_SECONDS = 2.0
+"""How often a subscription-based confirmation re-checks for expiry while waiting for a notification."""
+
+BLOCKHASH_REFRESH_SECONDS = 5.0
+"""Default interval between `getLatestBlockhash` calls of the background blockhash refresher."""
+
+
+def _chunk_bounds(total: int, chunk_size: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
 
 
 class RPCException(Exception):
@@ -30,6 +51,16 @@ class RPCNoResultException(Exception):
     """Raised when an RPC method returns no result."""
 
 
+class RPCBroadcastException(RPCException):
+    """Raised when a transaction broadcast to several endpoints failed on every one of them."""
+
+    def __init__(self, errors: Dict[str, Exception]) -> None:
+        """Init with the error of each endpoint."""
+        super().__init__(errors)
+        self.errors = errors
+        """The error raised for each endpoint."""
+
+
 class UnconfirmedTxError(Exception):
     """Raise when confirming a transaction times out."""
 
@@ -260,6 +291,35 @@ class _ClientCore:  # pylint: disable=too-few-public-methods
             opts[self._data_slice_key] = dict(data_slice._asdict())
         return types.RPCMethod("getMultipleAccounts"), [str(pubkey) for pubkey in pubkeys], opts
 
+    def _get_multiple_accounts_chunked_args(
+        self,
+        pubkeys: List[Union[PublicKey, str]],
+        commitment: Optional[Commitment],
+        encoding: str,
+        data_slice: Optional[types.DataSliceOpts],
+        chunk_size: int,
+    ) -> List[Tuple[types.RPCMethod, List[str], Dict[str, Any]]]:
+        if not 0 < chunk_size <= MAX_MULTIPLE_ACCOUNTS:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_MULTIPLE_ACCOUNTS}")
+        chunks = [pubkeys[start:end] for start, end in _chunk_bounds(len(pubkeys), chunk_size)]
+        return [self._get_multiple_accounts_args(chunk, commitment, encoding, data_slice) for chunk in chunks]
+
+    @staticmethod
+    def _merge_multiple_accounts_resps(resps: List[types.RPCResponse]) -> types.RPCResponse:
+        values: List[Any] = []
+        slots: List[int] = []
+        for resp in resps:
+            maybe_rpc_error = resp.get("error")
+            if maybe_rpc_error is not None:
+                raise RPCException(maybe_rpc_error)
+            values.extend(resp["result"]["value"])
+            slots.append(resp["result"]["context"]["slot"])
+        return {
+            "jsonrpc": "2.0",
+            "result": {"context": {"slot": min(slots, default=0)}, "value": values},
+            "id": resps[0]["id"] if resps else 0,
+        }
+
     def _get_program_accounts_args(
         self,
         pubkey: Union[str, PublicKey],
@@ -453,6 +513,49 @@ class _ClientCore:  # pylint: disable=too-few-public-methods
             raise RPCNoResultException("Failed to send transaction")
         return resp
 
+    @staticmethod
+    def _default_ws_endpoint(http_endpoint: str) -> str:
+        """Derive the websocket endpoint of an RPC node from its HTTP endpoint.
+
+        Like the Solana CLI, an explicit port is bumped by one (8899 -> 8900).
+        """
+        parts = urlsplit(http_endpoint)
+        scheme = "wss" if parts.scheme == "https" else "ws"
+        netloc = parts.netloc
+        if parts.port is not None:
+            netloc = f"{parts.hostname}:{parts.port + 1}"
+        return urlunsplit((scheme, netloc, parts.path, parts.query, parts.fragment))
+
+    @staticmethod
+    def _signature_status_reached(resp: types.RPCResponse, commitment: Commitment) -> bool:
+        maybe_rpc_error = resp.get("error")
+        if maybe_rpc_error is not None:
+            raise RPCException(maybe_rpc_error)
+        resp_value = resp["result"]["value"][0]
+        if resp_value is None:
+            return False
+        return COMMITMENT_RANKS[resp_value["confirmationStatus"]] >= COMMITMENT_RANKS[commitment]
+
+    @staticmethod
+    def _signature_notification_resp(
+        notification: "SignatureNotification", commitment: Commitment
+    ) -> types.RPCResponse:
+        """Present a signature notification in the shape of a `getSignatureStatuses` response."""
+        slot = notification.result.context.slot
+        err = notification.result.value.err
+        status: Dict[str, Any] = {
+            "slot": slot,
+            "confirmations": None,
+            "err": err,
+            "status": {"Ok": None} if err is None else {"Err": err},
+            "confirmationStatus": commitment,
+        }
+        return {
+            "jsonrpc": "2.0",
+            "result": {"context": {"slot": slot}, "value": [status]},
+            "id": notification.subscription,
+        }
+
     @staticmethod
     def parse_recent_blockhash(blockhash_resp: types.RPCResponse) -> Blockhash:
         """Extract blockhash from JSON RPC result."""
@@ -464,5 +567,128 @@ class _ClientCore:  # pylint: disable=too-few-public-methods
         recent_blockhash = self.parse_recent_blockhash(blockhash_resp)
         if self.blockhash_cache:
             slot = blockhash_resp["result"]["context"]["slot"]
-            self.blockhash_cache.set(recent_blockhash, slot, used_immediately=used_immediately)
+            last_valid_block_height = blockhash_resp["result"]["value"].get("lastValidBlockHeight")
+            self.blockhash_cache.set(
+                recent_blockhash,
+                slot,
+                used_immediately=used_immediately,
+                last_valid_block_height=last_valid_block_height,
+            )
         return recent_blockhash
+
+    @staticmethod
+    def _check_stream_envelope(envelope: Dict[str, Any]) -> None:
+        maybe_rpc_error = envelope.get("error")
+        if maybe_rpc_error is not None:
+            raise RPCException(maybe_rpc_error)
+
+
+class _RequestBatchCore:  # pylint: disable=protected-access
+    """Collects RPC calls so they can be sent to the node in a single HTTP request.
+
+    Each method mirrors the client method of the same name, but instead of sending the request
+    it queues it and returns the index its response will have in `results`.
+    """
+
+    def __init__(self, client: _ClientCore) -> None:
+        self._client = client
+        self._requests: List[Tuple[Any, ...]] = []
+        self.results: List[types.RPCResponse] = []
+
+    def __len__(self) -> int:
+        """Number of queued calls."""
+        return len(self._requests)
+
+    def add(self, method: types.RPCMethod, *params: Any) -> int:
+        """Queue an arbitrary RPC call.
+
+        Args:
+            method: The RPC method name.
+            *params: The RPC params.
+
+        Returns:
+            The index of the call's response in `results`.
+        """
+        self._requests.append((method, *params))
+        return len(self._requests) - 1
+
+    def get_balance(self, pubkey: Union[PublicKey, str], commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getBalance` call."""
+        return self.add(*self._client._get_balance_args(pubkey, commitment))
+
+    def get_account_info(
+        self,
+        pubkey: Union[PublicKey, str],
+        commitment: Optional[Commitment] = None,
+        encoding: str = "base64",
+        data_slice: Optional[types.DataSliceOpts] = None,
+    ) -> int:
+        """Queue a `getAccountInfo` call."""
+        return self.add(*self._client._get_account_info_args(pubkey, commitment, encoding, data_slice))
+
+    def get_block(self, slot: int, encoding: str = "json") -> int:
+        """Queue a `getBlock` call."""
+        return self.add(*self._client._get_block_args(slot, encoding))
+
+    def get_block_height(self, commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getBlockHeight` call."""
+        return self.add(*self._client._get_block_height_args(commitment))
+
+    def get_block_time(self, slot: int) -> int:
+        """Queue a `getBlockTime` call."""
+        return self.add(*self._client._get_block_time_args(slot))
+
+    def get_epoch_info(self, commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getEpochInfo` call."""
+        return self.add(*self._client._get_epoch_info_args(commitment))
+
+    def get_latest_blockhash(self, commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getLatestBlockhash` call."""
+        return self.add(*self._client._get_latest_blockhash_args(commitment))
+
+    def get_minimum_balance_for_rent_exemption(self, usize: int, commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getMinimumBalanceForRentExemption` call."""
+        return self.add(*self._client._get_minimum_balance_for_rent_exemption_args(usize, commitment))
+
+    def get_multiple_accounts(
+        self,
+        pubkeys: List[Union[PublicKey, str]],
+        commitment: Optional[Commitment] = None,
+        encoding: str = "base64",
+        data_slice: Optional[types.DataSliceOpts] = None,
+    ) -> int:
+        """Queue a `getMultipleAccounts` call."""
+        return self.add(*self._client._get_multiple_accounts_args(pubkeys, commitment, encoding, data_slice))
+
+    def get_signature_statuses(
+        self, signatures: List[Union[str, bytes]], search_transaction_history: bool = False
+    ) -> int:
+        """Queue a `getSignatureStatuses` call."""
+        return self.add(*self._client._get_signature_statuses_args(signatures, search_transaction_history))
+
+    def get_signatures_for_address(
+        self,
+        account: Union[str, Keypair, PublicKey],
+        before: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        commitment: Optional[Commitment] = None,
+    ) -> int:
+        """Queue a `getSignaturesForAddress` call."""
+        return self.add(*self._client._get_signatures_for_address_args(account, before, until, limit, commitment))
+
+    def get_slot(self, commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getSlot` call."""
+        return self.add(*self._client._get_slot_args(commitment))
+
+    def get_token_account_balance(self, pubkey: Union[str, PublicKey], commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getTokenAccountBalance` call."""
+        return self.add(*self._client._get_token_account_balance_args(pubkey, commitment))
+
+    def get_token_supply(self, pubkey: Union[str, PublicKey], commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getTokenSupply` call."""
+        return self.add(*self._client._get_token_supply_args(pubkey, commitment))
+
+    def get_transaction(self, tx_sig: str, encoding: str = "json", commitment: Optional[Commitment] = None) -> int:
+        """Queue a `getTransaction` call."""
+        return self.add(*self._client._get_transaction_args(tx_sig, encoding, commitment))
@@ -1,20 +1,67 @@
 """Async HTTP RPC Provider."""
-from typing import Any, Optional
+import asyncio
+from contextlib import AsyncExitStack
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import httpx
 
 from ...exceptions import SolanaRpcException, handle_async_exceptions
 from ..types import RPCMethod, RPCResponse
 from .async_base import AsyncBaseProvider
-from .core import DEFAULT_TIMEOUT, _HTTPProviderCore
+from .cache import ResponseCache, _fill_misses
+from .core import DEFAULT_STREAM_CHUNK_SIZE, DEFAULT_TIMEOUT, TraceHook, _HTTPProviderCore
+from .rate_limit import AsyncRateLimiter, RateLimit
+from .retry import RetryPolicy
+
+_T = TypeVar("_T")
 
 
 class AsyncHTTPProvider(AsyncBaseProvider, _HTTPProviderCore):
-    """Async HTTP provider to interact with the http rpc endpoint."""
+    """Async HTTP provider to interact with the http rpc endpoint.
+
+    Args:
+        endpoint: URL of the RPC endpoint.
+        timeout: HTTP request timeout in seconds.
+        trace_hook: (optional) Called with an `RPCTrace` of the method, payload sizes and timings of every request.
+        rate_limit: (optional) Rate and concurrency limits on all requests. Requests over the limits wait
+            instead of failing, and 429 responses are retried after their `Retry-After` delay.
+        method_rate_limits: (optional) Additional limits per RPC method, e.g. for `getProgramAccounts`.
+        retry_policy: (optional) A `RetryPolicy` for retrying idempotent requests that failed transiently.
+        response_cache: (optional) A `ResponseCache` that read-only requests are answered from when possible.
+    """
 
-    def __init__(self, endpoint: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        endpoint: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        trace_hook: Optional[TraceHook] = None,
+        rate_limit: Optional[RateLimit] = None,
+        method_rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         """Init AsyncHTTPProvider."""
-        super().__init__(endpoint)
+        super().__init__(endpoint, timeout, trace_hook)
+        self.retry_policy = retry_policy
+        self.response_cache = response_cache
+        self.rate_limiter = (
+            AsyncRateLimiter(rate_limit, method_rate_limits) if rate_limit is not None or method_rate_limits else None
+        )
+        """The provider's `AsyncRateLimiter`, if it has limits."""
         self.session = httpx.AsyncClient(timeout=timeout)
 
     def __str__(self) -> str:
@@ -24,9 +71,117 @@ class AsyncHTTPProvider(AsyncBaseProvider, _HTTPProviderCore):
     @handle_async_exceptions(SolanaRpcException, Exception)
     async def make_request(self, method: RPCMethod, *params: Any) -> RPCResponse:
         """Make an async HTTP request to an http rpc endpoint."""
+        cache = self.response_cache
+        if cache is not None:
+            cached = cache.get(method, params)
+            if cached is not None:
+                return cached
+        resp = await self._retrying((method,), lambda: self._request_once(method, params))
+        if cache is not None:
+            cache.put(method, params, resp)
+        return resp
+
+    async def _request_once(self, method: RPCMethod, params: Tuple[Any, ...]) -> RPCResponse:
+        request_kwargs = self._before_request(method=method, params=params, is_async=True)
+        raw_response, started = await self._post((method,), request_kwargs)
+        received = perf_counter()
+        try:
+            return self._after_request(raw_response=raw_response, method=method)
+        finally:
+            self._trace((method,), request_kwargs, raw_response, started, received, perf_counter())
+
+    @handle_async_exceptions(SolanaRpcException, Exception)
+    async def make_batch_request(self, reqs: Sequence[Tuple[Any, ...]]) -> List[RPCResponse]:
+        """Send several JSON-RPC requests in one async HTTP POST.
+
+        Args:
+            reqs: Requests to send, each a tuple of the RPC method followed by its params.
+
+        Returns:
+            The responses, in the same order as `reqs`.
+        """
+        if not reqs:
+            return []
+        cache = self.response_cache
+        if cache is None:
+            methods = tuple(req[0] for req in reqs)
+            return await self._retrying(methods, lambda: self._batch_request_once(reqs, methods))
+        cached = cache.get_many(reqs)
+        misses = [req for req, response in zip(reqs, cached) if response is None]
+        if not misses:
+            return cast(List[RPCResponse], cached)
+        missed_methods = tuple(req[0] for req in misses)
+        fresh = await self._retrying(missed_methods, lambda: self._batch_request_once(misses, missed_methods))
+        cache.put_many(misses, fresh)
+        return _fill_misses(cached, fresh)
+
+    async def _batch_request_once(
+        self, reqs: Sequence[Tuple[Any, ...]], methods: Tuple[RPCMethod, ...]
+    ) -> List[RPCResponse]:
+        request_ids, request_kwargs = self._before_batch_request(reqs, is_async=True)
+        raw_response, started = await self._post(methods, request_kwargs)
+        received = perf_counter()
+        try:
+            return self._after_batch_request(raw_response=raw_response, request_ids=request_ids)
+        finally:
+            self._trace(methods, request_kwargs, raw_response, started, received, perf_counter())
+
+    async def _retrying(self, methods: Tuple[RPCMethod, ...], send: Callable[[], Awaitable[_T]]) -> _T:
+        """Await `send()`, retrying transient failures as the retry policy allows."""
+        policy = self.retry_policy
+        if policy is None:
+            return await send()
+        started = monotonic()
+        attempt = 0
+        while True:
+            try:
+                result = await send()
+            except Exception as err:  # pylint: disable=broad-except
+                delay = policy.retry_delay(methods, err, attempt, started)
+                if delay is None:
+                    raise
+                self.logger.warning("Retrying %s in %.2fs after error: %s", methods[0], delay, err)
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                policy.record_success(attempt)
+                return result
+
+    async def _post(
+        self, methods: Tuple[RPCMethod, ...], request_kwargs: Dict[str, Any]
+    ) -> Tuple[httpx.Response, float]:
+        """Send a request once the rate limiter allows it. Returns the response and when it was sent."""
+        limiter = self.rate_limiter
+        if limiter is None:
+            started = perf_counter()
+            return await self.session.post(**request_kwargs), started
+        retries = 0
+        while True:
+            async with limiter.slot(methods):
+                started = perf_counter()
+                raw_response = await self.session.post(**request_kwargs)
+            delay = limiter.throttle(raw_response.status_code, raw_response.headers.get("Retry-After"))
+            if delay is None or retries >= limiter.max_throttled_retries:
+                return raw_response, started
+            self.logger.warning("Throttled by %s, retrying %s in %.1fs", self.endpoint_uri, methods[0], delay)
+            retries += 1
+
+    async def stream_request(self, method: RPCMethod, *params: Any) -> AsyncIterator[bytes]:
+        """Make an async HTTP request and yield the raw response body in chunks as it arrives.
+
+        The body is never held in memory as a whole. Requests made this way are not reported to `trace_hook`.
+        """
         request_kwargs = self._before_request(method=method, params=params, is_async=True)
-        raw_response = await self.session.post(**request_kwargs)
-        return self._after_request(raw_response=raw_response, method=method)
+        try:
+            async with AsyncExitStack() as stack:
+                if self.rate_limiter is not None:
+                    await stack.enter_async_context(self.rate_limiter.slot((method,)))
+                raw_response = await stack.enter_async_context(self.session.stream("POST", **request_kwargs))
+                raw_response.raise_for_status()
+                async for chunk in raw_response.aiter_bytes(DEFAULT_STREAM_CHUNK_SIZE):
+                    yield chunk
+        except httpx.HTTPError as exc:
+            raise SolanaRpcException(exc, self.stream_request, self, method, *params) from exc
 
     async def is_connected(self) -> bool:
         """Health check."""
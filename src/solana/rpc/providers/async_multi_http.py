@@ -0,0 +1,193 @@
+"""Async multi-endpoint HTTP RPC Provider."""
+import asyncio
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar, cast
+
+from ...exceptions import SolanaRpcException
+from ..types import RPCMethod, RPCResponse
+from .async_base import AsyncBaseProvider
+from .async_http import AsyncHTTPProvider
+from .cache import ResponseCache
+from .core import (
+    DEFAULT_EJECT_AFTER,
+    DEFAULT_EJECT_BACKOFF,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_LATENCY_ALPHA,
+    DEFAULT_MAX_EJECT_BACKOFF,
+    DEFAULT_TIMEOUT,
+    TraceHook,
+    _is_read,
+    _MultiProviderCore,
+)
+from .rate_limit import RateLimit
+from .retry import RetryPolicy
+
+_T = TypeVar("_T")
+
+
+class AsyncMultiHTTPProvider(AsyncBaseProvider, _MultiProviderCore):
+    """Async HTTP provider that spreads requests over several RPC endpoints.
+
+    Routing, hedging and ejection work as in `MultiHTTPProvider`. The slower of two hedged requests is cancelled.
+
+    Args:
+        endpoints: URLs of the RPC endpoints.
+        timeout: HTTP request timeout in seconds.
+        trace_hook: (optional) Called with an `RPCTrace` of the method, payload sizes and timings of every request.
+        rate_limit: (optional) Rate and concurrency limits on the requests to each endpoint.
+        method_rate_limits: (optional) Additional limits per RPC method on the requests to each endpoint.
+        retry_policy: (optional) A `RetryPolicy` for retrying idempotent requests to an endpoint before
+            failing over to the next one.
+        response_cache: (optional) A `ResponseCache` shared by every endpoint.
+        latency_alpha: Weight of the newest sample in the latency and error rate averages.
+        hedge_percentile: Latency percentile after which reads are hedged, or None to never hedge.
+        hedge_min_samples: Number of latency samples an endpoint needs before reads sent to it are hedged.
+        eject_after: Number of consecutive failures after which an endpoint is ejected.
+        eject_backoff: Seconds an endpoint is first ejected for.
+        max_eject_backoff: Upper bound of the ejection time in seconds.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        endpoints: Sequence[str],
+        timeout: float = DEFAULT_TIMEOUT,
+        trace_hook: Optional[TraceHook] = None,
+        rate_limit: Optional[RateLimit] = None,
+        method_rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+        hedge_percentile: Optional[float] = DEFAULT_HEDGE_PERCENTILE,
+        hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        eject_after: int = DEFAULT_EJECT_AFTER,
+        eject_backoff: float = DEFAULT_EJECT_BACKOFF,
+        max_eject_backoff: float = DEFAULT_MAX_EJECT_BACKOFF,
+    ):
+        """Init AsyncMultiHTTPProvider."""
+        super().__init__(
+            endpoints, latency_alpha, hedge_percentile, hedge_min_samples, eject_after, eject_backoff, max_eject_backoff
+        )
+        self.providers = [
+            AsyncHTTPProvider(
+                endpoint,
+                timeout=timeout,
+                trace_hook=trace_hook,
+                rate_limit=rate_limit,
+                method_rate_limits=method_rate_limits,
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+            )
+            for endpoint in endpoints
+        ]
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        """String definition for AsyncMultiHTTPProvider."""
+        return f"Async HTTP RPC connection to {', '.join(stats.endpoint for stats in self.stats)}"
+
+    async def make_request(self, method: RPCMethod, *params: Any) -> RPCResponse:
+        """Make an async HTTP request to the best endpoint, hedging and failing over if `method` is a read."""
+        return await self._route(lambda provider: provider.make_request(method, *params), _is_read(method))
+
+    async def make_batch_request(self, reqs: Sequence[Tuple[Any, ...]]) -> List[RPCResponse]:
+        """Send several JSON-RPC requests in one async HTTP POST to the best endpoint.
+
+        The batch is hedged and failed over like a single read if every request in it is a read.
+
+        Args:
+            reqs: Requests to send, each a tuple of the RPC method followed by its params.
+
+        Returns:
+            The responses, in the same order as `reqs`.
+        """
+        if not reqs:
+            return []
+        return await self._route(
+            lambda provider: provider.make_batch_request(reqs), all(_is_read(req[0]) for req in reqs)
+        )
+
+    async def stream_request(self, method: RPCMethod, *params: Any) -> AsyncIterator[bytes]:
+        """Stream the response body of a request to the best endpoint. Streamed requests are not hedged."""
+        idx = self._ranked(())[0]
+        async for chunk in self.providers[idx].stream_request(method, *params):
+            yield chunk
+
+    async def is_connected(self) -> bool:
+        """Health check; True if any endpoint is healthy."""
+        return any(await asyncio.gather(*(provider.is_connected() for provider in self.providers)))
+
+    async def _call(self, idx: int, call: Callable[[AsyncHTTPProvider], Awaitable[_T]]) -> _T:
+        started = perf_counter()
+        try:
+            result = await call(self.providers[idx])
+        except SolanaRpcException as err:
+            self._record_failure(idx, err)
+            raise
+        self._record_success(idx, perf_counter() - started)
+        return result
+
+    async def _route(self, call: Callable[[AsyncHTTPProvider], Awaitable[_T]], is_read: bool) -> _T:
+        idx = self._ranked(())[0]
+        if not is_read:
+            return await self._call(idx, call)
+        tried = [idx]
+        delay = self._hedge_delay(idx)
+        if delay is None:
+            while True:
+                try:
+                    return await self._call(idx, call)
+                except SolanaRpcException:
+                    next_idx = self._select(tried)
+                    if next_idx is None:
+                        raise
+                    idx = next_idx
+                    tried.append(idx)
+        return await self._hedged(call, idx, delay, tried)
+
+    async def _hedged(
+        self, call: Callable[[AsyncHTTPProvider], Awaitable[_T]], idx: int, delay: float, tried: List[int]
+    ) -> _T:
+        pending: Set["asyncio.Task[_T]"] = {asyncio.ensure_future(self._call(idx, call))}
+        timeout: Optional[float] = delay
+        last_error: Optional[BaseException] = None
+        try:
+            while True:
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # The request is slower than usual for its endpoint: race it against the next one.
+                    timeout = None
+                    next_idx = self._select(tried)
+                    if next_idx is not None:
+                        self.hedges += 1
+                        tried.append(next_idx)
+                        pending.add(asyncio.ensure_future(self._call(next_idx, call)))
+                    continue
+                for task in done:
+                    pending.discard(task)
+                    last_error = task.exception()
+                    if last_error is None:
+                        return task.result()
+                if not pending:
+                    next_idx = self._select(tried)
+                    if next_idx is None:
+                        raise cast(BaseException, last_error)
+                    tried.append(next_idx)
+                    pending.add(asyncio.ensure_future(self._call(next_idx, call)))
+        finally:
+            for loser in pending:
+                loser.cancel()
+
+    async def __aenter__(self) -> "AsyncMultiHTTPProvider":
+        """Use as a context manager."""
+        for provider in self.providers:
+            await provider.__aenter__()
+        return self
+
+    async def __aexit__(self, _exc_type, _exc, _tb):
+        """Exits the context manager."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the sessions of every endpoint."""
+        await asyncio.gather(*(provider.close() for provider in self.providers))
@@ -1,5 +1,5 @@
 """Base RPC Provider."""
-from typing import Any
+from typing import Any, Iterator, List, Sequence, Tuple
 
 from ..types import RPCMethod, RPCResponse
 
@@ -11,6 +11,17 @@ class BaseProvider:
         """Make a request ot the rpc endpoint."""
         raise NotImplementedError("Providers must implement this method")
 
+    def make_batch_request(self, reqs: Sequence[Tuple[Any, ...]]) -> List[RPCResponse]:
+        """Make several requests to the rpc endpoint in a single round trip.
+
+        Each request is a tuple of the RPC method followed by its params.
+        """
+        raise NotImplementedError("Providers must implement this method")
+
+    def stream_request(self, method: RPCMethod, *params: Any) -> Iterator[bytes]:
+        """Make a request to the rpc endpoint and yield the raw response body in chunks as it arrives."""
+        raise NotImplementedError("Providers must implement this method")
+
     def is_connected(self) -> bool:
         """Health check."""
         raise NotImplementedError("Providers must implement this method")
@@ -0,0 +1,161 @@
+"""Caching of responses to read-only RPC methods.
+
+Example:
+    >>> cache = ResponseCache(commitment_ttls={"confirmed": 0.4})
+    >>> cache.ttl("getGenesisHash", ())
+    inf
+    >>> cache.ttl("getBlock", (1, {"commitment": "finalized"}))
+    inf
+    >>> cache.ttl("getBalance", ("pubkey", {"commitment": "confirmed"}))
+    0.4
+    >>> cache.ttl("getBalance", ("pubkey", {"commitment": "processed"})) is None
+    True
+"""
+import json
+import math
+import threading
+from time import monotonic
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from cachetools import LRUCache
+
+from ..types import RPCMethod, RPCResponse
+from .core import _is_read
+
+DEFAULT_MAX_ENTRIES = 1024
+"""Default maximum number of cached responses."""
+
+IMMUTABLE_METHODS = frozenset(("getEpochSchedule", "getGenesisHash", "getMinimumBalanceForRentExemption"))
+"""Methods whose responses never change for the same params; cached forever."""
+
+DEFAULT_METHOD_TTLS: Dict[str, Optional[float]] = {
+    **{method: math.inf for method in IMMUTABLE_METHODS},
+    "getInflationGovernor": 3600.0,
+    "getVersion": 3600.0,
+    # Polled by transaction confirmation, which must see every status change.
+    "getSignatureStatuses": None,
+}
+"""Default TTLs in seconds of methods cached regardless of commitment; None means never cached."""
+
+FINALIZED_IMMUTABLE_METHODS = frozenset(
+    ("getBlock", "getBlockTime", "getConfirmedBlock", "getConfirmedTransaction", "getTransaction")
+)
+"""Methods whose responses never change once read at `finalized` commitment; those are cached forever."""
+
+DEFAULT_COMMITMENT_TTLS: Dict[str, Optional[float]] = {"processed": None, "confirmed": None, "finalized": None}
+"""Default TTLs in seconds of other reads, by commitment. None means the reads are not cached."""
+
+_DEFAULT_COMMITMENT = "finalized"
+"""The commitment RPC nodes use when a request does not specify one."""
+
+
+def _commitment(params: Sequence[Any]) -> str:
+    for param in reversed(params):
+        if isinstance(param, dict) and "commitment" in param:
+            return param["commitment"]
+    return _DEFAULT_COMMITMENT
+
+
+class ResponseCache:
+    """A bounded LRU cache of RPC responses, keyed by method and params, with TTLs per method and commitment.
+
+    Only successful responses with a non-null result are cached, so e.g. a transaction that is not
+    found yet is fetched again next time. Cached responses are shared between callers and must not be
+    modified.
+
+    Each request's TTL is taken from the first of these that applies:
+
+    1. `method_ttls`, merged over `DEFAULT_METHOD_TTLS`.
+    2. `FINALIZED_IMMUTABLE_METHODS` read at `finalized` commitment are cached forever.
+    3. Other `get*` methods use `commitment_ttls`, merged over `DEFAULT_COMMITMENT_TTLS`,
+       for the request's commitment (`finalized` if it names none).
+
+    Args:
+        max_entries: Maximum number of cached responses; the least recently used are evicted first.
+        method_ttls: (optional) TTLs in seconds per method. `math.inf` caches forever, None disables caching.
+        commitment_ttls: (optional) TTLs in seconds of other reads per commitment.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        method_ttls: Optional[Mapping[str, Optional[float]]] = None,
+        commitment_ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ) -> None:
+        """Init an empty cache."""
+        self.method_ttls = {**DEFAULT_METHOD_TTLS, **(method_ttls or {})}
+        self.commitment_ttls = {**DEFAULT_COMMITMENT_TTLS, **(commitment_ttls or {})}
+        self._entries: LRUCache = LRUCache(maxsize=max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        """Number of requests answered from the cache."""
+        self.misses = 0
+        """Number of cacheable requests that were not in the cache."""
+
+    def __len__(self) -> int:
+        """Number of cached responses, including expired ones not evicted yet."""
+        return len(self._entries)
+
+    def ttl(self, method: RPCMethod, params: Sequence[Any]) -> Optional[float]:
+        """Seconds the response to a request may be cached for, or None if it must not be cached."""
+        if method in self.method_ttls:
+            return self.method_ttls[method]
+        if not _is_read(method):
+            return None
+        commitment = _commitment(params)
+        if method in FINALIZED_IMMUTABLE_METHODS and commitment == "finalized":
+            return math.inf
+        return self.commitment_ttls.get(commitment)
+
+    def get(self, method: RPCMethod, params: Sequence[Any]) -> Optional[RPCResponse]:
+        """Look up the cached response to a request.
+
+        Returns:
+            The response, or None if the request is not cacheable, not cached or expired.
+        """
+        if self.ttl(method, params) is None:
+            return None
+        key = _key(method, params)
+        with self._lock:
+            entry: Optional[Tuple[float, RPCResponse]] = self._entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def put(self, method: RPCMethod, params: Sequence[Any], response: RPCResponse) -> None:
+        """Cache the response to a request, if the request's policy and the response allow it."""
+        ttl = self.ttl(method, params)
+        if ttl is None or "error" in response or response.get("result") is None:
+            return
+        key = _key(method, params)
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl, response)
+
+    def get_many(self, reqs: Sequence[Tuple[Any, ...]]) -> List[Optional[RPCResponse]]:
+        """Look up the cached responses to batch requests, each a tuple of the method followed by its params."""
+        return [self.get(req[0], req[1:]) for req in reqs]
+
+    def put_many(self, reqs: Sequence[Tuple[Any, ...]], responses: Sequence[RPCResponse]) -> None:
+        """Cache the responses to batch requests."""
+        for req, response in zip(reqs, responses):
+            self.put(req[0], req[1:], response)
+
+    def clear(self) -> None:
+        """Drop every cached response and reset the stats."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def _fill_misses(cached: Sequence[Optional[RPCResponse]], fresh: Sequence[RPCResponse]) -> List[RPCResponse]:
+    """Merge the responses fetched for the cache misses of a batch back into the cached ones, in order."""
+    fresh_iter = iter(fresh)
+    return [next(fresh_iter) if response is None else response for response in cached]
+
+
+def _key(method: RPCMethod, params: Sequence[Any]) -> Tuple[str, str]:
+    return method, json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
@@ -1,8 +1,12 @@
 """Helper code for HTTP provider classes."""
 import itertools
 import logging
+import math
 import os
-from typing import Any, Dict, Optional, Tuple, Union, cast
+import threading
+from collections import deque
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union, cast
 
 import httpx
 import requests
@@ -11,6 +15,74 @@ from .._utils.encoding import FriendlyJsonSerde
 from ..types import URI, RPCMethod, RPCResponse
 
 DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+"""Size of the chunks in which streamed response bodies are read."""
+DEFAULT_LOG_BODY_LIMIT = 2048
+"""Maximum number of characters of a request or response body written to the debug log."""
+DEFAULT_LATENCY_ALPHA = 0.2
+"""Weight of the newest sample in the latency and error rate moving averages of multi-endpoint providers."""
+DEFAULT_HEDGE_PERCENTILE = 0.95
+"""Latency percentile of an endpoint after which multi-endpoint providers hedge a read to a second endpoint."""
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+"""Number of latency samples an endpoint needs before reads sent to it are hedged."""
+DEFAULT_LATENCY_WINDOW = 200
+"""Number of recent latency samples kept per endpoint to compute the hedge percentile."""
+DEFAULT_EJECT_AFTER = 3
+"""Number of consecutive failures after which an endpoint is ejected."""
+DEFAULT_EJECT_BACKOFF = 1.0
+"""Seconds an endpoint is ejected for the first time; doubled on every consecutive ejection."""
+DEFAULT_MAX_EJECT_BACKOFF = 60.0
+"""Upper bound of the ejection backoff in seconds."""
+
+
+class RPCTrace(NamedTuple):
+    """Size and timing of one HTTP round trip, reported to a provider's `trace_hook`."""
+
+    methods: Tuple[RPCMethod, ...]
+    """The RPC methods sent; more than one for batch requests."""
+    request_bytes: int
+    """Size of the request body."""
+    response_bytes: int
+    """Size of the response body."""
+    status_code: int
+    """HTTP status code of the response."""
+    request_seconds: float
+    """Time from sending the request until the response body was received."""
+    decode_seconds: float
+    """Time spent decoding the response body."""
+
+
+TraceHook = Callable[[RPCTrace], None]
+"""Callback receiving an `RPCTrace` after every HTTP round trip."""
+
+
+class _LogPreview:  # pylint: disable=too-few-public-methods
+    """Defers formatting a body for the debug log until a record is emitted, and truncates it."""
+
+    __slots__ = ("_body", "_limit")
+
+    def __init__(self, body: Any, limit: int) -> None:
+        self._body = body
+        self._limit = limit
+
+    def __str__(self) -> str:
+        body = self._body
+        if isinstance(body, (bytes, bytearray)):
+            total = len(body)
+            text = bytes(body[: self._limit]).decode("utf-8", "replace")
+        else:
+            text = str(body)
+            total = len(text)
+        if total <= self._limit:
+            return text
+        return f"{text[: self._limit]}... ({total} total)"
+
+
+def _is_read(method: RPCMethod) -> bool:
+    """Whether `method` only reads state, so sending it twice or to another node is harmless."""
+    return method.startswith("get")
 
 
 def get_default_endpoint() -> URI:
@@ -20,19 +92,36 @@ def get_default_endpoint() -> URI:
 
 class _HTTPProviderCore(FriendlyJsonSerde):
     logger = logging.getLogger("solanaweb3.rpc.httprpc.HTTPClient")
+    log_body_limit = DEFAULT_LOG_BODY_LIMIT
 
-    def __init__(self, endpoint: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self, endpoint: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT, trace_hook: Optional[TraceHook] = None
+    ):
         """Init."""
         self._request_counter = itertools.count()
         self.endpoint_uri = get_default_endpoint() if not endpoint else URI(endpoint)
         self.health_uri = URI(f"{self.endpoint_uri}/health")
         self.timeout = timeout
+        self.trace_hook = trace_hook
 
     def _build_request_kwargs(
         self, request_id: int, method: RPCMethod, params: Tuple[Any, ...], is_async: bool
     ) -> Dict[str, Any]:
-        headers = {"Content-Type": "application/json"}
         data = self.json_encode({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        return self._build_post_kwargs(data, is_async)
+
+    def _build_batch_request_kwargs(
+        self, request_ids: List[int], reqs: Sequence[Tuple[Any, ...]], is_async: bool
+    ) -> Dict[str, Any]:
+        body = [
+            {"jsonrpc": "2.0", "id": request_id, "method": req[0], "params": req[1:]}
+            for request_id, req in zip(request_ids, reqs)
+        ]
+        data = self.json_encode(body)
+        return self._build_post_kwargs(data, is_async)
+
+    def _build_post_kwargs(self, data: str, is_async: bool) -> Dict[str, Any]:
+        headers = {"Content-Type": "application/json"}
         data_kwarg = "content" if is_async else "data"
         return {"url": self.endpoint_uri, "headers": headers, data_kwarg: data}
 
@@ -41,18 +130,222 @@ class _HTTPProviderCore(FriendlyJsonSerde):
 
     def _before_request(self, method: RPCMethod, params: Tuple[Any, ...], is_async: bool) -> Dict[str, Any]:
         request_id = self._increment_counter_and_get_id()
-        self.logger.debug(
-            "Making HTTP request. URI: %s, RequestID: %d, Method: %s, Params: %s",
-            self.endpoint_uri,
-            request_id,
-            method,
-            params,
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Making HTTP request. URI: %s, RequestID: %d, Method: %s, Params: %s",
+                self.endpoint_uri,
+                request_id,
+                method,
+                _LogPreview(params, self.log_body_limit),
+            )
         return self._build_request_kwargs(request_id=request_id, method=method, params=params, is_async=is_async)
 
     def _after_request(self, raw_response: Union[requests.Response, httpx.Response], method: RPCMethod) -> RPCResponse:
         raw_response.raise_for_status()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Getting response HTTP. URI: %s, Method: %s, Response: %s",
+                self.endpoint_uri,
+                method,
+                _LogPreview(raw_response.content, self.log_body_limit),
+            )
+        return cast(RPCResponse, self.json_decode(raw_response.content))
+
+    def _before_batch_request(
+        self, reqs: Sequence[Tuple[Any, ...]], is_async: bool
+    ) -> Tuple[List[int], Dict[str, Any]]:
+        request_ids = [self._increment_counter_and_get_id() for _ in reqs]
         self.logger.debug(
-            "Getting response HTTP. URI: %s, " "Method: %s, Response: %s", self.endpoint_uri, method, raw_response.text
+            "Making HTTP batch request. URI: %s, RequestIDs: %s, Methods: %s",
+            self.endpoint_uri,
+            request_ids,
+            [req[0] for req in reqs],
+        )
+        return request_ids, self._build_batch_request_kwargs(request_ids=request_ids, reqs=reqs, is_async=is_async)
+
+    def _after_batch_request(
+        self, raw_response: Union[requests.Response, httpx.Response], request_ids: List[int]
+    ) -> List[RPCResponse]:
+        raw_response.raise_for_status()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Getting batch response HTTP. URI: %s, Response: %s",
+                self.endpoint_uri,
+                _LogPreview(raw_response.content, self.log_body_limit),
+            )
+        decoded: Any = self.json_decode(raw_response.content)
+        if not isinstance(decoded, list):
+            # The node rejected the batch as a whole, so every call gets the same error.
+            return [cast(RPCResponse, decoded) for _ in request_ids]
+        by_id = {resp.get("id"): resp for resp in decoded}
+        return [
+            cast(RPCResponse, by_id.get(request_id, _missing_batch_response(request_id))) for request_id in request_ids
+        ]
+
+    def _trace(
+        self,
+        methods: Tuple[RPCMethod, ...],
+        request_kwargs: Dict[str, Any],
+        raw_response: Union[requests.Response, httpx.Response],
+        started: float,
+        received: float,
+        decoded: float,
+    ) -> None:
+        if self.trace_hook is None:
+            return
+        trace = RPCTrace(
+            methods=methods,
+            request_bytes=len(request_kwargs.get("data") or request_kwargs.get("content") or ""),
+            response_bytes=len(raw_response.content),
+            status_code=raw_response.status_code,
+            request_seconds=received - started,
+            decode_seconds=decoded - received,
+        )
+        try:
+            self.trace_hook(trace)
+        except Exception as err:  # pylint: disable=broad-except
+            self.logger.warning("Trace hook failed: %s", err)
+
+
+class EndpointStats:  # pylint: disable=too-many-instance-attributes
+    """Latency and health of one endpoint of a multi-endpoint provider."""
+
+    def __init__(self, endpoint: URI, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        """Init empty stats."""
+        self.endpoint = endpoint
+        self.latency: Optional[float] = None
+        """Exponentially weighted moving average of successful request durations in seconds."""
+        self.error_rate = 0.0
+        """Exponentially weighted moving average of the share of failed requests."""
+        self.requests = 0
+        """Number of completed requests."""
+        self.failures = 0
+        """Number of failed requests."""
+        self.consecutive_failures = 0
+        self.ejections = 0
+        """Number of consecutive times the endpoint was ejected; reset by a success."""
+        self.ejected_until = 0.0
+        """`time.monotonic()` until which the endpoint is ejected."""
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def healthy(self, now: float) -> bool:
+        """Whether the endpoint is not ejected at `now`."""
+        return now >= self.ejected_until
+
+    def score(self) -> float:
+        """Expected seconds until a successful response, counting the failed attempts before it."""
+        if self.latency is None:
+            # Route to endpoints without samples first, so each one gets measured, unless they have
+            # only failed so far: those go after every measured endpoint.
+            return math.inf if self.failures else 0.0
+        return self.latency / max(1.0 - self.error_rate, 0.01)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Latency percentile over the recent window, e.g. `0.95`; None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(percentile * len(ordered)) - 1)]
+
+    @property
+    def samples(self) -> int:
+        """Number of latency samples in the window."""
+        return len(self._samples)
+
+
+class _MultiProviderCore:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    logger = logging.getLogger("solanaweb3.rpc.httprpc.MultiHTTPProvider")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        endpoints: Sequence[str],
+        latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+        hedge_percentile: Optional[float] = DEFAULT_HEDGE_PERCENTILE,
+        hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        eject_after: int = DEFAULT_EJECT_AFTER,
+        eject_backoff: float = DEFAULT_EJECT_BACKOFF,
+        max_eject_backoff: float = DEFAULT_MAX_EJECT_BACKOFF,
+    ):
+        """Init."""
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if hedge_percentile is not None and not 0 < hedge_percentile < 1:
+            raise ValueError(f"hedge_percentile must be between 0 and 1, got {hedge_percentile}")
+        self.stats = [EndpointStats(URI(endpoint)) for endpoint in endpoints]
+        """The `EndpointStats` of each endpoint, in the order given."""
+        self.latency_alpha = latency_alpha
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.eject_after = eject_after
+        self.eject_backoff = eject_backoff
+        self.max_eject_backoff = max_eject_backoff
+        self.hedges = 0
+        """Number of requests that were hedged to a second endpoint."""
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint_uri(self) -> URI:
+        """The endpoint requests are currently routed to."""
+        return self.stats[self._ranked(())[0]].endpoint
+
+    def _ranked(self, exclude: Iterable[int]) -> List[int]:
+        """Indexes of the endpoints not in `exclude`, best first.
+
+        Healthy endpoints come first, by score. Ejected ones follow, soonest back first, so a request is
+        still attempted when every endpoint is ejected.
+        """
+        now = monotonic()
+        excluded = set(exclude)
+        candidates = [idx for idx in range(len(self.stats)) if idx not in excluded]
+        healthy = sorted(
+            (idx for idx in candidates if self.stats[idx].healthy(now)), key=lambda i: self.stats[i].score()
+        )
+        ejected = sorted(
+            (idx for idx in candidates if not self.stats[idx].healthy(now)), key=lambda i: self.stats[i].ejected_until
         )
-        return cast(RPCResponse, self.json_decode(raw_response.text))
+        return healthy + ejected
+
+    def _select(self, exclude: Iterable[int] = ()) -> Optional[int]:
+        ranked = self._ranked(exclude)
+        return ranked[0] if ranked else None
+
+    def _hedge_delay(self, idx: int) -> Optional[float]:
+        """Seconds after which a read sent to endpoint `idx` is also sent to another one; None to not hedge."""
+        stats = self.stats[idx]
+        if self.hedge_percentile is None or len(self.stats) < 2 or stats.samples < self.hedge_min_samples:
+            return None
+        return stats.latency_percentile(self.hedge_percentile)
+
+    def _record_success(self, idx: int, seconds: float) -> None:
+        alpha = self.latency_alpha
+        with self._lock:
+            stats = self.stats[idx]
+            stats.requests += 1
+            stats.latency = seconds if stats.latency is None else alpha * seconds + (1 - alpha) * stats.latency
+            stats.error_rate *= 1 - alpha
+            stats.consecutive_failures = 0
+            stats.ejections = 0
+            stats._samples.append(seconds)  # pylint: disable=protected-access
+
+    def _record_failure(self, idx: int, err: Exception) -> None:
+        alpha = self.latency_alpha
+        with self._lock:
+            stats = self.stats[idx]
+            stats.requests += 1
+            stats.failures += 1
+            stats.error_rate = alpha + (1 - alpha) * stats.error_rate
+            stats.consecutive_failures += 1
+            if stats.consecutive_failures < self.eject_after:
+                return
+            backoff = min(self.eject_backoff * 2**stats.ejections, self.max_eject_backoff)
+            stats.ejections += 1
+            stats.ejected_until = monotonic() + backoff
+        self.logger.warning("Ejecting %s for %.1fs after error: %s", stats.endpoint, backoff, err)
+
+
+def _missing_batch_response(request_id: int) -> RPCResponse:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": -32603, "message": "No response received for request in batch"},
+    }
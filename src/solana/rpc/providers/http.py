@@ -1,16 +1,72 @@
 """HTTP RPC Provider."""
-from typing import Any
+from contextlib import ExitStack
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...exceptions import SolanaRpcException, handle_exceptions
 from ..types import RPCMethod, RPCResponse
 from .base import BaseProvider
-from .core import _HTTPProviderCore
+from .cache import ResponseCache, _fill_misses
+from .core import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    DEFAULT_TIMEOUT,
+    TraceHook,
+    _HTTPProviderCore,
+)
+from .rate_limit import RateLimit, RateLimiter
+from .retry import RetryPolicy
+
+_T = TypeVar("_T")
 
 
 class HTTPProvider(BaseProvider, _HTTPProviderCore):
-    """HTTP provider to interact with the http rpc endpoint."""
+    """HTTP provider to interact with the http rpc endpoint.
+
+    Requests are sent through a single `requests.Session`, so TCP and TLS connections are kept alive
+    and reused between calls instead of being opened for every request.
+
+    Args:
+        endpoint: URL of the RPC endpoint.
+        timeout: HTTP request timeout in seconds.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections to keep alive per host.
+        trace_hook: (optional) Called with an `RPCTrace` of the method, payload sizes and timings of every request.
+        rate_limit: (optional) Rate and concurrency limits on all requests. Requests over the limits wait
+            instead of failing, and 429 responses are retried after their `Retry-After` delay.
+        method_rate_limits: (optional) Additional limits per RPC method, e.g. for `getProgramAccounts`.
+        retry_policy: (optional) A `RetryPolicy` for retrying idempotent requests that failed transiently.
+        response_cache: (optional) A `ResponseCache` that read-only requests are answered from when possible.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        endpoint: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        trace_hook: Optional[TraceHook] = None,
+        rate_limit: Optional[RateLimit] = None,
+        method_rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
+        """Init HTTPProvider."""
+        super().__init__(endpoint, timeout, trace_hook)
+        self.retry_policy = retry_policy
+        self.response_cache = response_cache
+        self.rate_limiter = (
+            RateLimiter(rate_limit, method_rate_limits) if rate_limit is not None or method_rate_limits else None
+        )
+        """The provider's `RateLimiter`, if it has limits."""
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def __str__(self) -> str:
         """String definition for HTTPProvider."""
@@ -19,17 +75,134 @@ class HTTPProvider(BaseProvider, _HTTPProviderCore):
     @handle_exceptions(SolanaRpcException, requests.exceptions.RequestException)
     def make_request(self, method: RPCMethod, *params: Any) -> RPCResponse:
         """Make an HTTP request to an http rpc endpoint."""
+        cache = self.response_cache
+        if cache is not None:
+            cached = cache.get(method, params)
+            if cached is not None:
+                return cached
+        resp = self._retrying((method,), lambda: self._request_once(method, params))
+        if cache is not None:
+            cache.put(method, params, resp)
+        return resp
+
+    def _request_once(self, method: RPCMethod, params: Tuple[Any, ...]) -> RPCResponse:
         request_kwargs = self._before_request(method=method, params=params, is_async=False)
-        raw_response = requests.post(**request_kwargs, timeout=self.timeout)
-        return self._after_request(raw_response=raw_response, method=method)
+        raw_response, started = self._post((method,), request_kwargs)
+        received = perf_counter()
+        try:
+            return self._after_request(raw_response=raw_response, method=method)
+        finally:
+            self._trace((method,), request_kwargs, raw_response, started, received, perf_counter())
+
+    @handle_exceptions(SolanaRpcException, requests.exceptions.RequestException)
+    def make_batch_request(self, reqs: Sequence[Tuple[Any, ...]]) -> List[RPCResponse]:
+        """Send several JSON-RPC requests in one HTTP POST.
+
+        Args:
+            reqs: Requests to send, each a tuple of the RPC method followed by its params.
+
+        Returns:
+            The responses, in the same order as `reqs`.
+        """
+        if not reqs:
+            return []
+        cache = self.response_cache
+        if cache is None:
+            methods = tuple(req[0] for req in reqs)
+            return self._retrying(methods, lambda: self._batch_request_once(reqs, methods))
+        cached = cache.get_many(reqs)
+        misses = [req for req, response in zip(reqs, cached) if response is None]
+        if not misses:
+            return cast(List[RPCResponse], cached)
+        missed_methods = tuple(req[0] for req in misses)
+        fresh = self._retrying(missed_methods, lambda: self._batch_request_once(misses, missed_methods))
+        cache.put_many(misses, fresh)
+        return _fill_misses(cached, fresh)
+
+    def _batch_request_once(self, reqs: Sequence[Tuple[Any, ...]], methods: Tuple[RPCMethod, ...]) -> List[RPCResponse]:
+        request_ids, request_kwargs = self._before_batch_request(reqs, is_async=False)
+        raw_response, started = self._post(methods, request_kwargs)
+        received = perf_counter()
+        try:
+            return self._after_batch_request(raw_response=raw_response, request_ids=request_ids)
+        finally:
+            self._trace(methods, request_kwargs, raw_response, started, received, perf_counter())
+
+    def _retrying(self, methods: Tuple[RPCMethod, ...], send: Callable[[], _T]) -> _T:
+        """Call `send`, retrying transient failures as the retry policy allows."""
+        policy = self.retry_policy
+        if policy is None:
+            return send()
+        started = monotonic()
+        attempt = 0
+        while True:
+            try:
+                result = send()
+            except requests.exceptions.RequestException as err:
+                delay = policy.retry_delay(methods, err, attempt, started)
+                if delay is None:
+                    raise
+                self.logger.warning("Retrying %s in %.2fs after error: %s", methods[0], delay, err)
+                sleep(delay)
+                attempt += 1
+            else:
+                policy.record_success(attempt)
+                return result
+
+    def _post(self, methods: Tuple[RPCMethod, ...], request_kwargs: Dict[str, Any]) -> Tuple[requests.Response, float]:
+        """Send a request once the rate limiter allows it. Returns the response and when it was sent."""
+        limiter = self.rate_limiter
+        if limiter is None:
+            started = perf_counter()
+            return self.session.post(**request_kwargs, timeout=self.timeout), started
+        retries = 0
+        while True:
+            with limiter.slot(methods):
+                started = perf_counter()
+                raw_response = self.session.post(**request_kwargs, timeout=self.timeout)
+            delay = limiter.throttle(raw_response.status_code, raw_response.headers.get("Retry-After"))
+            if delay is None or retries >= limiter.max_throttled_retries:
+                return raw_response, started
+            self.logger.warning("Throttled by %s, retrying %s in %.1fs", self.endpoint_uri, methods[0], delay)
+            raw_response.close()
+            retries += 1
+
+    def stream_request(self, method: RPCMethod, *params: Any) -> Iterator[bytes]:
+        """Make an HTTP request and yield the raw response body in chunks as it arrives.
+
+        The body is never held in memory as a whole. Requests made this way are not reported to `trace_hook`.
+        """
+        request_kwargs = self._before_request(method=method, params=params, is_async=False)
+        try:
+            with ExitStack() as stack:
+                if self.rate_limiter is not None:
+                    stack.enter_context(self.rate_limiter.slot((method,)))
+                raw_response = self.session.post(**request_kwargs, timeout=self.timeout, stream=True)
+                stack.callback(raw_response.close)
+                raw_response.raise_for_status()
+                yield from raw_response.iter_content(chunk_size=DEFAULT_STREAM_CHUNK_SIZE)
+        except requests.exceptions.RequestException as exc:
+            raise SolanaRpcException(exc, self.stream_request, self, method, *params) from exc
 
     def is_connected(self) -> bool:
         """Health check."""
         try:
-            response = requests.get(self.health_uri)
+            response = self.session.get(self.health_uri, timeout=self.timeout)
             response.raise_for_status()
         except (IOError, requests.HTTPError) as err:
             self.logger.error("Health check failed with error: %s", str(err))
             return False
 
         return response.ok
+
+    def __enter__(self) -> "HTTPProvider":
+        """Use as a context manager."""
+        return self
+
+    def __exit__(self, _exc_type, _exc, _tb):
+        """Exits the context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Close session."""
+        self.session.close()
@@ -0,0 +1,216 @@
+"""Multi-endpoint HTTP RPC Provider."""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import perf_counter
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar, cast
+
+from ...exceptions import SolanaRpcException
+from ..types import RPCMethod, RPCResponse
+from .base import BaseProvider
+from .cache import ResponseCache
+from .core import (
+    DEFAULT_EJECT_AFTER,
+    DEFAULT_EJECT_BACKOFF,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_LATENCY_ALPHA,
+    DEFAULT_MAX_EJECT_BACKOFF,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    TraceHook,
+    _is_read,
+    _MultiProviderCore,
+)
+from .http import HTTPProvider
+from .rate_limit import RateLimit
+from .retry import RetryPolicy
+
+_T = TypeVar("_T")
+
+
+class MultiHTTPProvider(BaseProvider, _MultiProviderCore):  # pylint: disable=too-many-instance-attributes
+    """HTTP provider that spreads requests over several RPC endpoints.
+
+    Every request goes to the healthy endpoint with the lowest expected latency, as tracked by an
+    exponentially weighted moving average of its latency and error rate. Reads (`get*` methods) that
+    take longer than the endpoint's `hedge_percentile` latency are also sent to the next best endpoint,
+    and whichever answers first wins. Reads that fail are retried on the next endpoint.
+    An endpoint that fails `eject_after` times in a row is skipped for `eject_backoff` seconds,
+    doubling on every consecutive ejection up to `max_eject_backoff`.
+
+    Args:
+        endpoints: URLs of the RPC endpoints.
+        timeout: HTTP request timeout in seconds.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections to keep alive per endpoint.
+        trace_hook: (optional) Called with an `RPCTrace` of the method, payload sizes and timings of every request.
+        rate_limit: (optional) Rate and concurrency limits on the requests to each endpoint.
+        method_rate_limits: (optional) Additional limits per RPC method on the requests to each endpoint.
+        retry_policy: (optional) A `RetryPolicy` for retrying idempotent requests to an endpoint before
+            failing over to the next one.
+        response_cache: (optional) A `ResponseCache` shared by every endpoint.
+        latency_alpha: Weight of the newest sample in the latency and error rate averages.
+        hedge_percentile: Latency percentile after which reads are hedged, or None to never hedge.
+        hedge_min_samples: Number of latency samples an endpoint needs before reads sent to it are hedged.
+        eject_after: Number of consecutive failures after which an endpoint is ejected.
+        eject_backoff: Seconds an endpoint is first ejected for.
+        max_eject_backoff: Upper bound of the ejection time in seconds.
+
+    Example:
+        >>> provider = MultiHTTPProvider(["http://localhost:8899", "http://localhost:8900"])
+        >>> provider.make_request("getSlot")  # doctest: +SKIP
+        >>> [(stats.endpoint, stats.latency) for stats in provider.stats]  # doctest: +SKIP
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        endpoints: Sequence[str],
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        trace_hook: Optional[TraceHook] = None,
+        rate_limit: Optional[RateLimit] = None,
+        method_rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+        hedge_percentile: Optional[float] = DEFAULT_HEDGE_PERCENTILE,
+        hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        eject_after: int = DEFAULT_EJECT_AFTER,
+        eject_backoff: float = DEFAULT_EJECT_BACKOFF,
+        max_eject_backoff: float = DEFAULT_MAX_EJECT_BACKOFF,
+    ):
+        """Init MultiHTTPProvider."""
+        super().__init__(
+            endpoints, latency_alpha, hedge_percentile, hedge_min_samples, eject_after, eject_backoff, max_eject_backoff
+        )
+        self.providers = [
+            HTTPProvider(
+                endpoint,
+                timeout=timeout,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                trace_hook=trace_hook,
+                rate_limit=rate_limit,
+                method_rate_limits=method_rate_limits,
+                retry_policy=retry_policy,
+                response_cache=response_cache,
+            )
+            for endpoint in endpoints
+        ]
+        self.timeout = timeout
+        # Hedged requests run on this pool; one worker per pooled connection.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_workers = pool_maxsize * len(self.providers)
+
+    def __str__(self) -> str:
+        """String definition for MultiHTTPProvider."""
+        return f"HTTP RPC connection to {', '.join(stats.endpoint for stats in self.stats)}"
+
+    def make_request(self, method: RPCMethod, *params: Any) -> RPCResponse:
+        """Make an HTTP request to the best endpoint, hedging and failing over if `method` is a read."""
+        return self._route(lambda provider: provider.make_request(method, *params), _is_read(method))
+
+    def make_batch_request(self, reqs: Sequence[Tuple[Any, ...]]) -> List[RPCResponse]:
+        """Send several JSON-RPC requests in one HTTP POST to the best endpoint.
+
+        The batch is hedged and failed over like a single read if every request in it is a read.
+
+        Args:
+            reqs: Requests to send, each a tuple of the RPC method followed by its params.
+
+        Returns:
+            The responses, in the same order as `reqs`.
+        """
+        if not reqs:
+            return []
+        return self._route(lambda provider: provider.make_batch_request(reqs), all(_is_read(req[0]) for req in reqs))
+
+    def stream_request(self, method: RPCMethod, *params: Any) -> Iterator[bytes]:
+        """Stream the response body of a request to the best endpoint. Streamed requests are not hedged."""
+        idx = self._ranked(())[0]
+        return self.providers[idx].stream_request(method, *params)
+
+    def is_connected(self) -> bool:
+        """Health check; True if any endpoint is healthy."""
+        return any(provider.is_connected() for provider in self.providers)
+
+    def _call(self, idx: int, call: Callable[[HTTPProvider], _T]) -> _T:
+        started = perf_counter()
+        try:
+            result = call(self.providers[idx])
+        except SolanaRpcException as err:
+            self._record_failure(idx, err)
+            raise
+        self._record_success(idx, perf_counter() - started)
+        return result
+
+    def _route(self, call: Callable[[HTTPProvider], _T], is_read: bool) -> _T:
+        idx = self._ranked(())[0]
+        if not is_read:
+            return self._call(idx, call)
+        tried = [idx]
+        delay = self._hedge_delay(idx)
+        if delay is None:
+            while True:
+                try:
+                    return self._call(idx, call)
+                except SolanaRpcException:
+                    next_idx = self._select(tried)
+                    if next_idx is None:
+                        raise
+                    idx = next_idx
+                    tried.append(idx)
+        return self._hedged(call, idx, delay, tried)
+
+    def _hedged(self, call: Callable[[HTTPProvider], _T], idx: int, delay: float, tried: List[int]) -> _T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="rpc-hedge")
+        executor = self._executor
+
+        def attempt(endpoint_idx: int) -> _T:
+            return self._call(endpoint_idx, call)
+
+        pending: Set[Future[_T]] = {executor.submit(attempt, idx)}
+        timeout: Optional[float] = delay
+        last_error: Optional[BaseException] = None
+        while True:
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # The request is slower than usual for its endpoint: race it against the next one.
+                timeout = None
+                next_idx = self._select(tried)
+                if next_idx is not None:
+                    self.hedges += 1
+                    tried.append(next_idx)
+                    pending.add(executor.submit(attempt, next_idx))
+                continue
+            for future in done:
+                pending.discard(future)
+                last_error = future.exception()
+                if last_error is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+            if not pending:
+                next_idx = self._select(tried)
+                if next_idx is None:
+                    raise cast(BaseException, last_error)
+                tried.append(next_idx)
+                pending.add(executor.submit(attempt, next_idx))
+
+    def __enter__(self) -> "MultiHTTPProvider":
+        """Use as a context manager."""
+        return self
+
+    def __exit__(self, _exc_type, _exc, _tb):
+        """Exits the context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the sessions of every endpoint."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        for provider in self.providers:
+            provider.close()
@@ -0,0 +1,212 @@
+"""Client-side rate limiting of RPC requests."""
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep, time
+from typing import AsyncIterator, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from ..types import RPCMethod
+
+DEFAULT_RETRY_AFTER = 1.0
+"""Seconds to pause after a 429 response without a usable `Retry-After` header."""
+MAX_THROTTLED_RETRIES = 5
+"""Number of times a request rejected with 429 is queued again before the response is returned."""
+
+
+class RateLimit(NamedTuple):
+    """Client-side limits on RPC requests.
+
+    Example:
+        >>> heavy = RateLimit(requests_per_second=2, max_in_flight=1)
+        >>> heavy.requests_per_second
+        2
+    """
+
+    requests_per_second: Optional[float] = None
+    """Sustained request rate; None for no rate limit. Every call in a batch counts as one request."""
+    burst: Optional[int] = None
+    """Number of requests that can be sent at once after idling. Defaults to one second's worth."""
+    max_in_flight: Optional[int] = None
+    """Maximum number of HTTP requests awaiting a response at a time; None for no limit."""
+
+
+class _TokenBucket:  # pylint: disable=too-few-public-methods
+    """Token bucket that hands out reservations, so callers can wait without holding the lock."""
+
+    def __init__(self, rate: float, burst: Optional[int]) -> None:
+        if rate <= 0:
+            raise ValueError(f"requests_per_second must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = monotonic()
+
+    def reserve(self, count: int, now: float) -> float:
+        """Take `count` tokens, going into debt if needed. Returns the seconds until the debt is paid off."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= count
+        return max(0.0, -self._tokens / self.rate)
+
+
+class _RateLimiterCore:  # pylint: disable=too-few-public-methods
+    max_throttled_retries = MAX_THROTTLED_RETRIES
+
+    def __init__(self, rate_limit: Optional[RateLimit], method_rate_limits: Optional[Mapping[str, RateLimit]]) -> None:
+        self.rate_limit = rate_limit or RateLimit()
+        self.method_rate_limits = dict(method_rate_limits or {})
+        self._lock = threading.Lock()
+        self._buckets: Dict[Optional[str], _TokenBucket] = {}
+        for key, limit in self._limits():
+            if limit.requests_per_second is not None:
+                self._buckets[key] = _TokenBucket(limit.requests_per_second, limit.burst)
+        self._paused_until = 0.0
+        self.throttled = 0
+        """Number of 429 responses received."""
+
+    def _limits(self) -> Iterator[Tuple[Optional[str], RateLimit]]:
+        """The global limit, keyed by None, followed by the per-method limits."""
+        yield None, self.rate_limit
+        yield from self.method_rate_limits.items()
+
+    def _concurrency_keys(self, methods: Sequence[RPCMethod]) -> List[Optional[str]]:
+        """Keys of the in-flight limits a request counts against, in a fixed order so they never deadlock."""
+        keys: List[Optional[str]] = [None] if self.rate_limit.max_in_flight is not None else []
+        for method in sorted(set(methods)):
+            limit = self.method_rate_limits.get(method)
+            if limit is not None and limit.max_in_flight is not None:
+                keys.append(method)
+        return keys
+
+    def _reserve(self, methods: Sequence[RPCMethod]) -> float:
+        """Take tokens for every call in the request. Returns the seconds to wait before sending it."""
+        now = monotonic()
+        with self._lock:
+            wait = max(0.0, self._paused_until - now)
+            bucket = self._buckets.get(None)
+            if bucket is not None:
+                wait = max(wait, bucket.reserve(len(methods), now))
+            for method in set(methods):
+                bucket = self._buckets.get(method)
+                if bucket is not None:
+                    wait = max(wait, bucket.reserve(methods.count(method), now))
+        return wait
+
+    def _pause_remaining(self) -> float:
+        return max(0.0, self._paused_until - monotonic())
+
+    def throttle(self, status_code: int, retry_after: Optional[str]) -> Optional[float]:
+        """Handle the status of a response.
+
+        Args:
+            status_code: The HTTP status code.
+            retry_after: The `Retry-After` header, if any.
+
+        Returns:
+            None if the request was not throttled. Otherwise every request is paused for the
+            `Retry-After` delay, which is returned.
+        """
+        if status_code != 429:
+            return None
+        delay = _parse_retry_after(retry_after)
+        with self._lock:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, monotonic() + delay)
+        return delay
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Parse a `Retry-After` header holding either seconds or an HTTP date."""
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class RateLimiter(_RateLimiterCore):
+    """Token bucket rate limits and in-flight caps for a synchronous provider.
+
+    Requests over the limits are queued instead of failing. A 429 response pauses every request
+    for its `Retry-After` delay.
+
+    Args:
+        rate_limit: (optional) Limits on all requests.
+        method_rate_limits: (optional) Additional limits per RPC method, e.g. `{"getProgramAccounts": ...}`.
+    """
+
+    def __init__(
+        self, rate_limit: Optional[RateLimit] = None, method_rate_limits: Optional[Mapping[str, RateLimit]] = None
+    ) -> None:
+        """Init RateLimiter."""
+        super().__init__(rate_limit, method_rate_limits)
+        self._semaphores = {
+            key: threading.BoundedSemaphore(limit.max_in_flight)
+            for key, limit in self._limits()
+            if limit.max_in_flight is not None
+        }
+
+    @contextmanager
+    def slot(self, methods: Sequence[RPCMethod]) -> Iterator[None]:
+        """Wait until a request of `methods` may be sent, and count it as in flight while the block runs."""
+        sleep(self._reserve(methods))
+        while self._pause_remaining():
+            sleep(self._pause_remaining())
+        acquired: List[threading.BoundedSemaphore] = []
+        try:
+            for key in self._concurrency_keys(methods):
+                semaphore = self._semaphores[key]
+                semaphore.acquire()
+                acquired.append(semaphore)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+
+class AsyncRateLimiter(_RateLimiterCore):
+    """Token bucket rate limits and in-flight caps for an async provider.
+
+    Behaves like `RateLimiter`, but waits without blocking the event loop.
+
+    Args:
+        rate_limit: (optional) Limits on all requests.
+        method_rate_limits: (optional) Additional limits per RPC method, e.g. `{"getProgramAccounts": ...}`.
+    """
+
+    def __init__(
+        self, rate_limit: Optional[RateLimit] = None, method_rate_limits: Optional[Mapping[str, RateLimit]] = None
+    ) -> None:
+        """Init AsyncRateLimiter."""
+        super().__init__(rate_limit, method_rate_limits)
+        # Created on first use, so they belong to the event loop the provider runs in.
+        self._semaphores: Optional[Dict[Optional[str], asyncio.Semaphore]] = None
+
+    @asynccontextmanager
+    async def slot(self, methods: Sequence[RPCMethod]) -> AsyncIterator[None]:
+        """Wait until a request of `methods` may be sent, and count it as in flight while the block runs."""
+        await asyncio.sleep(self._reserve(methods))
+        while self._pause_remaining():
+            await asyncio.sleep(self._pause_remaining())
+        if self._semaphores is None:
+            self._semaphores = {
+                key: asyncio.Semaphore(limit.max_in_flight)
+                for key, limit in self._limits()
+                if limit.max_in_flight is not None
+            }
+        acquired: List[asyncio.Semaphore] = []
+        try:
+            for key in self._concurrency_keys(methods):
+                semaphore = self._semaphores[key]
+                await semaphore.acquire()
+                acquired.append(semaphore)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
@@ -0,0 +1,126 @@
+"""Retries of idempotent RPC requests that failed transiently."""
+import random
+import threading
+from time import monotonic
+from typing import Iterable, Optional, Sequence, Union
+
+import httpx
+import requests
+
+from ..types import RPCMethod
+from .core import _is_read
+from .rate_limit import _parse_retry_after
+
+DEFAULT_MAX_RETRIES = 3
+"""Default number of times a request is retried."""
+DEFAULT_BACKOFF = 0.1
+"""Default upper bound in seconds of the delay before the first retry."""
+DEFAULT_MAX_BACKOFF = 5.0
+"""Default cap in seconds of the delay between two attempts."""
+DEFAULT_DEADLINE = 30.0
+"""Default time in seconds after the first attempt past which no retry is started."""
+DEFAULT_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+"""HTTP status codes that are retried by default."""
+
+_Response = Union[requests.Response, httpx.Response]
+
+
+class RetryPolicy:  # pylint: disable=too-many-instance-attributes
+    """When and how often the HTTP providers retry a failed request.
+
+    Only idempotent requests are retried: by default every `get*` method, so `sendTransaction` and
+    `requestAirdrop` are never sent twice. A batch is retried only if every call in it is idempotent.
+    Connection errors, timeouts and the HTTP statuses in `retry_statuses` are retried, after a delay drawn
+    uniformly from zero to `backoff * 2 ** attempt` (capped at `max_backoff`) or after the response's
+    `Retry-After` delay if that is longer.
+
+    Args:
+        max_retries: Number of times a request is retried.
+        backoff: Upper bound in seconds of the delay before the first retry.
+        max_backoff: Cap in seconds of the delay between two attempts.
+        deadline: Seconds after the first attempt past which no retry is started.
+        retry_statuses: HTTP status codes to retry.
+
+    Example:
+        >>> from solana.rpc.api import Client
+        >>> policy = RetryPolicy(max_retries=5, deadline=10)
+        >>> client = Client("http://localhost:8899", retry_policy=policy)
+        >>> client.get_slot()  # doctest: +SKIP
+        >>> policy.retries, policy.recovered, policy.exhausted  # doctest: +SKIP
+        (2, 1, 0)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        deadline: float = DEFAULT_DEADLINE,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+    ) -> None:
+        """Init RetryPolicy."""
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retries = 0
+        """Number of retries sent."""
+        self.recovered = 0
+        """Number of requests that succeeded after at least one retry."""
+        self.exhausted = 0
+        """Number of retryable requests that still failed when retries or the deadline ran out."""
+        self._lock = threading.Lock()
+
+    # A method rather than a function so that subclasses can override it.
+    def is_idempotent(self, method: RPCMethod) -> bool:  # pylint: disable=no-self-use
+        """Whether `method` can safely be sent again. Override to classify methods differently."""
+        return _is_read(method)
+
+    def retry_delay(
+        self, methods: Sequence[RPCMethod], err: Exception, attempt: int, started: float
+    ) -> Optional[float]:
+        """Decide whether to retry a failed request.
+
+        Args:
+            methods: The RPC methods in the request.
+            err: The transport or HTTP status error it failed with.
+            attempt: Number of retries already sent.
+            started: `time.monotonic()` of the first attempt.
+
+        Returns:
+            The seconds to wait before retrying, or None to give up.
+        """
+        if not all(self.is_idempotent(method) for method in methods):
+            return None
+        response = _error_response(err)
+        if response is not None:
+            if response.status_code not in self.retry_statuses:
+                return None
+        elif not isinstance(err, (requests.ConnectionError, requests.Timeout, httpx.TransportError)):
+            return None
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            delay = max(delay, _parse_retry_after(retry_after))
+        if attempt >= self.max_retries or monotonic() + delay - started > self.deadline:
+            with self._lock:
+                self.exhausted += 1
+            return None
+        with self._lock:
+            self.retries += 1
+        return delay
+
+    def record_success(self, attempt: int) -> None:
+        """Count a request that succeeded after `attempt` retries."""
+        if attempt:
+            with self._lock:
+                self.recovered += 1
+
+
+def _error_response(err: Exception) -> Optional[_Response]:
+    if isinstance(err, requests.HTTPError):
+        return err.response
+    if isinstance(err, httpx.HTTPStatusError):
+        return err.response
+    return None
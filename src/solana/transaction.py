@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, List, NamedTuple, NewType, Optional, Sequence, Tuple, Union
+from typing import Any, Iterable, List, NamedTuple, NewType, Optional, Sequence, Set, Tuple, Union
 
 from solders import instruction
 from solders.hash import Hash
@@ -152,6 +152,20 @@ def _decompile_instructions(msg: SoldersMessage) -> List[TransactionInstruction]
     return [TransactionInstruction.from_solders(ixn) for ixn in decompiled_instructions]
 
 
+def _collect_instructions(
+    args: Sequence[Union[Transaction, TransactionBuilder, TransactionInstruction]]
+) -> List[TransactionInstruction]:
+    instructions: List[TransactionInstruction] = []
+    for arg in args:
+        if isinstance(arg, (Transaction, TransactionBuilder)):
+            instructions.extend(arg.instructions)
+        elif isinstance(arg, TransactionInstruction):
+            instructions.append(arg)
+        else:
+            raise ValueError("invalid instruction:", arg)
+    return instructions
+
+
 class Transaction:
     """Transaction class to represent an atomic transaction.
 
@@ -254,24 +268,20 @@ class Transaction:
         """
         return self._solders.signatures[0]
 
-    def add(self, *args: Union[Transaction, TransactionInstruction]) -> Transaction:
+    def add(self, *args: Union[Transaction, TransactionBuilder, TransactionInstruction]) -> Transaction:
         """Add one or more instructions to this Transaction.
 
+        Every call recompiles the underlying message, so prefer `TransactionBuilder`
+        when adding many instructions one at a time.
+
         Args:
             *args: The instructions to add to this Transaction.
-                If a `Transaction` is passsed, the instructions will be extracted from it.
+                If a `Transaction` or `TransactionBuilder` is passsed, the instructions will be extracted from it.
 
         Returns:
             The transaction with the added instructions.
         """
-        for arg in args:
-            if isinstance(arg, Transaction):
-                self.instructions = self.instructions + arg.instructions
-            elif isinstance(arg, TransactionInstruction):
-                self.instructions = (*self.instructions, arg)
-            else:
-                raise ValueError("invalid instruction:", arg)
-
+        self.instructions = (*self.instructions, *_collect_instructions(args))
         return self
 
     def compile_message(self) -> Message:  # pylint: disable=too-many-locals
@@ -424,3 +434,242 @@ class Transaction:
         """
         message_underlying = message.to_solders()
         return cls.from_solders(SoldersTx.populate(message_underlying, signatures))
+
+
+class TransactionBuilder:
+    """Collects instructions and compiles them into a `Transaction` only once.
+
+    Every mutation of a `Transaction` recompiles its message, so adding `n` instructions one by one
+    costs `O(n^2)`. The builder just stores the instructions and fields and compiles them when
+    `build` or `sign` is called.
+
+    Args:
+        recent_blockhash: A recent transaction id.
+        nonce_info: Nonce information.
+            If populated, transaction will use a durable Nonce hash instead of a `recent_blockhash`.
+        fee_payer: The transaction fee payer.
+        instructions: The instructions to be executed in this transaction.
+
+    Example:
+        >>> from solana.keypair import Keypair
+        >>> from solana.publickey import PublicKey
+        >>> from solana.system_program import transfer, TransferParams
+        >>> sender = Keypair.from_seed(bytes(PublicKey(1)))
+        >>> builder = TransactionBuilder(recent_blockhash=Blockhash(str(PublicKey(3))))
+        >>> for i in range(10):
+        ...     _ = builder.add(transfer(TransferParams(from_pubkey=sender.public_key, to_pubkey=PublicKey(i + 2), lamports=1)))
+        >>> len(builder.sign(sender).instructions)
+        10
+    """  # noqa: E501 pylint: disable=line-too-long
+
+    def __init__(
+        self,
+        recent_blockhash: Optional[Blockhash] = None,
+        nonce_info: Optional[NonceInformation] = None,
+        fee_payer: Optional[PublicKey] = None,
+        instructions: Optional[Sequence[TransactionInstruction]] = None,
+    ) -> None:
+        """Init transaction builder object."""
+        self.recent_blockhash = recent_blockhash
+        """The blockhash to compile the transaction with."""
+        self.nonce_info = nonce_info
+        """Nonce information. Takes precedence over `recent_blockhash`."""
+        self.fee_payer = fee_payer
+        """The transaction fee payer. When unset, the first signer account found in the instructions' metas pays."""
+        self.instructions: List[TransactionInstruction] = [] if instructions is None else list(instructions)
+        """The instructions collected so far."""
+
+    def __len__(self) -> int:
+        """Number of instructions collected so far."""
+        return len(self.instructions)
+
+    def add(self, *args: Union[Transaction, TransactionBuilder, TransactionInstruction]) -> TransactionBuilder:
+        """Add one or more instructions without compiling anything.
+
+        Args:
+            *args: The instructions to add.
+                If a `Transaction` or `TransactionBuilder` is passsed, the instructions will be extracted from it.
+
+        Returns:
+            The builder with the added instructions.
+        """
+        self.instructions.extend(_collect_instructions(args))
+        return self
+
+    def build(self) -> Transaction:
+        """Compile the collected instructions into an unsigned `Transaction`.
+
+        Returns:
+            The compiled transaction.
+        """
+        return Transaction.from_solders(
+            _build_solders_tx(
+                recent_blockhash=self.recent_blockhash,
+                nonce_info=self.nonce_info,
+                fee_payer=self.fee_payer,
+                instructions=self.instructions,
+            )
+        )
+
+    def sign(self, *signers: Keypair) -> Transaction:
+        """Compile the collected instructions and sign the result.
+
+        Args:
+            *signers: The keypairs to sign with.
+
+        Returns:
+            The compiled, signed transaction.
+        """
+        txn = self.build()
+        txn.sign(*signers)
+        return txn
+
+
+def _compact_u16_size(value: int) -> int:
+    return 1 if value < 0x80 else 2 if value < 0x4000 else 3
+
+
+class TransactionSizeEstimator:
+    """Tracks the exact serialized size of a legacy transaction as instructions are added.
+
+    The size is computed from the shared account keys, the signatures, the compact-u16 length
+    prefixes and the instruction data, so nothing has to be compiled, signed or serialized.
+    Checking whether one more instruction fits costs `O(accounts of that instruction)`.
+
+    Args:
+        fee_payer: (optional) The transaction fee payer. Without one, the first signer of the
+            instructions pays, which does not change the size.
+        instructions: (optional) Instructions to start with.
+
+    Example:
+        >>> from solana.keypair import Keypair
+        >>> from solana.system_program import transfer, TransferParams
+        >>> sender = Keypair.from_seed(bytes(PublicKey(1)))
+        >>> estimator = TransactionSizeEstimator(fee_payer=sender.public_key)
+        >>> ixn = transfer(TransferParams(from_pubkey=sender.public_key, to_pubkey=PublicKey(2), lamports=1))
+        >>> estimator.fits(ixn)
+        True
+        >>> estimator.add(ixn)
+        215
+        >>> txn = Transaction(recent_blockhash=Blockhash(str(PublicKey(3)))).add(ixn)
+        >>> txn.sign(sender)
+        >>> len(txn.serialize())
+        215
+    """
+
+    def __init__(
+        self, fee_payer: Optional[PublicKey] = None, instructions: Optional[Sequence[TransactionInstruction]] = None
+    ) -> None:
+        """Init an estimator for a transaction with no instructions."""
+        self._keys: Set[PublicKey] = set()
+        self._signers: Set[PublicKey] = set()
+        if fee_payer is not None:
+            self._keys.add(fee_payer)
+            self._signers.add(fee_payer)
+        self._num_instructions = 0
+        self._instructions_size = 0
+        for ixn in instructions or ():
+            self.add(ixn)
+
+    def __len__(self) -> int:
+        """Number of instructions added so far."""
+        return self._num_instructions
+
+    @property
+    def num_signatures(self) -> int:
+        """Number of signatures the transaction requires."""
+        return len(self._signers)
+
+    @property
+    def size(self) -> int:
+        """The serialized size of the transaction in bytes."""
+        return self._size(len(self._keys), len(self._signers), self._num_instructions, self._instructions_size)
+
+    def size_with(self, ixn: TransactionInstruction) -> int:
+        """The serialized size of the transaction if `ixn` were added.
+
+        Args:
+            ixn: The candidate instruction.
+
+        Returns:
+            The size in bytes.
+        """
+        new_keys, new_signers = self._new_accounts(ixn)
+        return self._size(
+            len(self._keys) + len(new_keys),
+            len(self._signers) + len(new_signers),
+            self._num_instructions + 1,
+            self._instructions_size + self._instruction_size(ixn),
+        )
+
+    def fits(self, ixn: TransactionInstruction, limit: int = PACKET_DATA_SIZE) -> bool:
+        """Whether `ixn` can be added without the transaction exceeding `limit` bytes."""
+        return self.size_with(ixn) <= limit
+
+    def add(self, ixn: TransactionInstruction) -> int:
+        """Add an instruction.
+
+        Args:
+            ixn: The instruction to add.
+
+        Returns:
+            The new serialized size of the transaction in bytes.
+        """
+        new_keys, new_signers = self._new_accounts(ixn)
+        self._keys.update(new_keys)
+        self._signers.update(new_signers)
+        self._num_instructions += 1
+        self._instructions_size += self._instruction_size(ixn)
+        return self.size
+
+    def _new_accounts(self, ixn: TransactionInstruction) -> Tuple[Set[PublicKey], Set[PublicKey]]:
+        keys = {meta.pubkey for meta in ixn.keys}
+        keys.add(ixn.program_id)
+        signers = {meta.pubkey for meta in ixn.keys if meta.is_signer}
+        return keys - self._keys, signers - self._signers
+
+    @staticmethod
+    def _instruction_size(ixn: TransactionInstruction) -> int:
+        num_accounts, data_len = len(ixn.keys), len(ixn.data)
+        return 1 + _compact_u16_size(num_accounts) + num_accounts + _compact_u16_size(data_len) + data_len
+
+    @staticmethod
+    def _size(num_keys: int, num_signers: int, num_instructions: int, instructions_size: int) -> int:
+        message_size = (
+            3  # header
+            + _compact_u16_size(num_keys)
+            + num_keys * PublicKey.LENGTH
+            + 32  # recent blockhash
+            + _compact_u16_size(num_instructions)
+            + instructions_size
+        )
+        return _compact_u16_size(num_signers) + num_signers * SIG_LENGTH + message_size
+
+
+def pack_instructions(
+    instructions: Iterable[TransactionInstruction],
+    fee_payer: Optional[PublicKey] = None,
+    limit: int = PACKET_DATA_SIZE,
+) -> List[List[TransactionInstruction]]:
+    """Split instructions, in order, into as few groups as fit in one transaction each.
+
+    Args:
+        instructions: The instructions to pack.
+        fee_payer: (optional) The fee payer of every transaction.
+        limit: The maximum serialized size of a transaction.
+
+    Returns:
+        The instructions of each transaction. Raises `ValueError` if an instruction does not fit on its own.
+    """
+    batches: List[List[TransactionInstruction]] = []
+    estimator = TransactionSizeEstimator(fee_payer)
+    for ixn in instructions:
+        if len(estimator) > 0 and not estimator.fits(ixn, limit):
+            estimator = TransactionSizeEstimator(fee_payer)
+        if len(estimator) == 0:
+            if not estimator.fits(ixn, limit):
+                raise ValueError(f"Instruction needs {estimator.size_with(ixn)} bytes, more than the {limit} limit")
+            batches.append([])
+        estimator.add(ixn)
+        batches[-1].append(ixn)
+    return batches
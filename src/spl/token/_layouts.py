@@ -1,4 +1,5 @@
 """Token instruction layouts."""
+import struct
 from enum import IntEnum
 
 from construct import Bytes, Int8ul, Int32ul, Int64ul, Pass
@@ -72,6 +73,27 @@ INSTRUCTIONS_LAYOUT = cStruct(
     ),
 )
 
+# Precompiled `struct` equivalents of `INSTRUCTIONS_LAYOUT` for each instruction type: the type byte
+# followed by the fields of its args, in the same order.
+INSTRUCTION_STRUCTS = {
+    InstructionType.INITIALIZE_MINT: struct.Struct("<BB32sB32s"),
+    InstructionType.INITIALIZE_ACCOUNT: struct.Struct("<B"),
+    InstructionType.INITIALIZE_MULTISIG: struct.Struct("<BB"),
+    InstructionType.TRANSFER: struct.Struct("<BQ"),
+    InstructionType.APPROVE: struct.Struct("<BQ"),
+    InstructionType.REVOKE: struct.Struct("<B"),
+    InstructionType.SET_AUTHORITY: struct.Struct("<BBB32s"),
+    InstructionType.MINT_TO: struct.Struct("<BQ"),
+    InstructionType.BURN: struct.Struct("<BQ"),
+    InstructionType.CLOSE_ACCOUNT: struct.Struct("<B"),
+    InstructionType.FREEZE_ACCOUNT: struct.Struct("<B"),
+    InstructionType.THAW_ACCOUNT: struct.Struct("<B"),
+    InstructionType.TRANSFER2: struct.Struct("<BQB"),
+    InstructionType.APPROVE2: struct.Struct("<BQB"),
+    InstructionType.MINT_TO2: struct.Struct("<BQB"),
+    InstructionType.BURN2: struct.Struct("<BQB"),
+}
+
 MINT_LAYOUT = cStruct(
     "mint_authority_option" / Int32ul,
     "mint_authority" / PUBLIC_KEY_LAYOUT,
@@ -96,6 +118,11 @@ ACCOUNT_LAYOUT = cStruct(
     "close_authority" / PUBLIC_KEY_LAYOUT,
 )
 
+# Precompiled `struct` equivalents of the fixed-size layouts above, which unpack an account
+# in one C call instead of walking the `construct` tree. Fields are in the same order.
+MINT_STRUCT = struct.Struct("<I32sQBBI32s")
+ACCOUNT_STRUCT = struct.Struct("<32s32sQI32sBIQQI32s")
+
 MULTISIG_LAYOUT = cStruct(
     "m" / Int8ul,
     "n" / Int8ul,
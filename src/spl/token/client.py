@@ -2,17 +2,18 @@
 """SPL Token program client."""
 from __future__ import annotations
 
-from typing import List, Optional, Union, cast
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union, cast
 
 import spl.token.instructions as spl_token
 from solana.blockhash import Blockhash
 from solana.keypair import Keypair
 from solana.publickey import PublicKey
 from solana.rpc.api import Client
-from solana.rpc.commitment import Commitment
+from solana.rpc.commitment import Commitment, Finalized
 from solana.rpc.types import RPCResponse, TxOpts
 from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT, MULTISIG_LAYOUT
-from spl.token.core import AccountInfo, MintInfo, _TokenCore
+from spl.token.core import AccountInfo, MintInfo, TransferResult, _TokenCore
 
 
 class Token(_TokenCore):  # pylint: disable=too-many-public-methods
@@ -516,6 +517,72 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         )
         return self._conn.send_transaction(txn, *signers, opts=opts, recent_blockhash=recent_blockhash)
 
+    def batch_transfer_checked(
+        self,
+        source: PublicKey,
+        payouts: Sequence[Tuple[PublicKey, int]],
+        owner: Union[Keypair, PublicKey],
+        decimals: int,
+        multi_signers: Optional[List[Keypair]] = None,
+        opts: Optional[TxOpts] = None,
+        recent_blockhash: Optional[Blockhash] = None,
+        max_concurrency: int = 4,
+        executor: Optional[Executor] = None,
+    ) -> List[TransferResult]:
+        """Send tokens to many accounts, packing as many `transfer_checked` instructions per transaction as fit.
+
+        The payouts are split into transactions of at most `PACKET_DATA_SIZE` bytes, all signed
+        with one recent blockhash and sent with at most `max_concurrency` requests in flight. The
+        fee payer is the token's `payer`.
+
+        Args:
+            source: Public key of account to transfer tokens from.
+            payouts: (destination account, amount) pairs.
+            owner: Owner of the source account.
+            decimals: Number of decimals in transfer amount.
+            multi_signers: (optional) Signing accounts if `owner` is a multiSig.
+            opts: (optional) Transaction options.
+            recent_blockhash: (optional) a prefetched Blockhash for the transactions.
+            max_concurrency: Maximum number of transactions being sent at once.
+            executor: (optional) Executor to sign the transactions on, via `sign_and_serialize`.
+                By default they are signed in the calling thread.
+
+        Returns:
+            One result per payout, in order, with the signature of the transaction that carried it
+            or the error that prevented sending it.
+        """
+        if not payouts:
+            return []
+        batches, signers = self._batch_transfer_checked_args(source, payouts, owner, decimals, multi_signers)
+        recent_blockhash, opts = self._batch_blockhash_and_opts(recent_blockhash, opts)
+        wire_txns = self._sign_batches(batches, recent_blockhash, signers, executor)
+        outcomes = self._send_wire_txns(wire_txns, opts, max_concurrency)
+        return self._transfer_results(payouts, batches, outcomes)
+
+    def _batch_blockhash_and_opts(
+        self, recent_blockhash: Optional[Blockhash], opts: Optional[TxOpts]
+    ) -> Tuple[Blockhash, TxOpts]:
+        last_valid_block_height = None
+        if recent_blockhash is None:
+            blockhash_resp = self._conn.get_latest_blockhash(Finalized)
+            recent_blockhash = self._conn.parse_recent_blockhash(blockhash_resp)
+            last_valid_block_height = blockhash_resp["result"]["value"]["lastValidBlockHeight"]
+        if opts is None:
+            opts = TxOpts(preflight_commitment=self._conn.commitment, last_valid_block_height=last_valid_block_height)
+        return recent_blockhash, opts
+
+    def _send_wire_txns(
+        self, wire_txns: List[bytes], opts: TxOpts, max_concurrency: int
+    ) -> List[Tuple[Optional[str], Optional[Exception]]]:
+        def send(wire_txn: bytes) -> Tuple[Optional[str], Optional[Exception]]:
+            try:
+                return self._conn.send_raw_transaction(wire_txn, opts=opts)["result"], None
+            except Exception as err:  # pylint: disable=broad-except
+                return None, err
+
+        with ThreadPoolExecutor(max_workers=max(min(max_concurrency, len(wire_txns)), 1)) as pool:
+            return list(pool.map(send, wire_txns))
+
     def approve_checked(
         self,
         source: PublicKey,
@@ -2,19 +2,22 @@
 """Helper code for client.py and async_client.py."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple, Type, Union
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
 
 import solana.system_program as sp
 import spl.token.instructions as spl_token
+from solana.blockhash import Blockhash
+from solana.bulk_signing import sign_and_serialize
 from solana.keypair import Keypair
 from solana.publickey import PublicKey
 from solana.rpc.api import Client
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 from solana.rpc.types import RPCResponse, TokenAccountOpts, TxOpts
-from solana.transaction import Transaction
+from solana.transaction import Transaction, TransactionBuilder, TransactionInstruction, pack_instructions
 from solana.utils.helpers import decode_byte_string
-from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT, MULTISIG_LAYOUT  # type: ignore
+from spl.token._layouts import ACCOUNT_LAYOUT, ACCOUNT_STRUCT, MINT_LAYOUT, MINT_STRUCT, MULTISIG_LAYOUT  # type: ignore
 from spl.token.constants import WRAPPED_SOL_MINT
 
 if TYPE_CHECKING:
@@ -71,6 +74,69 @@ class MintInfo(NamedTuple):
     """ Optional authority to freeze token accounts."""
 
 
+class TransferResult(NamedTuple):
+    """The outcome of one payout of a batch transfer."""
+
+    dest: PublicKey
+    """The account the tokens were sent to."""
+    amount: int
+    """Number of tokens transferred."""
+    signature: Optional[str]
+    """Signature of the transaction carrying the transfer, if it was sent."""
+    error: Optional[Exception]
+    """Why the transaction carrying the transfer failed to send, if it did."""
+
+
+def _parse_mint_info(bytes_data: bytes) -> MintInfo:
+    """Decode `MINT_LAYOUT` data."""
+    (
+        mint_authority_option,
+        mint_authority,
+        supply,
+        decimals,
+        is_initialized,
+        freeze_authority_option,
+        freeze_authority,
+    ) = MINT_STRUCT.unpack(bytes_data)
+    return MintInfo(
+        PublicKey(mint_authority) if mint_authority_option else None,
+        supply,
+        decimals,
+        is_initialized != 0,
+        PublicKey(freeze_authority) if freeze_authority_option else None,
+    )
+
+
+def _parse_account_info(bytes_data: bytes) -> AccountInfo:
+    """Decode `ACCOUNT_LAYOUT` data."""
+    (
+        mint,
+        owner,
+        amount,
+        delegate_option,
+        delegate,
+        state,
+        is_native_option,
+        is_native,
+        delegated_amount,
+        close_authority_option,
+        close_authority,
+    ) = ACCOUNT_STRUCT.unpack(bytes_data)
+    native = is_native_option == 1
+    return AccountInfo(
+        PublicKey(mint),
+        PublicKey(owner),
+        amount,
+        PublicKey(delegate) if delegate_option else None,
+        delegated_amount if delegate_option else 0,
+        state != 0,
+        state == 2,
+        native,
+        is_native if native else None,
+        PublicKey(close_authority) if close_authority_option else None,
+    )
+
+
 class _TokenCore:  # pylint: disable=too-few-public-methods
 
     pubkey: PublicKey
@@ -347,26 +413,10 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
             raise AttributeError(f"Invalid mint owner: {owner}")
 
         bytes_data = decode_byte_string(info["result"]["value"]["data"][0])
-        if len(bytes_data) != MINT_LAYOUT.sizeof():
+        if len(bytes_data) != MINT_STRUCT.size:
             raise ValueError("Invalid mint size")
 
-        decoded_data = MINT_LAYOUT.parse(bytes_data)
-        decimals = decoded_data.decimals
-
-        if decoded_data.mint_authority_option == 0:
-            mint_authority = None
-        else:
-            mint_authority = PublicKey(decoded_data.mint_authority)
-
-        supply = decoded_data.supply
-        is_initialized = decoded_data.is_initialized != 0
-
-        if decoded_data.freeze_authority_option == 0:
-            freeze_authority = None
-        else:
-            freeze_authority = PublicKey(decoded_data.freeze_authority)
-
-        return MintInfo(mint_authority, supply, decimals, is_initialized, freeze_authority)
+        return _parse_mint_info(bytes_data)
 
     def _create_account_info(self, info: RPCResponse) -> AccountInfo:
         if not info:
@@ -376,52 +426,77 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
             raise AttributeError("Invalid account owner")
 
         bytes_data = decode_byte_string(info["result"]["value"]["data"][0])
-        if len(bytes_data) != ACCOUNT_LAYOUT.sizeof():
+        if len(bytes_data) != ACCOUNT_STRUCT.size:
             raise ValueError("Invalid account size")
 
-        decoded_data = ACCOUNT_LAYOUT.parse(bytes_data)
+        account_info = _parse_account_info(bytes_data)
+        if account_info.mint != self.pubkey:
+            raise AttributeError(f"Invalid account mint: {account_info.mint} != {self.pubkey}")
 
-        mint = PublicKey(decoded_data.mint)
-        owner = PublicKey(decoded_data.owner)
-        amount = decoded_data.amount
+        return account_info
 
-        if decoded_data.delegate_option == 0:
-            delegate = None
-            delegated_amount = 0
+    def _batch_transfer_checked_args(
+        self,
+        source: PublicKey,
+        payouts: Sequence[Tuple[PublicKey, int]],
+        owner: Union[Keypair, PublicKey],
+        decimals: int,
+        multi_signers: Optional[List[Keypair]],
+    ) -> Tuple[List[List[TransactionInstruction]], List[Keypair]]:
+        if isinstance(owner, Keypair):
+            owner_pubkey, multisig_signers = owner.public_key, []
+            signers = [self.payer, owner]
         else:
-            delegate = PublicKey(decoded_data.delegate)
-            delegated_amount = decoded_data.delegated_amount
+            owner_pubkey, multisig_signers = owner, multi_signers or []
+            signers = [self.payer, *multisig_signers]
 
-        is_initialized = decoded_data.state != 0
-        is_frozen = decoded_data.state == 2
+        def transfer(dest: PublicKey, amount: int) -> TransactionInstruction:
+            return spl_token.transfer_checked(
+                spl_token.TransferCheckedParams(
+                    program_id=self.program_id,
+                    source=source,
+                    mint=self.pubkey,
+                    dest=dest,
+                    owner=owner_pubkey,
+                    amount=amount,
+                    decimals=decimals,
+                    signers=[signer.public_key for signer in multisig_signers],
+                )
+            )
 
-        if decoded_data.is_native_option == 1:
-            rent_exempt_reserve = decoded_data.is_native
-            is_native = True
-        else:
-            rent_exempt_reserve = None
-            is_native = False
+        batches = pack_instructions([transfer(dest, amount) for dest, amount in payouts], self.payer.public_key)
+        unique_signers = list({bytes(signer.public_key): signer for signer in signers}.values())
+        return batches, unique_signers
 
-        if decoded_data.close_authority_option == 0:
-            close_authority = None
-        else:
-            close_authority = PublicKey(decoded_data.owner)
-
-        if mint != self.pubkey:
-            raise AttributeError(f"Invalid account mint: {decoded_data.mint} != {self.pubkey}")
-
-        return AccountInfo(
-            mint,
-            owner,
-            amount,
-            delegate,
-            delegated_amount,
-            is_initialized,
-            is_frozen,
-            is_native,
-            rent_exempt_reserve,
-            close_authority,
-        )
+    def _sign_batches(
+        self,
+        batches: List[List[TransactionInstruction]],
+        recent_blockhash: Blockhash,
+        signers: List[Keypair],
+        executor: Optional[Executor],
+    ) -> List[bytes]:
+        fee_payer = self.payer.public_key
+        if executor is not None:
+            return list(sign_and_serialize(batches, recent_blockhash, signers, fee_payer=fee_payer, executor=executor))
+        return [
+            TransactionBuilder(recent_blockhash=recent_blockhash, fee_payer=fee_payer, instructions=batch)
+            .sign(*signers)
+            .serialize()
+            for batch in batches
+        ]
+
+    @staticmethod
+    def _transfer_results(
+        payouts: Sequence[Tuple[PublicKey, int]],
+        batches: List[List[TransactionInstruction]],
+        outcomes: Sequence[Tuple[Optional[str], Optional[Exception]]],
+    ) -> List[TransferResult]:
+        results = []
+        payouts_iter = iter(payouts)
+        for batch, (signature, error) in zip(batches, outcomes):
+            for _, (dest, amount) in zip(batch, payouts_iter):
+                results.append(TransferResult(dest, amount, signature, error))
+        return results
 
     def _approve_args(
         self,
@@ -1,16 +1,23 @@
 """SPL token instructions."""  # pylint: disable=too-many-lines
 
+import struct
+from concurrent.futures import Executor
 from enum import IntEnum
-from typing import Any, List, NamedTuple, Optional, Union
+from functools import lru_cache
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple, Union
 
+from solana.program_address import DEFAULT_CHUNK_SIZE, ProgramAddressCache, find_program_addresses
 from solana.publickey import PublicKey
 from solana.system_program import SYS_PROGRAM_ID
 from solana.sysvar import SYSVAR_RENT_PUBKEY
 from solana.transaction import AccountMeta, TransactionInstruction
-from solana.utils.validate import validate_instruction_keys, validate_instruction_type
-from spl.token._layouts import INSTRUCTIONS_LAYOUT, InstructionType
+from solana.utils.validate import validate_instruction_keys
+from spl.token._layouts import INSTRUCTION_STRUCTS, InstructionType
 from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
 
+ASSOCIATED_TOKEN_ADDRESS_CACHE_SIZE = 65536
+"""Maximum number of (owner, mint) pairs whose associated token address is memoized."""
+
 
 class AuthorityType(IntEnum):
     """Specifies the authority type for SetAuthority instructions."""
@@ -294,11 +301,19 @@ def __parse_and_validate_instruction(
     instruction: TransactionInstruction,
     expected_keys: int,
     expected_type: InstructionType,
-) -> Any:  # Returns a Construct container.
+) -> Tuple[Any, ...]:  # Returns the instruction args, in layout order.
     validate_instruction_keys(instruction, expected_keys)
-    data = INSTRUCTIONS_LAYOUT.parse(instruction.data)
-    validate_instruction_type(data, expected_type)
-    return data
+    data = instruction.data
+    if data and data[0] != expected_type:
+        raise ValueError(f"invalid instruction; instruction index mismatch {data[0]} != {expected_type}")
+    try:
+        return INSTRUCTION_STRUCTS[expected_type].unpack_from(data)[1:]
+    except struct.error as err:
+        raise ValueError(f"invalid instruction data: {err}") from err
+
+
+def __encode_instruction(instruction_type: InstructionType, *args: Any) -> bytes:
+    return INSTRUCTION_STRUCTS[instruction_type].pack(instruction_type, *args)
 
 
 def decode_initialize_mint(instruction: TransactionInstruction) -> InitializeMintParams:
@@ -310,15 +325,15 @@ def decode_initialize_mint(instruction: TransactionInstruction) -> InitializeMin
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MINT)
+    decimals, mint_authority, freeze_authority_option, freeze_authority = __parse_and_validate_instruction(
+        instruction, 2, InstructionType.INITIALIZE_MINT
+    )
     return InitializeMintParams(
-        decimals=parsed_data.args.decimals,
+        decimals=decimals,
         program_id=instruction.program_id,
         mint=instruction.keys[0].pubkey,
-        mint_authority=PublicKey(parsed_data.args.mint_authority),
-        freeze_authority=PublicKey(parsed_data.args.freeze_authority)
-        if parsed_data.args.freeze_authority_option
-        else None,
+        mint_authority=PublicKey(mint_authority),
+        freeze_authority=PublicKey(freeze_authority) if freeze_authority_option else None,
     )
 
 
@@ -349,8 +364,7 @@ def decode_initialize_multisig(instruction: TransactionInstruction) -> Initializ
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MULTISIG)
-    num_signers = parsed_data.args.m
+    (num_signers,) = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MULTISIG)
     validate_instruction_keys(instruction, 2 + num_signers)
     return InitializeMultisigParams(
         program_id=instruction.program_id,
@@ -369,14 +383,14 @@ def decode_transfer(instruction: TransactionInstruction) -> TransferParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.TRANSFER)
+    (amount,) = __parse_and_validate_instruction(instruction, 3, InstructionType.TRANSFER)
     return TransferParams(
         program_id=instruction.program_id,
         source=instruction.keys[0].pubkey,
         dest=instruction.keys[1].pubkey,
         owner=instruction.keys[2].pubkey,
         signers=[signer.pubkey for signer in instruction.keys[3:]],
-        amount=parsed_data.args.amount,
+        amount=amount,
     )
 
 
@@ -389,14 +403,14 @@ def decode_approve(instruction: TransactionInstruction) -> ApproveParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.APPROVE)
+    (amount,) = __parse_and_validate_instruction(instruction, 3, InstructionType.APPROVE)
     return ApproveParams(
         program_id=instruction.program_id,
         source=instruction.keys[0].pubkey,
         delegate=instruction.keys[1].pubkey,
         owner=instruction.keys[2].pubkey,
         signers=[signer.pubkey for signer in instruction.keys[3:]],
-        amount=parsed_data.args.amount,
+        amount=amount,
     )
 
 
@@ -427,12 +441,14 @@ def decode_set_authority(instruction: TransactionInstruction) -> SetAuthorityPar
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.SET_AUTHORITY)
+    authority_type, new_authority_option, new_authority = __parse_and_validate_instruction(
+        instruction, 2, InstructionType.SET_AUTHORITY
+    )
     return SetAuthorityParams(
         program_id=instruction.program_id,
         account=instruction.keys[0].pubkey,
-        authority=AuthorityType(parsed_data.args.authority_type),
-        new_authority=PublicKey(parsed_data.args.new_authority) if parsed_data.args.new_authority_option else None,
+        authority=AuthorityType(authority_type),
+        new_authority=PublicKey(new_authority) if new_authority_option else None,
         current_authority=instruction.keys[1].pubkey,
         signers=[signer.pubkey for signer in instruction.keys[2:]],
     )
@@ -447,10 +463,10 @@ def decode_mint_to(instruction: TransactionInstruction) -> MintToParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO)
+    (amount,) = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO)
     return MintToParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
+        amount=amount,
         mint=instruction.keys[0].pubkey,
         dest=instruction.keys[1].pubkey,
         mint_authority=instruction.keys[2].pubkey,
@@ -467,10 +483,10 @@ def decode_burn(instruction: TransactionInstruction) -> BurnParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN)
+    (amount,) = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN)
     return BurnParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
+        amount=amount,
         account=instruction.keys[0].pubkey,
         mint=instruction.keys[1].pubkey,
         owner=instruction.keys[2].pubkey,
@@ -544,11 +560,11 @@ def decode_transfer_checked(instruction: TransactionInstruction) -> TransferChec
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 4, InstructionType.TRANSFER2)
+    amount, decimals = __parse_and_validate_instruction(instruction, 4, InstructionType.TRANSFER2)
     return TransferCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
+        amount=amount,
+        decimals=decimals,
         source=instruction.keys[0].pubkey,
         mint=instruction.keys[1].pubkey,
         dest=instruction.keys[2].pubkey,
@@ -566,11 +582,11 @@ def decode_approve_checked(instruction: TransactionInstruction) -> ApproveChecke
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 4, InstructionType.APPROVE2)
+    amount, decimals = __parse_and_validate_instruction(instruction, 4, InstructionType.APPROVE2)
     return ApproveCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
+        amount=amount,
+        decimals=decimals,
         source=instruction.keys[0].pubkey,
         mint=instruction.keys[1].pubkey,
         delegate=instruction.keys[2].pubkey,
@@ -588,11 +604,11 @@ def decode_mint_to_checked(instruction: TransactionInstruction) -> MintToChecked
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO2)
+    amount, decimals = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO2)
     return MintToCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
+        amount=amount,
+        decimals=decimals,
         mint=instruction.keys[0].pubkey,
         dest=instruction.keys[1].pubkey,
         mint_authority=instruction.keys[2].pubkey,
@@ -609,11 +625,11 @@ def decode_burn_checked(instruction: TransactionInstruction) -> BurnCheckedParam
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN2)
+    amount, decimals = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN2)
     return BurnCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
+        amount=amount,
+        decimals=decimals,
         account=instruction.keys[0].pubkey,
         mint=instruction.keys[1].pubkey,
         owner=instruction.keys[2].pubkey,
@@ -643,7 +659,7 @@ def __burn_instruction(params: Union[BurnParams, BurnCheckedParams], data: Any)
 def __freeze_or_thaw_instruction(
     params: Union[FreezeAccountParams, ThawAccountParams], instruction_type: InstructionType
 ) -> TransactionInstruction:
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=instruction_type, args=None))
+    data = __encode_instruction(instruction_type)
     keys = [
         AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
         AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
@@ -688,16 +704,8 @@ def initialize_mint(params: InitializeMintParams) -> TransactionInstruction:
         The instruction to initialize the mint.
     """  # noqa: E501 # pylint: disable=line-too-long
     freeze_authority, opt = (params.freeze_authority, 1) if params.freeze_authority else (PublicKey(0), 0)
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(
-            instruction_type=InstructionType.INITIALIZE_MINT,
-            args=dict(
-                decimals=params.decimals,
-                mint_authority=bytes(params.mint_authority),
-                freeze_authority_option=opt,
-                freeze_authority=bytes(freeze_authority),
-            ),
-        )
+    data = __encode_instruction(
+        InstructionType.INITIALIZE_MINT, params.decimals, bytes(params.mint_authority), opt, bytes(freeze_authority)
     )
     return TransactionInstruction(
         keys=[
@@ -731,7 +739,7 @@ def initialize_account(params: InitializeAccountParams) -> TransactionInstructio
     Returns:
         The instruction to initialize the account.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.INITIALIZE_ACCOUNT, args=None))
+    data = __encode_instruction(InstructionType.INITIALIZE_ACCOUNT)
     return TransactionInstruction(
         keys=[
             AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
@@ -768,7 +776,7 @@ def initialize_multisig(params: InitializeMultisigParams) -> TransactionInstruct
     Returns:
         The instruction to initialize the multisig.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.INITIALIZE_MULTISIG, args=dict(m=params.m)))
+    data = __encode_instruction(InstructionType.INITIALIZE_MULTISIG, params.m)
     keys = [
         AccountMeta(pubkey=params.multisig, is_signer=False, is_writable=True),
         AccountMeta(pubkey=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
@@ -800,7 +808,7 @@ def transfer(params: TransferParams) -> TransactionInstruction:
     Returns:
         The transfer instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.TRANSFER, args=dict(amount=params.amount)))
+    data = __encode_instruction(InstructionType.TRANSFER, params.amount)
     keys = [
         AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
         AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
@@ -829,7 +837,7 @@ def approve(params: ApproveParams) -> TransactionInstruction:
     Returns:
         The approve instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.APPROVE, args=dict(amount=params.amount)))
+    data = __encode_instruction(InstructionType.APPROVE, params.amount)
     keys = [
         AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
         AccountMeta(pubkey=params.delegate, is_signer=False, is_writable=False),
@@ -854,7 +862,7 @@ def revoke(params: RevokeParams) -> TransactionInstruction:
     Returns:
         The revoke instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.REVOKE, args=None))
+    data = __encode_instruction(InstructionType.REVOKE)
     keys = [AccountMeta(pubkey=params.account, is_signer=False, is_writable=True)]
     __add_signers(keys, params.owner, params.signers)
 
@@ -883,12 +891,7 @@ def set_authority(params: SetAuthorityParams) -> TransactionInstruction:
         The set authority instruction.
     """
     new_authority, opt = (params.new_authority, 1) if params.new_authority else (PublicKey(0), 0)
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(
-            instruction_type=InstructionType.SET_AUTHORITY,
-            args=dict(authority_type=params.authority, new_authority_option=opt, new_authority=bytes(new_authority)),
-        )
-    )
+    data = __encode_instruction(InstructionType.SET_AUTHORITY, params.authority, opt, bytes(new_authority))
     keys = [AccountMeta(pubkey=params.account, is_signer=False, is_writable=True)]
     __add_signers(keys, params.current_authority, params.signers)
 
@@ -916,7 +919,7 @@ def mint_to(params: MintToParams) -> TransactionInstruction:
     Returns:
         The mint-to instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.MINT_TO, args=dict(amount=params.amount)))
+    data = __encode_instruction(InstructionType.MINT_TO, params.amount)
     return __mint_to_instruction(params, data)
 
 
@@ -935,7 +938,7 @@ def burn(params: BurnParams) -> TransactionInstruction:
     Returns:
         The burn instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.BURN, args=dict(amount=params.amount)))
+    data = __encode_instruction(InstructionType.BURN, params.amount)
     return __burn_instruction(params, data)
 
 
@@ -955,7 +958,7 @@ def close_account(params: CloseAccountParams) -> TransactionInstruction:
     Returns:
         The close-account instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.CLOSE_ACCOUNT, args=None))
+    data = __encode_instruction(InstructionType.CLOSE_ACCOUNT)
     keys = [
         AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
         AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
@@ -1020,9 +1023,7 @@ def transfer_checked(params: TransferCheckedParams) -> TransactionInstruction:
     Returns:
         The transfer-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.TRANSFER2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = __encode_instruction(InstructionType.TRANSFER2, params.amount, params.decimals)
     keys = [
         AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
         AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
@@ -1054,9 +1055,7 @@ def approve_checked(params: ApproveCheckedParams) -> TransactionInstruction:
     Returns:
         The approve-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.APPROVE2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = __encode_instruction(InstructionType.APPROVE2, params.amount, params.decimals)
     keys = [
         AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
         AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
@@ -1087,9 +1086,7 @@ def mint_to_checked(params: MintToCheckedParams) -> TransactionInstruction:
     Returns:
         The mint-to-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.MINT_TO2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = __encode_instruction(InstructionType.MINT_TO2, params.amount, params.decimals)
     return __mint_to_instruction(params, data)
 
 
@@ -1108,15 +1105,17 @@ def burn_checked(params: BurnCheckedParams) -> TransactionInstruction:
     Returns:
         The burn-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.BURN2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = __encode_instruction(InstructionType.BURN2, params.amount, params.decimals)
     return __burn_instruction(params, data)
 
 
+@lru_cache(maxsize=ASSOCIATED_TOKEN_ADDRESS_CACHE_SIZE)
 def get_associated_token_address(owner: PublicKey, mint: PublicKey) -> PublicKey:
     """Derives the associated token address for the given wallet address and token mint.
 
+    Results are memoized in a bounded LRU cache; `get_associated_token_address.cache_info()`
+    reports its hits and misses and `get_associated_token_address.cache_clear()` empties it.
+
     Returns:
         The public key of the derived associated token address.
     """
@@ -1126,6 +1125,46 @@ def get_associated_token_address(owner: PublicKey, mint: PublicKey) -> PublicKey
     return key
 
 
+def get_associated_token_addresses(
+    owners: Iterable[PublicKey],
+    mint: PublicKey,
+    executor: Optional[Executor] = None,
+    cache: Optional[ProgramAddressCache] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[PublicKey]:
+    """Derives the associated token addresses of many wallets for one token mint.
+
+    Example:
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> owners = [PublicKey(i) for i in range(1, 4)]
+        >>> addresses = get_associated_token_addresses(owners, PublicKey(9))
+        >>> addresses == [get_associated_token_address(owner, PublicKey(9)) for owner in owners]
+        True
+        >>> with ProcessPoolExecutor() as executor:  # doctest: +SKIP
+        ...     addresses = get_associated_token_addresses(owners, PublicKey(9), executor=executor)
+
+    Args:
+        owners: The wallet addresses.
+        mint: The token mint.
+        executor: (optional) Executor to derive the addresses on, in chunks of `chunk_size` owners.
+            Pass a `ProcessPoolExecutor` to use every core for large lists.
+        cache: (optional) A persistent `ProgramAddressCache` to look addresses up in first.
+        chunk_size: Number of owners per unit of work handed to `executor`.
+
+    Returns:
+        The associated token address of each owner, in order. Without `executor` or `cache`, they are
+        derived in the calling thread through the memo cache of `get_associated_token_address`.
+    """
+    if executor is None and cache is None:
+        return [get_associated_token_address(owner, mint) for owner in owners]
+    token_program, raw_mint = bytes(TOKEN_PROGRAM_ID), bytes(mint)
+    seed_sets = ([bytes(owner), token_program, raw_mint] for owner in owners)
+    derived = find_program_addresses(
+        seed_sets, ASSOCIATED_TOKEN_PROGRAM_ID, executor=executor, cache=cache, chunk_size=chunk_size
+    )
+    return [address for address, _ in derived]
+
+
 def create_associated_token_account(payer: PublicKey, owner: PublicKey, mint: PublicKey) -> TransactionInstruction:
     """Creates a transaction instruction to create an associated token account.
 
@@ -1,9 +1,15 @@
 """Fixtures for pytest."""
 import asyncio
+import json
+import socket
+import sys
+import threading
 import time
-from typing import NamedTuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
 
 import pytest
+from websockets.legacy.server import serve as ws_serve
 
 from solana.blockhash import Blockhash
 from solana.keypair import Keypair
@@ -136,6 +142,196 @@ def unit_test_http_client_async() -> AsyncClient:
     return client
 
 
+class _StubRPCHandler(BaseHTTPRequestHandler):
+    """Request handler answering JSON-RPC calls from the stub server's result table."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_StubRPCHTTPServer"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Answer a single or batched JSON-RPC request."""
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.stub.record(self.client_address, body)
+        status, payload = self.server.stub.respond(body)
+        self._reply(status, json.dumps(payload).encode())
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer health checks."""
+        self.server.stub.record(self.client_address, None)
+        self._reply(200, b"ok")
+
+    def _reply(self, status: int, data: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, val in self.server.stub.headers.items():
+            self.send_header(key, val)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: Any) -> None:  # pylint: disable=arguments-differ
+        """Keep test output quiet."""
+
+
+class _StubRPCHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubRPCServer"
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        """Ignore clients that hung up before the reply, like the losers of hedged requests."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubRPCServer:  # pylint: disable=too-many-instance-attributes
+    """Local JSON-RPC server for unit tests.
+
+    `results` maps an RPC method to its result, or to a callable taking the params and returning the result.
+    Set `status` (and optionally `headers`) to make every request fail at the HTTP level, or call
+    `fail_first` to fail only the next few.
+    """
+
+    def __init__(self) -> None:
+        """Start serving on an ephemeral localhost port."""
+        self.results: Dict[str, Any] = {}
+        self.status = 200
+        self.headers: Dict[str, str] = {}
+        self.requests: List[Any] = []
+        self.connections: Set[Tuple[str, int]] = set()
+        self._failures: List[int] = []
+        self._lock = threading.Lock()
+        self._httpd = _StubRPCHTTPServer(("127.0.0.1", 0), _StubRPCHandler)
+        self._httpd.stub = self
+        threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        """The server's HTTP endpoint."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, client_address: Tuple[str, int], body: Any) -> None:
+        """Track the request and the client connection it arrived on."""
+        with self._lock:
+            self.connections.add(client_address)
+            if body is not None:
+                self.requests.append(body)
+
+    def fail_first(self, count: int, status: int) -> None:
+        """Answer the next `count` requests with HTTP `status` before responding normally again."""
+        with self._lock:
+            self._failures += [status] * count
+
+    def respond(self, body: Any) -> Tuple[int, Any]:
+        """Build the HTTP status and JSON payload for a request body."""
+        with self._lock:
+            status = self._failures.pop(0) if self._failures else self.status
+        if status != 200:
+            return status, {"error": "stub failure"}
+        if isinstance(body, list):
+            return 200, [self._respond_one(req) for req in body]
+        return 200, self._respond_one(body)
+
+    def _respond_one(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        result = self.results.get(req["method"])
+        if isinstance(result, Exception):
+            return {"jsonrpc": "2.0", "id": req["id"], "error": {"code": -32000, "message": str(result)}}
+        if callable(result):
+            result = result(req["params"])
+        return {"jsonrpc": "2.0", "id": req["id"], "result": result}
+
+    def shutdown(self) -> None:
+        """Stop the server."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def stub_rpc_server() -> StubRPCServer:
+    """Local JSON-RPC server serving canned results."""
+    server = StubRPCServer()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def stub_rpc_servers() -> List[StubRPCServer]:
+    """Two independent local JSON-RPC servers, for multi-endpoint providers."""
+    servers = [StubRPCServer(), StubRPCServer()]
+    yield servers
+    for server in servers:
+        server.shutdown()
+
+
+@pytest.fixture
+def closed_port_url() -> str:
+    """URL of a local port nothing listens on, so connections to it are refused."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+class StubWsServer:
+    """Local RPC websocket server that notifies every signature subscription after `delay` seconds."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        """Start serving on an ephemeral localhost port."""
+        self.delay = delay
+        self.subscriptions: List[Any] = []
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(self._serve(), self._loop).result()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _serve(self) -> Any:
+        return await ws_serve(self._handler, "127.0.0.1", 0)
+
+    async def _handler(self, websocket, *_args) -> None:
+        async for raw in websocket:
+            req = json.loads(raw)
+            sub_id = len(self.subscriptions) + 1
+            self.subscriptions.append(req)
+            await websocket.send(json.dumps({"jsonrpc": "2.0", "result": sub_id, "id": req["id"]}))
+            await asyncio.sleep(self.delay)
+            notification = {
+                "jsonrpc": "2.0",
+                "method": "signatureNotification",
+                "params": {"result": {"context": {"slot": 7}, "value": {"err": None}}, "subscription": sub_id},
+            }
+            await websocket.send(json.dumps(notification))
+
+    @property
+    def url(self) -> str:
+        """The server's websocket endpoint."""
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    def shutdown(self) -> None:
+        """Stop the server."""
+
+        async def close() -> None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+@pytest.fixture
+def stub_ws_server() -> StubWsServer:
+    """Local RPC websocket server confirming signature subscriptions."""
+    server = StubWsServer()
+    yield server
+    server.shutdown()
+
+
 @pytest.fixture(scope="session")
 def _sleep_for_first_blocks() -> None:
     """Blocks 0 and 1 are unavailable so we sleep until they're done."""
@@ -1,11 +1,20 @@
+import asyncio
+import time
 from unittest.mock import patch
 
 import pytest
 from requests.exceptions import ReadTimeout
 
+import solana.system_program as sp
+from solana.blockhash import Blockhash
 from solana.exceptions import SolanaRpcException
+from solana.keypair import Keypair
 from solana.publickey import PublicKey
-from solana.rpc.commitment import Finalized
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed, Finalized
+from solana.rpc.core import RPCBroadcastException, RPCException
+from solana.rpc.types import TxOpts
+from solana.transaction import Transaction
 
 
 async def test_async_client_http_exception(unit_test_http_client_async):
@@ -64,3 +73,131 @@ def test_client_address_sig_args_with_commitment(unit_test_http_client_async):
     )
     actual = unit_test_http_client_async._get_signatures_for_address_args(PublicKey(0), None, None, 5, Finalized)
     assert expected == actual
+
+
+async def test_batch_request(stub_rpc_server):
+    """Batched calls go out in one POST and come back in call order."""
+    stub_rpc_server.results["getBlockHeight"] = 10
+    stub_rpc_server.results["getSignatureStatuses"] = lambda params: {"context": {"slot": 1}, "value": [None]}
+    async with AsyncClient(stub_rpc_server.url) as client:
+        async with client.batch() as batch:
+            batch.get_block_height()
+            batch.get_signature_statuses([bytes(64)])
+    assert len(stub_rpc_server.requests) == 1
+    assert batch.results[0]["result"] == 10
+    assert batch.results[1]["result"]["value"] == [None]
+    async with AsyncClient(stub_rpc_server.url) as client:
+        assert await client.batch().execute() == []
+
+
+async def test_get_multiple_accounts_chunked(stub_rpc_server):
+    """Large pubkey lists are fetched in concurrent chunks and merged in order."""
+    stub_rpc_server.results["getMultipleAccounts"] = lambda params: {
+        "context": {"slot": 5},
+        "value": [{"owner": key} for key in params[0]],
+    }
+    pubkeys = [str(PublicKey(i)) for i in range(205)]
+    async with AsyncClient(stub_rpc_server.url) as client:
+        resp = await client.get_multiple_accounts_chunked(pubkeys, chunk_size=50, max_concurrency=2)
+    assert len(stub_rpc_server.requests) == 5
+    assert [acc["owner"] for acc in resp["result"]["value"]] == pubkeys
+
+
+async def test_confirm_transaction_subscribe(stub_rpc_server, stub_ws_server):
+    """Confirmation resolves on the signature notification without polling."""
+    stub_rpc_server.results["getSignatureStatuses"] = {"context": {"slot": 1}, "value": [None]}
+    async with AsyncClient(stub_rpc_server.url) as client:
+        resp = await client.confirm_transaction_subscribe("5" * 87, Finalized, ws_endpoint=stub_ws_server.url)
+    assert resp["result"]["value"][0]["confirmationStatus"] == Finalized
+    assert len(stub_rpc_server.requests) == 1
+
+
+async def test_confirm_transaction_subscribe_fallback(stub_rpc_server):
+    """Without a reachable websocket endpoint confirmation falls back to polling."""
+    status = {"slot": 3, "confirmations": None, "err": None, "confirmationStatus": "confirmed"}
+    stub_rpc_server.results["getSignatureStatuses"] = {"context": {"slot": 3}, "value": [status]}
+    async with AsyncClient(stub_rpc_server.url) as client:
+        resp = await client.confirm_transaction_subscribe("5" * 87, Confirmed, ws_endpoint="ws://127.0.0.1:1")
+    assert resp["result"]["value"][0] == status
+
+
+async def test_blockhash_refresher_serves_send_path(stub_rpc_server):
+    """With the refresher running, send_transaction never fetches a blockhash itself."""
+    blockhash = str(Blockhash(PublicKey(7)))
+    stub_rpc_server.results["getLatestBlockhash"] = {
+        "context": {"slot": 7},
+        "value": {"blockhash": blockhash, "lastValidBlockHeight": 157},
+    }
+    stub_rpc_server.results["sendTransaction"] = "sig"
+    sender = Keypair()
+    params = sp.TransferParams(from_pubkey=sender.public_key, to_pubkey=sender.public_key, lamports=1)
+    txn = Transaction().add(sp.transfer(params))
+    async with AsyncClient(stub_rpc_server.url) as client:
+        await client.start_blockhash_refresher(interval=60)
+        await client.send_transaction(txn, sender, opts=TxOpts(skip_confirmation=True))
+    assert [req["method"] for req in stub_rpc_server.requests] == ["getLatestBlockhash", "sendTransaction"]
+    assert txn.recent_blockhash == blockhash
+
+
+async def test_iter_block_transactions(stub_rpc_server):
+    """Block transactions are streamed one at a time."""
+    transactions = [{"meta": {"fee": 5000 + i}, "transaction": ["", "base64"]} for i in range(20)]
+    stub_rpc_server.results["getBlock"] = {"blockhash": "abc", "transactions": transactions, "parentSlot": 0}
+    async with AsyncClient(stub_rpc_server.url) as client:
+        streamed = [txn async for txn in client.iter_block_transactions(1, encoding="base64")]
+    assert streamed == transactions
+
+
+async def test_broadcast_returns_first_success(stub_rpc_servers):
+    """A broadcast returns as soon as one endpoint accepted the transaction; the others still receive it."""
+    slow, fast = stub_rpc_servers
+
+    def slow_send(_params):
+        time.sleep(0.5)
+        return "sig"
+
+    slow.results["sendTransaction"] = slow_send
+    fast.results["sendTransaction"] = "sig"
+    async with AsyncClient(slow.url, broadcast_endpoints=[fast.url, slow.url]) as client:
+        assert len(client._broadcast_targets) == 2  # pylint: disable=protected-access
+        started = time.perf_counter()
+        resp = await client.broadcast_raw_transaction(b"wire", opts=TxOpts(skip_confirmation=True))
+        assert time.perf_counter() - started < 0.4
+    assert resp["result"] == "sig"
+    assert slow.requests[0]["params"] == fast.requests[0]["params"]
+
+
+async def test_broadcast_aggregates_errors(stub_rpc_servers):
+    """A broadcast only fails if every endpoint failed, and then reports each endpoint's error."""
+    rejecting, broken = stub_rpc_servers
+    rejecting.results["sendTransaction"] = Exception("Blockhash not found")
+    broken.status = 500
+    async with AsyncClient(rejecting.url, broadcast_endpoints=[broken.url]) as client:
+        with pytest.raises(RPCBroadcastException) as exc_info:
+            await client.broadcast_raw_transaction(b"wire", opts=TxOpts(skip_confirmation=True))
+        broken.status = 200
+        broken.results["sendTransaction"] = "sig"
+        resp = await client.broadcast_raw_transaction(b"wire", opts=TxOpts(skip_confirmation=True))
+    errors = exc_info.value.errors
+    assert isinstance(errors[rejecting.url], RPCException)
+    assert isinstance(errors[broken.url], SolanaRpcException)
+    assert resp["result"] == "sig"
+
+
+async def test_broadcast_records_cancelled_sends(stub_rpc_servers, monkeypatch):
+    """A send that is cancelled counts as a failed endpoint instead of cancelling the broadcast."""
+    cancelled, accepting = stub_rpc_servers
+    accepting.results["sendTransaction"] = "sig"
+    async with AsyncClient(cancelled.url, broadcast_endpoints=[accepting.url]) as client:
+        provider = client._broadcast_targets[0]  # pylint: disable=protected-access
+
+        async def cancel(*_args):
+            raise asyncio.CancelledError()
+
+        monkeypatch.setattr(provider, "make_request", cancel)
+        resp = await client.broadcast_raw_transaction(b"wire", opts=TxOpts(skip_confirmation=True))
+        accepting.status = 500
+        with pytest.raises(RPCBroadcastException) as exc_info:
+            await client.broadcast_raw_transaction(b"wire", opts=TxOpts(skip_confirmation=True))
+    assert resp["result"] == "sig"
+    assert "cancelled" in str(exc_info.value.errors[cancelled.url])
@@ -0,0 +1,41 @@
+"""Unit tests for BlockhashCache."""
+import pytest
+
+from solana.blockhash import MAX_PROCESSING_AGE, Blockhash, BlockhashCache, BlockhashCacheEntry
+
+
+def test_get_entry_returns_last_valid_block_height():
+    """Cache entries keep the block height metadata they were stored with."""
+    cache = BlockhashCache()
+    cache.set(Blockhash("hash1"), 10, last_valid_block_height=160)
+    assert cache.get_entry() == BlockhashCacheEntry(Blockhash("hash1"), 10, 160)
+    # The entry moved to the used cache, but is still served.
+    assert cache.get() == Blockhash("hash1")
+    assert cache.block_height == 160 - MAX_PROCESSING_AGE
+
+
+def test_newer_blockhash_evicts_expired_entries():
+    """Entries past their last valid block height are dropped when a newer blockhash arrives."""
+    cache = BlockhashCache()
+    cache.set(Blockhash("old"), 10, used_immediately=True, last_valid_block_height=160)
+    cache.set(Blockhash("still_valid"), 20, used_immediately=True, last_valid_block_height=170)
+    cache.set(Blockhash("new"), 400, last_valid_block_height=165 + MAX_PROCESSING_AGE)
+    assert list(cache.used_blockhashes) == [20]
+    assert cache.get_entry().blockhash == Blockhash("new")
+
+
+def test_update_block_height():
+    """An externally observed block height evicts entries; entries without one only expire by ttl."""
+    cache = BlockhashCache()
+    cache.set(Blockhash("with_height"), 10, last_valid_block_height=160)
+    cache.set(Blockhash("without_height"), 11)
+    cache.update_block_height(161)
+    assert cache.get_entry() == BlockhashCacheEntry(Blockhash("without_height"), 11, None)
+    cache.update_block_height(100)
+    assert cache.block_height == 161
+
+
+def test_empty_cache_raises():
+    """An empty cache raises ValueError so callers fall back to the network."""
+    with pytest.raises(ValueError):
+        BlockhashCache().get_entry()
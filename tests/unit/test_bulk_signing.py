@@ -0,0 +1,53 @@
+"""Unit tests for solana.bulk_signing."""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import solana.system_program as sp
+from solana.bulk_signing import sign_and_serialize
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import Transaction
+
+
+def _instruction_sets(payer, n_txs):
+    return [
+        [sp.transfer(sp.TransferParams(from_pubkey=payer.public_key, to_pubkey=PublicKey(i + 1), lamports=i))]
+        for i in range(n_txs)
+    ]
+
+
+def _expected(stubbed_blockhash, payer, instruction_sets):
+    expected = []
+    for instructions in instruction_sets:
+        txn = Transaction(recent_blockhash=stubbed_blockhash).add(*instructions)
+        txn.sign(payer)
+        expected.append(txn.serialize())
+    return expected
+
+
+def test_sign_and_serialize_threads(stubbed_blockhash):
+    """Thread-pool output matches signing one by one, in order."""
+    payer = Keypair.from_seed(bytes([1] * PublicKey.LENGTH))
+    instruction_sets = _instruction_sets(payer, 25)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        wire_txs = list(
+            sign_and_serialize(
+                iter(instruction_sets), stubbed_blockhash, [payer], executor=executor, max_workers=2, chunk_size=4
+            )
+        )
+    assert wire_txs == _expected(stubbed_blockhash, payer, instruction_sets)
+
+
+def test_sign_and_serialize_processes(stubbed_blockhash):
+    """The default process pool gives the same result."""
+    payer = Keypair.from_seed(bytes([2] * PublicKey.LENGTH))
+    instruction_sets = _instruction_sets(payer, 10)
+    wire_txs = list(sign_and_serialize(instruction_sets, stubbed_blockhash, [payer], max_workers=2, chunk_size=3))
+    assert wire_txs == _expected(stubbed_blockhash, payer, instruction_sets)
+
+
+def test_sign_and_serialize_invalid_chunk_size(stubbed_blockhash):
+    """A non-positive chunk size is rejected."""
+    with pytest.raises(ValueError):
+        next(sign_and_serialize([], stubbed_blockhash, [Keypair()], chunk_size=0))
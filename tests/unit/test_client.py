@@ -3,15 +3,22 @@ from unittest.mock import patch
 import pytest
 from requests.exceptions import ReadTimeout
 
+import solana.system_program as sp
+from solana.blockhash import Blockhash
 from solana.exceptions import SolanaRpcException
+from solana.keypair import Keypair
 from solana.publickey import PublicKey
-from solana.rpc.commitment import Finalized
+from solana.rpc.api import Client
+from solana.rpc.commitment import Finalized, Processed
+from solana.rpc.core import RPCException
+from solana.rpc.types import TxOpts
+from solana.transaction import Transaction
 
 
 def test_client_http_exception(unit_test_http_client):
     """Test AsyncClient raises native Solana-py exceptions."""
 
-    with patch("requests.post") as post_mock:
+    with patch("requests.Session.post") as post_mock:
         post_mock.side_effect = ReadTimeout()
         with pytest.raises(SolanaRpcException) as exc_info:
             unit_test_http_client.get_epoch_info()
@@ -60,3 +67,127 @@ def test_client_address_sig_args_with_commitment(unit_test_http_client):
     )
     actual = unit_test_http_client._get_signatures_for_address_args(PublicKey(0), None, None, 5, Finalized)
     assert expected == actual
+
+
+def test_batch_request(stub_rpc_server):
+    """Batched calls go out in one POST and come back in call order."""
+    stub_rpc_server.results["getBalance"] = lambda params: {"context": {"slot": 1}, "value": len(params[0])}
+    stub_rpc_server.results["getSlot"] = RuntimeError("slot unavailable")
+    with Client(stub_rpc_server.url) as client:
+        with client.batch() as batch:
+            first = batch.get_balance(PublicKey(1))
+            failed = batch.get_slot()
+            last = batch.add("getBalance", "abc")
+    assert len(stub_rpc_server.requests) == 1
+    assert [req["method"] for req in stub_rpc_server.requests[0]] == ["getBalance", "getSlot", "getBalance"]
+    assert batch.results[first]["result"]["value"] == 32
+    assert batch.results[failed]["error"]["message"] == "slot unavailable"
+    assert batch.results[last]["result"]["value"] == 3
+    assert len(batch) == 0
+
+
+def test_batch_request_out_of_order_response(stub_rpc_server):
+    """Responses are matched to calls by id even if the node reorders them."""
+    stub_rpc_server.results["getSlot"] = lambda params: params[0]["commitment"]
+    original_respond = stub_rpc_server.respond
+    stub_rpc_server.respond = lambda body: (200, list(reversed(original_respond(body)[1])))
+    with Client(stub_rpc_server.url) as client:
+        batch = client.batch()
+        batch.get_slot(Finalized)
+        batch.get_slot(Processed)
+        results = batch.execute()
+    assert [resp["result"] for resp in results] == [Finalized, Processed]
+
+
+def _multiple_accounts_result(params):
+    return {"context": {"slot": 100 - len(params[0])}, "value": [{"owner": key} for key in params[0]]}
+
+
+def test_get_multiple_accounts_chunked(stub_rpc_server):
+    """Large pubkey lists are split into RPC-sized chunks and merged in order."""
+    stub_rpc_server.results["getMultipleAccounts"] = _multiple_accounts_result
+    pubkeys = [PublicKey(i) for i in range(250)]
+    with Client(stub_rpc_server.url) as client:
+        resp = client.get_multiple_accounts_chunked(pubkeys)
+    assert sorted(len(req["params"][0]) for req in stub_rpc_server.requests) == [50, 100, 100]
+    assert [acc["owner"] for acc in resp["result"]["value"]] == [str(key) for key in pubkeys]
+    assert resp["result"]["context"]["slot"] == 0
+
+
+def test_get_multiple_accounts_chunked_error(stub_rpc_server):
+    """An error in any chunk is raised."""
+    stub_rpc_server.results["getMultipleAccounts"] = RuntimeError("too many")
+    with Client(stub_rpc_server.url) as client:
+        with pytest.raises(RPCException):
+            client.get_multiple_accounts_chunked([PublicKey(1)])
+        with pytest.raises(ValueError):
+            client.get_multiple_accounts_chunked([PublicKey(1)], chunk_size=101)
+
+
+STUB_SIG = "5" * 87
+
+
+def test_default_ws_endpoint():
+    """Websocket endpoints are derived from HTTP ones like the Solana CLI does."""
+    assert Client._default_ws_endpoint("http://localhost:8899") == "ws://localhost:8900"
+    assert Client._default_ws_endpoint("https://api.devnet.solana.com") == "wss://api.devnet.solana.com"
+
+
+def test_confirm_transaction_subscribe(stub_rpc_server, stub_ws_server):
+    """Confirmation resolves on the signature notification without polling."""
+    stub_rpc_server.results["getSignatureStatuses"] = {"context": {"slot": 1}, "value": [None]}
+    with Client(stub_rpc_server.url) as client:
+        resp = client.confirm_transaction_subscribe(STUB_SIG, Finalized, ws_endpoint=stub_ws_server.url)
+    assert resp["result"]["value"][0]["confirmationStatus"] == Finalized
+    assert resp["result"]["value"][0]["err"] is None
+    assert stub_ws_server.subscriptions[0]["method"] == "signatureSubscribe"
+    assert len(stub_rpc_server.requests) == 1
+
+
+def test_confirm_transaction_subscribe_fallback(stub_rpc_server):
+    """Without a reachable websocket endpoint confirmation falls back to polling."""
+    status = {"slot": 3, "confirmations": None, "err": None, "confirmationStatus": "finalized"}
+    stub_rpc_server.results["getSignatureStatuses"] = {"context": {"slot": 3}, "value": [status]}
+    with Client(stub_rpc_server.url) as client:
+        resp = client.confirm_transaction_subscribe(STUB_SIG, Processed, ws_endpoint="ws://127.0.0.1:1")
+    assert resp["result"]["value"][0] == status
+
+
+def _latest_blockhash_result(params):
+    return {"context": {"slot": 7}, "value": {"blockhash": str(Blockhash(PublicKey(7))), "lastValidBlockHeight": 157}}
+
+
+def test_blockhash_refresher_serves_send_path(stub_rpc_server):
+    """With the refresher running, send_transaction never fetches a blockhash itself."""
+    stub_rpc_server.results["getLatestBlockhash"] = _latest_blockhash_result
+    stub_rpc_server.results["sendTransaction"] = "sig"
+    sender = Keypair()
+    params = sp.TransferParams(from_pubkey=sender.public_key, to_pubkey=sender.public_key, lamports=1)
+    txn = Transaction().add(sp.transfer(params))
+    with Client(stub_rpc_server.url) as client:
+        client.start_blockhash_refresher(interval=60)
+        assert client.blockhash_cache
+        methods_before = [req["method"] for req in stub_rpc_server.requests]
+        client.send_transaction(txn, sender, opts=TxOpts(skip_confirmation=True))
+    assert methods_before == ["getLatestBlockhash"]
+    assert [req["method"] for req in stub_rpc_server.requests][1:] == ["sendTransaction"]
+    assert client._blockhash_refresher is None  # pylint: disable=protected-access
+
+
+def test_iter_program_accounts(stub_rpc_server):
+    """Program accounts are streamed one at a time."""
+    accounts = [{"pubkey": str(PublicKey(i)), "account": {"lamports": i, "data": ["", "base64"]}} for i in range(50)]
+    stub_rpc_server.results["getProgramAccounts"] = accounts
+    with Client(stub_rpc_server.url) as client:
+        stream = client.iter_program_accounts(PublicKey(1), encoding="base64")
+        assert next(stream) == accounts[0]
+        assert list(stream) == accounts[1:]
+    assert stub_rpc_server.requests[0]["params"][1]["encoding"] == "base64"
+
+
+def test_iter_block_transactions_error(stub_rpc_server):
+    """An RPC error in a streamed response is raised once the stream ends."""
+    stub_rpc_server.results["getBlock"] = RPCException({"code": -32009, "message": "Slot 1 was skipped"})
+    with Client(stub_rpc_server.url) as client:
+        with pytest.raises(RPCException):
+            list(client.iter_block_transactions(1))
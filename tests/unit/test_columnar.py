@@ -0,0 +1,61 @@
+"""Unit tests for columnar account decoding."""
+import base64
+import os
+
+import pytest
+from construct import Bytes, Int64ul, PaddedString, Struct
+
+from solana.utils.columnar import AccountColumns
+from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT
+
+
+def _keyed(raws):
+    return [
+        {"pubkey": f"key{idx}", "account": {"data": [base64.b64encode(raw).decode(), "base64"]}}
+        for idx, raw in enumerate(raws)
+    ]
+
+
+@pytest.mark.parametrize("layout", [ACCOUNT_LAYOUT, MINT_LAYOUT])
+def test_columns_match_construct(layout):
+    """Every column should agree with parsing each account through construct."""
+    raws = [os.urandom(layout.sizeof()) for _ in range(50)]
+    columns = AccountColumns.from_keyed_accounts(layout, _keyed(raws))
+    assert len(columns) == 50
+    assert columns.pubkeys == [f"key{idx}" for idx in range(50)]
+    parsed = [layout.parse(raw) for raw in raws]
+    for name in columns.field_names:
+        assert list(columns.column(name)) == [container[name] for container in parsed]
+    assert columns.parse(-1) == parsed[-1]
+    assert bytes(columns.record(3)) == raws[3]
+
+
+def test_from_base64_accepts_strings():
+    """Plain base64 strings and [data, encoding] pairs are both accepted."""
+    raw = os.urandom(MINT_LAYOUT.sizeof())
+    encoded = base64.b64encode(raw).decode()
+    columns = AccountColumns.from_base64(MINT_LAYOUT, [encoded, [encoded, "base64"]])
+    assert bytes(columns.buffer) == raw * 2
+    assert columns.pubkeys is None
+
+
+def test_wrong_size_account_is_rejected():
+    """An account of another size should not be silently misaligned."""
+    payloads = [base64.b64encode(os.urandom(ACCOUNT_LAYOUT.sizeof())).decode(), base64.b64encode(b"short").decode()]
+    with pytest.raises(ValueError, match="Account 1 has 5 bytes"):
+        AccountColumns.from_base64(ACCOUNT_LAYOUT, payloads)
+
+
+def test_variable_layout_is_rejected():
+    """Only fixed-size integer and Bytes fields can be decoded into columns."""
+    with pytest.raises(ValueError, match="'name'"):
+        AccountColumns(Struct("amount" / Int64ul, "name" / PaddedString(8, "utf8")), b"")
+    assert AccountColumns(Struct("key" / Bytes(32)), b"").record_size == 32
+
+
+def test_to_numpy():
+    """The NumPy view should share field values with the columns."""
+    pytest.importorskip("numpy")
+    raws = [os.urandom(ACCOUNT_LAYOUT.sizeof()) for _ in range(10)]
+    columns = AccountColumns.from_keyed_accounts(ACCOUNT_LAYOUT, _keyed(raws))
+    assert columns.to_numpy()["amount"].tolist() == list(columns.column("amount"))
@@ -0,0 +1,141 @@
+"""Tests for the bulk confirmation trackers."""
+import asyncio
+import time
+
+import pytest
+from based58 import b58encode
+
+from solana.exceptions import SolanaRpcException
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solana.rpc.confirmation import AsyncConfirmationTracker, ConfirmationTracker
+from solana.rpc.core import TransactionExpiredBlockheightExceededError, UnconfirmedTxError
+
+SIGS = [b58encode(idx.to_bytes(2, "little") * 32).decode() for idx in range(300)]
+
+
+def _serve_statuses(server, confirmed, block_height=100):
+    def statuses(params):
+        value = [
+            {"slot": 1, "err": None, "confirmationStatus": "finalized"} if sig in confirmed else None
+            for sig in params[0]
+        ]
+        return {"context": {"slot": 1}, "value": value}
+
+    server.results["getSignatureStatuses"] = statuses
+    server.results["getBlockHeight"] = block_height
+
+
+def test_poll_batches_statuses(stub_rpc_server):
+    """All pending signatures are checked in one HTTP request, chunked by 256."""
+    _serve_statuses(stub_rpc_server, set(SIGS[::2]))
+    with Client(stub_rpc_server.url) as client:
+        tracker = ConfirmationTracker(client, Confirmed)
+        futures = [tracker.add(sig) for sig in SIGS]
+        tracker.poll()
+    assert len(stub_rpc_server.requests) == 1
+    assert [len(req["params"][0]) for req in stub_rpc_server.requests[0]] == [256, 44]
+    assert all(future.done() for future in futures[::2])
+    assert not any(future.done() for future in futures[1::2])
+    assert futures[0].result()["confirmationStatus"] == "finalized"
+    assert len(tracker) == 150
+
+
+def test_expiry(stub_rpc_server):
+    """Signatures fail once their block height is exceeded or the timeout passes."""
+    _serve_statuses(stub_rpc_server, set(), block_height=10)
+    seen = []
+    with Client(stub_rpc_server.url) as client:
+        tracker = ConfirmationTracker(client, timeout=0)
+        expired = tracker.add(SIGS[0], last_valid_block_height=5, callback=seen.append)
+        alive = tracker.add(SIGS[1], last_valid_block_height=50)
+        timed_out = tracker.add(SIGS[2])
+        tracker.poll()
+    assert [req["method"] for req in stub_rpc_server.requests[0]] == ["getSignatureStatuses", "getBlockHeight"]
+    with pytest.raises(TransactionExpiredBlockheightExceededError):
+        expired.result()
+    with pytest.raises(UnconfirmedTxError):
+        timed_out.result()
+    assert seen == [expired]
+    assert not alive.done()
+
+
+def test_callback_can_add(stub_rpc_server):
+    """A done-callback can track another signature without deadlocking the tracker."""
+    _serve_statuses(stub_rpc_server, {SIGS[0]})
+    with Client(stub_rpc_server.url) as client:
+        tracker = ConfirmationTracker(client)
+        followups = []
+        tracker.add(SIGS[0], callback=lambda _future: followups.append(tracker.add(SIGS[1])))
+        tracker.poll()
+    assert len(followups) == 1
+    assert len(tracker) == 1
+
+
+def test_duplicate_signature(stub_rpc_server):
+    """Tracking a signature twice resolves both futures."""
+    _serve_statuses(stub_rpc_server, {SIGS[0]})
+    with Client(stub_rpc_server.url) as client:
+        tracker = ConfirmationTracker(client)
+        futures = [tracker.add(SIGS[0]), tracker.add(SIGS[0])]
+        assert len(tracker) == 1
+        tracker.poll()
+    assert [future.result()["confirmationStatus"] for future in futures] == ["finalized"] * 2
+    assert len(stub_rpc_server.requests[0][0]["params"][0]) == 1
+
+
+def test_expiry_while_node_unreachable(closed_port_url):
+    """Signatures past their timeout fail even when the status request itself fails."""
+    with Client(closed_port_url) as client:
+        with ConfirmationTracker(client, sleep_seconds=0.01, timeout=0.05) as tracker:
+            future = tracker.add(SIGS[0])
+            with pytest.raises(UnconfirmedTxError):
+                future.result(timeout=5)
+    assert len(tracker) == 0
+
+
+def test_background_thread(stub_rpc_server):
+    """The background thread resolves futures."""
+    _serve_statuses(stub_rpc_server, set(SIGS))
+    with Client(stub_rpc_server.url) as client:
+        with ConfirmationTracker(client, sleep_seconds=0.01) as tracker:
+            futures = [tracker.add(sig) for sig in SIGS[:3]]
+            assert [future.result(timeout=5)["err"] for future in futures] == [None] * 3
+
+
+async def test_async_expiry_while_node_unreachable(closed_port_url):
+    """The async tracker also expires signatures when the node cannot be reached."""
+    async with AsyncClient(closed_port_url) as client:
+        tracker = AsyncConfirmationTracker(client, timeout=0)
+        future = tracker.add(SIGS[0])
+        with pytest.raises(SolanaRpcException):
+            await tracker.poll()
+        with pytest.raises(UnconfirmedTxError):
+            await future
+
+
+async def test_async_stop_during_poll(stub_rpc_server):
+    """Stopping the tracker while a tick is in flight cancels the background task."""
+    stub_rpc_server.results["getSignatureStatuses"] = lambda _params: time.sleep(0.2)
+    async with AsyncClient(stub_rpc_server.url) as client:
+        tracker = AsyncConfirmationTracker(client, sleep_seconds=0)
+        tracker.add(SIGS[0])
+        tracker.start()
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(tracker.stop(), 1)
+    assert tracker._task is None  # pylint: disable=protected-access
+
+
+async def test_async_tracker(stub_rpc_server):
+    """The async tracker resolves asyncio futures from its background task."""
+    _serve_statuses(stub_rpc_server, set(SIGS[:10]))
+    async with AsyncClient(stub_rpc_server.url) as client:
+        async with AsyncConfirmationTracker(client, sleep_seconds=0.01, timeout=0.2) as tracker:
+            confirmed = [tracker.add(sig) for sig in SIGS[:10]]
+            unconfirmed = tracker.add(SIGS[10])
+            statuses = await asyncio.gather(*confirmed)
+            with pytest.raises(UnconfirmedTxError):
+                await unconfirmed
+    assert len(statuses) == 10
+    assert len(tracker) == 0
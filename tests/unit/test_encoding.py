@@ -0,0 +1,48 @@
+"""Unit tests for the pluggable JSON serde."""
+import json
+
+import pytest
+
+from solana.rpc._utils.encoding import JSON_BACKENDS, FriendlyJsonSerde, load_json_backend
+
+
+def _serde(name: str) -> FriendlyJsonSerde:
+    if name != "json":
+        pytest.importorskip(name)
+    serde = FriendlyJsonSerde()
+    serde.json_backend = load_json_backend(name)
+    return serde
+
+
+@pytest.mark.parametrize("name", JSON_BACKENDS)
+def test_round_trip(name):
+    """Every backend encodes requests and decodes responses, from str or bytes."""
+    serde = _serde(name)
+    req = {"jsonrpc": "2.0", "id": 1, "method": "getBalance", "params": ("11111111111111111111111111111111", {})}
+    assert json.loads(serde.json_encode(req)) == {**req, "params": list(req["params"])}
+    resp = '{"jsonrpc":"2.0","result":{"context":{"slot":1},"value":18446744073709551615},"id":1}'
+    assert serde.json_decode(resp) == serde.json_decode(resp.encode()) == json.loads(resp)
+
+
+@pytest.mark.parametrize("name", JSON_BACKENDS)
+def test_friendly_errors(name):
+    """Errors keep the friendly messages and the stdlib exception types regardless of backend."""
+    serde = _serde(name)
+    with pytest.raises(TypeError) as exc_info:
+        serde.json_encode({"ok": 1, "bad": object()})
+    assert "dict had unencodable value at keys: {bad: because" in str(exc_info.value.__cause__)
+    with pytest.raises(json.JSONDecodeError, match="Could not decode b'{not json'"):
+        serde.json_decode(b"{not json")
+
+
+@pytest.mark.parametrize("name", JSON_BACKENDS)
+def test_wide_integers_fall_back_to_stdlib(name):
+    """Documents a fast backend rejects are still decoded via the stdlib."""
+    serde = _serde(name)
+    assert serde.json_decode(b'{"value": 340282366920938463463374607431768211456}') == {"value": 2**128}
+
+
+def test_unknown_backend():
+    """Unknown backend names are rejected."""
+    with pytest.raises(ValueError):
+        load_json_backend("simplejson")
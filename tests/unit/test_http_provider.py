@@ -0,0 +1,81 @@
+"""Tests for the synchronous HTTP provider."""
+import logging
+from unittest.mock import PropertyMock, patch
+
+import requests
+
+from solana.rpc.api import Client
+from solana.rpc.providers.core import RPCTrace
+from solana.rpc.providers.http import HTTPProvider
+
+
+def test_provider_reuses_connection(stub_rpc_server):
+    """Consecutive requests should share one keep-alive connection."""
+    stub_rpc_server.results["getSlot"] = 42
+    with HTTPProvider(stub_rpc_server.url) as provider:
+        for _ in range(5):
+            assert provider.make_request("getSlot")["result"] == 42
+    assert len(stub_rpc_server.requests) == 5
+    assert len(stub_rpc_server.connections) == 1
+
+
+def test_provider_pool_config(stub_rpc_server):
+    """Pool settings are applied to the mounted adapters."""
+    provider = HTTPProvider(stub_rpc_server.url, pool_connections=3, pool_maxsize=7)
+    adapter = provider.session.get_adapter(stub_rpc_server.url)
+    assert adapter._pool_connections == 3  # pylint: disable=protected-access
+    assert adapter._pool_maxsize == 7  # pylint: disable=protected-access
+    provider.close()
+
+
+def test_client_context_manager_closes_session(stub_rpc_server):
+    """Exiting the client context closes the provider session."""
+    stub_rpc_server.results["getSlot"] = 1
+    with Client(stub_rpc_server.url) as client:
+        assert client.is_connected()
+        assert client.get_slot()["result"] == 1
+        adapter = client._provider.session.get_adapter(stub_rpc_server.url)  # pylint: disable=protected-access
+    assert not adapter.poolmanager.pools
+
+
+def test_response_text_not_built(stub_rpc_server):
+    """Responses are decoded from bytes, and `.text` is never built, not even for debug logging."""
+    stub_rpc_server.results["getSlot"] = 1
+    with patch.object(requests.Response, "text", new_callable=PropertyMock) as text_mock:
+        with HTTPProvider(stub_rpc_server.url) as provider:
+            provider.logger.setLevel(logging.DEBUG)
+            try:
+                assert provider.make_request("getSlot")["result"] == 1
+            finally:
+                provider.logger.setLevel(logging.NOTSET)
+    text_mock.assert_not_called()
+
+
+def test_debug_log_is_size_capped(stub_rpc_server, caplog):
+    """Logged request params and response bodies are truncated to `log_body_limit`."""
+    stub_rpc_server.results["getAccountInfo"] = "x" * 5000
+    with HTTPProvider(stub_rpc_server.url) as provider:
+        provider.log_body_limit = 100
+        with caplog.at_level(logging.DEBUG, logger=provider.logger.name):
+            provider.make_request("getAccountInfo", "y" * 5000)
+    request_log, response_log = [rec.getMessage() for rec in caplog.records]
+    assert "y" * 100 not in request_log and request_log.endswith("... (5005 total)")
+    assert "x" * 100 not in response_log and response_log.endswith("total)")
+
+
+def test_trace_hook(stub_rpc_server):
+    """The trace hook gets the methods, sizes and timings of single and batch requests."""
+    stub_rpc_server.results["getSlot"] = 1
+    traces = []
+    with Client(stub_rpc_server.url, trace_hook=traces.append) as client:
+        client.get_slot()
+        with client.batch() as batch:
+            batch.get_slot()
+            batch.get_slot()
+    single, batched = traces
+    assert isinstance(single, RPCTrace)
+    assert single.methods == ("getSlot",)
+    assert batched.methods == ("getSlot", "getSlot")
+    assert single.status_code == 200
+    assert single.request_bytes > 0 and batched.response_bytes > single.response_bytes
+    assert single.request_seconds >= 0 and single.decode_seconds >= 0
@@ -0,0 +1,107 @@
+"""Unit tests for the incremental JSON array parser."""
+import json
+
+import pytest
+
+from solana.rpc._utils import json_stream
+from solana.rpc._utils.json_stream import JsonArrayStream
+
+ACCOUNTS = [
+    {"pubkey": f"key{i}", "account": {"data": ['q"\\uéx]}' * i, "base64"], "lamports": i, "nested": [[], {}]}}
+    for i in range(30)
+]
+
+
+def _stream(raw: bytes, path, chunk_size):
+    stream = JsonArrayStream(path)
+    items = []
+    for start in range(0, len(raw), chunk_size):
+        items += stream.feed(raw[start : start + chunk_size])  # noqa: E203
+    return items, stream.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_chunk_boundaries(chunk_size):
+    """Elements and the envelope are recovered no matter where chunks split, including inside escapes."""
+    doc = {"jsonrpc": "2.0", "result": ACCOUNTS, "id": 7}
+    raw = json.dumps(doc, ensure_ascii=False, indent=1).encode()
+    items, envelope = _stream(raw, ("result",), chunk_size)
+    assert items == ACCOUNTS
+    assert envelope == {"jsonrpc": "2.0", "id": 7}
+
+
+def test_scalar_split_at_every_boundary():
+    """Numbers and literals cut by a chunk boundary are not decoded until they are complete."""
+    scalars = [-2500.0, 1e-07, 12345678901234567890, True, False, None, "s", 0, -1.5e10]
+    raw = json.dumps({"result": scalars, "id": 1}).encode()
+    for split in range(1, len(raw)):
+        stream = JsonArrayStream(("result",))
+        items = stream.feed(raw[:split]) + stream.feed(raw[split:])
+        assert items == scalars, split
+        assert stream.close() == {"id": 1}
+
+
+def test_scalar_waits_for_delimiter():
+    """A number at the end of a chunk is held back until the next chunk shows where it ends."""
+    stream = JsonArrayStream(("result",))
+    assert not stream.feed(b'{"result": [-2500.')
+    assert not stream.feed(b"0")
+    assert stream.feed(b'], "id": 1}') == [-2500.0]
+    assert stream.close() == {"id": 1}
+
+
+def test_nested_path_skips_siblings():
+    """Arrays below the top level are found by key path; decoy keys elsewhere are ignored."""
+    doc = {"result": {"context": {"slot": 1, "value": [0]}, "value": [1, "two", None, [3]]}, "id": 1}
+    items, envelope = _stream(json.dumps(doc).encode(), ("result", "value"), 5)
+    assert items == [1, "two", None, [3]]
+    assert envelope == {"id": 1}
+
+
+def test_error_response():
+    """Error responses have no array, and the error lands in the envelope."""
+    doc = {"jsonrpc": "2.0", "error": {"code": -32009, "message": "skipped"}, "id": 1}
+    stream = JsonArrayStream(("result", "transactions"))
+    assert not stream.feed(json.dumps(doc).encode())
+    assert not stream.found
+    assert stream.close()["error"]["code"] == -32009
+
+
+def test_truncated_document():
+    """A document cut off mid-element is reported on close."""
+    stream = JsonArrayStream(("result",))
+    stream.feed(b'{"result": [{"a": 1}, {"a":')
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+def test_large_element_spanning_many_chunks():
+    """An element much larger than a chunk is decoded once it is complete."""
+    doc = {"result": [{"data": "x" * 200_000}, {"data": "y"}]}
+    items, _ = _stream(json.dumps(doc).encode(), ("result",), 1000)
+    assert items == doc["result"]
+
+
+class _CountingDecoder(json.JSONDecoder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def raw_decode(self, s, idx=0):
+        self.calls += 1
+        return super().raw_decode(s, idx)
+
+
+def test_large_elements_are_decoded_once(monkeypatch):
+    """Elements spanning many chunks, full of closing braces like jsonParsed data, are not re-parsed per chunk."""
+    decoder = _CountingDecoder()
+    monkeypatch.setattr(json_stream, "_DECODER", decoder)
+    element = {"data": {"parsed": [{"info": {"amount": str(i), "mint": "m" * 32}} for i in range(40_000)]}}
+    doc = {"jsonrpc": "2.0", "result": [element, element], "id": 1}
+    raw = json.dumps(doc).encode()
+    assert len(raw) > 5_000_000
+    items, envelope = _stream(raw, ("result",), 64 * 1024)
+    assert items == [element, element]
+    assert envelope == {"jsonrpc": "2.0", "id": 1}
+    # One attempt when each element starts and one once it is complete, however many chunks it spans.
+    assert decoder.calls == 2 * len(items)
@@ -0,0 +1,153 @@
+"""Tests for the multi-endpoint HTTP providers."""
+# pylint: disable=protected-access
+import time
+from time import monotonic
+
+import pytest
+
+from solana.exceptions import SolanaRpcException
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.providers.async_multi_http import AsyncMultiHTTPProvider
+from solana.rpc.providers.core import EndpointStats
+from solana.rpc.providers.multi_http import MultiHTTPProvider
+
+
+def _slow(result, seconds):
+    def respond(_params):
+        time.sleep(seconds)
+        return result
+
+    return respond
+
+
+def _warm(provider, latencies):
+    """Give each endpoint enough latency samples to be ranked and hedged."""
+    for idx, seconds in enumerate(latencies):
+        for _ in range(5):
+            provider._record_success(idx, seconds)
+
+
+def test_endpoint_stats_percentile():
+    """The percentile is taken over the recent window."""
+    stats = EndpointStats("http://localhost", window=4)
+    assert stats.latency_percentile(0.5) is None
+    for seconds in (9.0, 1.0, 2.0, 3.0, 4.0):
+        stats._samples.append(seconds)
+    assert stats.latency_percentile(0.5) == 2.0
+    assert stats.latency_percentile(0.99) == 4.0
+
+
+def test_routes_to_fastest_endpoint(stub_rpc_servers):
+    """After measuring every endpoint once, requests go to the fastest one."""
+    slow, fast = stub_rpc_servers
+    slow.results["getSlot"] = _slow(1, 0.05)
+    fast.results["getSlot"] = 2
+    with MultiHTTPProvider([slow.url, fast.url], hedge_percentile=None) as provider:
+        results = [provider.make_request("getSlot")["result"] for _ in range(6)]
+        assert provider.endpoint_uri == fast.url
+    assert results == [1] + [2] * 5
+    assert provider.stats[0].latency > provider.stats[1].latency
+
+
+def test_read_fails_over_and_ejects(stub_rpc_servers):
+    """A failed read is retried on the next endpoint, and the failing endpoint is ejected."""
+    broken, healthy = stub_rpc_servers
+    broken.status = 500
+    healthy.results["getSlot"] = 2
+    with MultiHTTPProvider([broken.url, healthy.url], eject_after=1, eject_backoff=30) as provider:
+        assert provider.make_request("getSlot")["result"] == 2
+        assert not provider.stats[0].healthy(monotonic())
+        assert provider.stats[0].failures == 1
+        provider.make_request("getSlot")
+    assert len(broken.requests) == 1
+    assert len(healthy.requests) == 2
+
+
+def test_write_is_not_failed_over(stub_rpc_servers):
+    """Writes are sent to one endpoint only, so a failure is raised instead of retried."""
+    broken, healthy = stub_rpc_servers
+    broken.status = 500
+    with MultiHTTPProvider([broken.url, healthy.url]) as provider:
+        with pytest.raises(SolanaRpcException):
+            provider.make_request("sendTransaction", "tx")
+    assert not healthy.requests
+
+
+def test_dead_endpoint_stays_behind_after_ejection(stub_rpc_server, closed_port_url):
+    """An endpoint that has only ever failed does not win writes back once its ejection expires."""
+    stub_rpc_server.results["getSlot"] = 1
+    stub_rpc_server.results["sendTransaction"] = "sig"
+    with MultiHTTPProvider([closed_port_url, stub_rpc_server.url], eject_after=1, eject_backoff=0.01) as provider:
+        assert provider.make_request("getSlot")["result"] == 1
+        time.sleep(0.02)
+        assert provider.stats[0].healthy(monotonic())
+        assert provider.endpoint_uri == stub_rpc_server.url
+        assert provider.make_request("sendTransaction", "tx")["result"] == "sig"
+
+
+def test_ejection_backoff_doubles():
+    """Every consecutive ejection doubles the backoff, up to the maximum."""
+    provider = MultiHTTPProvider(["http://a", "http://b"], eject_after=2, eject_backoff=1, max_eject_backoff=3)
+    stats = provider.stats[0]
+    backoffs = []
+    for _ in range(4):
+        before = monotonic()
+        provider._record_failure(0, Exception("boom"))
+        provider._record_failure(0, Exception("boom"))
+        backoffs.append(round(stats.ejected_until - before))
+        stats.consecutive_failures = 0
+    assert backoffs == [1, 2, 3, 3]
+    assert provider._ranked(()) == [1, 0]
+    provider._record_success(0, 0.01)
+    assert stats.ejections == 0
+
+
+def test_slow_read_is_hedged(stub_rpc_servers):
+    """A read slower than the endpoint's usual latency is raced against the next endpoint."""
+    primary, secondary = stub_rpc_servers
+    primary.results["getSlot"] = _slow(1, 1.0)
+    secondary.results["getSlot"] = 2
+    with MultiHTTPProvider([primary.url, secondary.url], hedge_min_samples=5) as provider:
+        _warm(provider, (0.001, 0.01))
+        started = time.perf_counter()
+        assert provider.make_request("getSlot")["result"] == 2
+        assert time.perf_counter() - started < 0.5
+        assert provider.hedges == 1
+
+
+def test_client_accepts_endpoint_list(stub_rpc_servers):
+    """Passing several endpoints builds a multi-endpoint provider."""
+    for server in stub_rpc_servers:
+        server.results["getSlot"] = 7
+    with Client([server.url for server in stub_rpc_servers]) as client:
+        assert isinstance(client._provider, MultiHTTPProvider)
+        assert client.get_slot()["result"] == 7
+        with client.batch() as batch:
+            batch.get_slot()
+        assert batch.results[0]["result"] == 7
+
+
+async def test_async_read_fails_over(stub_rpc_servers):
+    """The async provider fails reads over to the next endpoint."""
+    broken, healthy = stub_rpc_servers
+    broken.status = 503
+    healthy.results["getSlot"] = 2
+    async with AsyncMultiHTTPProvider([broken.url, healthy.url], eject_after=1) as provider:
+        assert (await provider.make_request("getSlot"))["result"] == 2
+        assert provider.endpoint_uri == healthy.url
+
+
+async def test_async_slow_read_is_hedged(stub_rpc_servers):
+    """The async provider hedges slow reads and cancels the loser."""
+    primary, secondary = stub_rpc_servers
+    primary.results["getSlot"] = _slow(1, 1.0)
+    secondary.results["getSlot"] = 2
+    async with AsyncClient([primary.url, secondary.url]) as client:
+        provider = client._provider
+        provider.hedge_min_samples = 5
+        _warm(provider, (0.001, 0.01))
+        started = time.perf_counter()
+        assert (await client.get_slot())["result"] == 2
+        assert time.perf_counter() - started < 0.5
+        assert provider.hedges == 1
@@ -0,0 +1,52 @@
+"""Unit tests for bulk program address derivation."""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from solana.program_address import ProgramAddressCache, find_program_addresses
+from solana.publickey import PublicKey
+
+PROGRAM_ID = PublicKey(9)
+
+
+def test_find_program_addresses_matches_single_derivation():
+    """Bulk derivation returns what `find_program_address` does, in order, with or without workers."""
+    seed_sets = [[b"vault", bytes(PublicKey(idx % 20))] for idx in range(50)]
+    expected = [PublicKey.find_program_address(seeds, PROGRAM_ID) for seeds in seed_sets]
+    assert find_program_addresses(seed_sets, PROGRAM_ID) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert find_program_addresses(iter(seed_sets), PROGRAM_ID, executor=executor, chunk_size=7) == expected
+    with pytest.raises(ValueError):
+        find_program_addresses(seed_sets, PROGRAM_ID, chunk_size=0)
+
+
+def test_program_address_cache_persists(tmp_path):
+    """Derived addresses are stored per program and served from disk after reopening."""
+    path = str(tmp_path / "pdas.sqlite")
+    seed_sets = [[b"ab", b"c"], [b"a", b"bc"], [b"ab", b"c"]]
+    with ProgramAddressCache(path) as cache:
+        derived = find_program_addresses(seed_sets, PROGRAM_ID, cache=cache)
+        assert len(cache) == 2
+        assert derived == [PublicKey.find_program_address(seeds, PROGRAM_ID) for seeds in seed_sets]
+        find_program_addresses(seed_sets, PublicKey(10), cache=cache)
+        assert len(cache) == 4
+
+    with ProgramAddressCache(path) as cache:
+        assert find_program_addresses(seed_sets, PROGRAM_ID, cache=cache) == derived
+        assert len(cache) == 4
+        many = [[idx.to_bytes(4, "little")] for idx in range(1000)]
+        find_program_addresses(many, PROGRAM_ID, cache=cache)
+        assert len(cache) == 1004
+        assert find_program_addresses(many, PROGRAM_ID, cache=cache)[-1] == PublicKey.find_program_address(
+            many[-1], PROGRAM_ID
+        )
+
+
+def test_program_address_cache_shared_between_threads():
+    """One cache can be used from several threads at once."""
+    program_id = PublicKey(9)
+    seed_sets = [[b"t", bytes([i])] for i in range(64)]
+    with ProgramAddressCache() as cache, ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda part: find_program_addresses(part, program_id, cache=cache), [seed_sets] * 8))
+        assert len(cache) == len(seed_sets)
+    assert all(result == results[0] for result in results)
@@ -0,0 +1,111 @@
+"""Tests for client-side rate limiting in the HTTP providers."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+import pytest
+
+from solana.exceptions import SolanaRpcException
+from solana.rpc.providers.async_http import AsyncHTTPProvider
+from solana.rpc.providers.http import HTTPProvider
+from solana.rpc.providers.rate_limit import RateLimit, _parse_retry_after
+
+
+class _ConcurrencyProbe:
+    """Stub result that tracks how many requests the server is handling at once."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, _params):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.current -= 1
+        return 1
+
+
+def test_parse_retry_after():
+    """Retry-After holds seconds or an HTTP date; anything else falls back to the default."""
+    assert _parse_retry_after("2.5") == 2.5
+    assert 8 <= _parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert _parse_retry_after(None) == _parse_retry_after("soon") == 1.0
+
+
+def test_rate_limit_queues_requests(stub_rpc_server):
+    """Requests beyond the rate wait for tokens instead of failing; batch calls count individually."""
+    stub_rpc_server.results["getSlot"] = 1
+    with HTTPProvider(stub_rpc_server.url, rate_limit=RateLimit(requests_per_second=20, burst=1)) as provider:
+        started = time.perf_counter()
+        for _ in range(3):
+            provider.make_request("getSlot")
+        provider.make_batch_request([("getSlot",)] * 2)
+        assert time.perf_counter() - started >= 0.15
+
+
+def test_method_rate_limit(stub_rpc_server):
+    """Per-method limits only slow down their method."""
+    stub_rpc_server.results["getSlot"] = 1
+    stub_rpc_server.results["getProgramAccounts"] = []
+    limits = {"getProgramAccounts": RateLimit(requests_per_second=10, burst=1)}
+    with HTTPProvider(stub_rpc_server.url, method_rate_limits=limits) as provider:
+        started = time.perf_counter()
+        for _ in range(5):
+            provider.make_request("getSlot")
+        assert time.perf_counter() - started < 0.1
+        for _ in range(3):
+            provider.make_request("getProgramAccounts", "program")
+        assert time.perf_counter() - started >= 0.2
+
+
+def test_max_in_flight(stub_rpc_server):
+    """No more than `max_in_flight` requests are sent at once."""
+    probe = _ConcurrencyProbe(0.05)
+    stub_rpc_server.results["getSlot"] = probe
+    with HTTPProvider(stub_rpc_server.url, rate_limit=RateLimit(max_in_flight=2)) as provider:
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: provider.make_request("getSlot"), range(6)))
+    assert probe.peak == 2
+
+
+def test_retry_after_is_honored(stub_rpc_server):
+    """A 429 pauses requests for the Retry-After delay and then resends them."""
+    stub_rpc_server.results["getSlot"] = 3
+    stub_rpc_server.headers["Retry-After"] = "0.2"
+    stub_rpc_server.fail_first(1, 429)
+    with HTTPProvider(stub_rpc_server.url, rate_limit=RateLimit()) as provider:
+        started = time.perf_counter()
+        assert provider.make_request("getSlot")["result"] == 3
+        assert time.perf_counter() - started >= 0.2
+        assert provider.rate_limiter.throttled == 1
+
+
+def test_throttled_retries_are_bounded(stub_rpc_server):
+    """After `max_throttled_retries` resends the 429 is raised."""
+    stub_rpc_server.headers["Retry-After"] = "0"
+    stub_rpc_server.fail_first(10, 429)
+    with HTTPProvider(stub_rpc_server.url, rate_limit=RateLimit()) as provider:
+        provider.rate_limiter.max_throttled_retries = 2
+        with pytest.raises(SolanaRpcException):
+            provider.make_request("getSlot")
+    assert len(stub_rpc_server.requests) == 3
+
+
+async def test_async_limits(stub_rpc_server):
+    """The async provider caps requests in flight and honors Retry-After."""
+    probe = _ConcurrencyProbe(0.05)
+    stub_rpc_server.results["getSlot"] = probe
+    stub_rpc_server.headers["Retry-After"] = "0.1"
+    stub_rpc_server.fail_first(1, 429)
+    async with AsyncHTTPProvider(stub_rpc_server.url, rate_limit=RateLimit(max_in_flight=2)) as provider:
+        responses = await asyncio.gather(*(provider.make_request("getSlot") for _ in range(6)))
+        assert provider.rate_limiter.throttled == 1
+    assert [resp["result"] for resp in responses] == [1] * 6
+    assert probe.peak == 2
@@ -0,0 +1,107 @@
+"""Tests for the RPC response cache."""
+import math
+import time
+
+from solana.publickey import PublicKey
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed, Finalized, Processed
+from solana.rpc.providers.cache import ResponseCache
+
+
+def _methods(stub):
+    return [req["method"] for req in stub.requests]
+
+
+def test_immutable_methods_are_cached(stub_rpc_server):
+    """Methods whose response never changes are fetched once."""
+    stub_rpc_server.results["getGenesisHash"] = "genesis"
+    cache = ResponseCache()
+    with Client(stub_rpc_server.url, response_cache=cache) as client:
+        assert client.get_genesis_hash()["result"] == "genesis"
+        assert client.get_genesis_hash()["result"] == "genesis"
+    assert _methods(stub_rpc_server) == ["getGenesisHash"]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.ttl("getGenesisHash", ()) == math.inf
+
+
+def test_finalized_transactions_are_cached(stub_rpc_server):
+    """Transactions read at finalized are cached; other commitments and missing transactions are not."""
+    found = {"slot": 1}
+    stub_rpc_server.results["getTransaction"] = lambda params: found if params[0] == "found" else None
+    with Client(stub_rpc_server.url, commitment=Processed, response_cache=ResponseCache()) as client:
+        for _ in range(2):
+            client.get_transaction("found", commitment=Finalized)
+            client.get_transaction("found", commitment=Confirmed)
+            client.get_transaction("missing", commitment=Finalized)
+    assert len(stub_rpc_server.requests) == 5
+
+
+def test_commitment_ttl_expires(stub_rpc_server):
+    """Other reads are cached for their commitment's TTL, and not at all at processed by default."""
+    stub_rpc_server.results["getBalance"] = {"context": {"slot": 1}, "value": 10}
+    cache = ResponseCache(commitment_ttls={"confirmed": 0.1})
+    with Client(stub_rpc_server.url, response_cache=cache) as client:
+        client.get_balance(PublicKey(1), Confirmed)
+        client.get_balance(PublicKey(1), Confirmed)
+        client.get_balance(PublicKey(1), Processed)
+        client.get_balance(PublicKey(1), Processed)
+        time.sleep(0.15)
+        client.get_balance(PublicKey(1), Confirmed)
+    assert len(stub_rpc_server.requests) == 4
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_errors_and_writes_are_not_cached(stub_rpc_server):
+    """Error responses and non-read methods always go to the node."""
+    stub_rpc_server.results["getEpochSchedule"] = Exception("node is behind")
+    stub_rpc_server.results["sendTransaction"] = "sig"
+    cache = ResponseCache(commitment_ttls={"finalized": 60})
+    with Client(stub_rpc_server.url, response_cache=cache) as client:
+        for _ in range(2):
+            client._provider.make_request("getEpochSchedule")  # pylint: disable=protected-access
+            client._provider.make_request("sendTransaction", "tx")  # pylint: disable=protected-access
+    assert len(stub_rpc_server.requests) == 4
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    """The least recently used response is evicted once the cache is full."""
+    cache = ResponseCache(max_entries=2)
+    for hash_ in ("a", "b"):
+        cache.put("getMinimumBalanceForRentExemption", (hash_,), {"result": hash_})
+    assert cache.get("getMinimumBalanceForRentExemption", ("a",)) == {"result": "a"}
+    cache.put("getMinimumBalanceForRentExemption", ("c",), {"result": "c"})
+    assert cache.get("getMinimumBalanceForRentExemption", ("b",)) is None
+    assert cache.get("getMinimumBalanceForRentExemption", ("a",)) == {"result": "a"}
+    assert len(cache) == 2
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_batch_only_sends_misses(stub_rpc_server):
+    """Cached calls in a batch are answered locally and only the rest are sent."""
+    stub_rpc_server.results["getGenesisHash"] = "genesis"
+    stub_rpc_server.results["getEpochSchedule"] = {"slotsPerEpoch": 32}
+    stub_rpc_server.results["getSlot"] = 9
+    with Client(stub_rpc_server.url, response_cache=ResponseCache()) as client:
+        client.get_genesis_hash()
+        with client.batch() as batch:
+            batch.get_slot()
+            batch.add("getGenesisHash")
+            batch.add("getEpochSchedule")
+    assert [resp["result"] for resp in batch.results] == [9, "genesis", {"slotsPerEpoch": 32}]
+    assert [[req["method"] for req in body] for body in stub_rpc_server.requests[1:]] == [
+        ["getSlot", "getEpochSchedule"]
+    ]
+
+
+async def test_async_client_cache(stub_rpc_server):
+    """The async providers use the cache too."""
+    stub_rpc_server.results["getVersion"] = {"solana-core": "1.10.0"}
+    cache = ResponseCache()
+    async with AsyncClient(stub_rpc_server.url, response_cache=cache) as client:
+        await client.get_version()
+        assert (await client.get_version())["result"] == {"solana-core": "1.10.0"}
+    assert len(stub_rpc_server.requests) == 1
+    assert cache.hits == 1
@@ -0,0 +1,85 @@
+"""Tests for retrying idempotent requests in the HTTP providers."""
+import time
+
+import pytest
+
+from solana.exceptions import SolanaRpcException
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.providers.http import HTTPProvider
+from solana.rpc.providers.retry import RetryPolicy
+
+
+def test_idempotent_request_recovers(stub_rpc_server):
+    """5xx responses to reads are retried until one succeeds."""
+    stub_rpc_server.results["getSlot"] = 5
+    stub_rpc_server.fail_first(2, 503)
+    policy = RetryPolicy(backoff=0.01)
+    with HTTPProvider(stub_rpc_server.url, retry_policy=policy) as provider:
+        assert provider.make_request("getSlot")["result"] == 5
+    assert len(stub_rpc_server.requests) == 3
+    assert (policy.retries, policy.recovered, policy.exhausted) == (2, 1, 0)
+
+
+def test_non_idempotent_request_is_not_retried(stub_rpc_server):
+    """Writes are never sent twice."""
+    stub_rpc_server.fail_first(2, 503)
+    policy = RetryPolicy(backoff=0.01)
+    with HTTPProvider(stub_rpc_server.url, retry_policy=policy) as provider:
+        with pytest.raises(SolanaRpcException):
+            provider.make_request("sendTransaction", "tx")
+        with pytest.raises(SolanaRpcException):
+            provider.make_batch_request([("getSlot",), ("requestAirdrop", "pubkey", 1)])
+    assert len(stub_rpc_server.requests) == 2
+    assert policy.retries == 0
+
+
+def test_retries_are_bounded(stub_rpc_server):
+    """A request is given up on after `max_retries` retries; other statuses are not retried at all."""
+    stub_rpc_server.status = 500
+    policy = RetryPolicy(max_retries=2, backoff=0.01)
+    with HTTPProvider(stub_rpc_server.url, retry_policy=policy) as provider:
+        with pytest.raises(SolanaRpcException):
+            provider.make_request("getSlot")
+        assert len(stub_rpc_server.requests) == 3
+        stub_rpc_server.status = 404
+        with pytest.raises(SolanaRpcException):
+            provider.make_request("getSlot")
+    assert len(stub_rpc_server.requests) == 4
+    assert (policy.retries, policy.exhausted) == (2, 1)
+
+
+def test_connection_errors_are_retried_until_deadline(closed_port_url):
+    """Connection errors are retried, but no retry starts past the deadline."""
+    policy = RetryPolicy(max_retries=100, backoff=0.05, max_backoff=0.05, deadline=0.3)
+    with HTTPProvider(closed_port_url, retry_policy=policy) as provider:
+        started = time.perf_counter()
+        with pytest.raises(SolanaRpcException):
+            provider.make_request("getBalance", "pubkey")
+        assert time.perf_counter() - started < 1
+    assert policy.retries > 0
+    assert policy.exhausted == 1
+
+
+def test_retry_after_is_honored(stub_rpc_server):
+    """The delay before a retry is at least the response's Retry-After."""
+    stub_rpc_server.results["getSlot"] = 5
+    stub_rpc_server.headers["Retry-After"] = "0.2"
+    stub_rpc_server.fail_first(1, 429)
+    with HTTPProvider(stub_rpc_server.url, retry_policy=RetryPolicy(backoff=0.01)) as provider:
+        started = time.perf_counter()
+        assert provider.make_request("getSlot")["result"] == 5
+        assert time.perf_counter() - started >= 0.2
+
+
+async def test_async_idempotent_request_recovers(stub_rpc_server):
+    """The async provider retries reads, including batches of reads."""
+    stub_rpc_server.results["getSlot"] = 5
+    stub_rpc_server.fail_first(2, 502)
+    policy = RetryPolicy(backoff=0.01)
+    async with AsyncClient(stub_rpc_server.url, retry_policy=policy) as client:
+        assert (await client.get_slot())["result"] == 5
+        stub_rpc_server.fail_first(1, 504)
+        async with client.batch() as batch:
+            batch.get_slot()
+        assert batch.results[0]["result"] == 5
+    assert (policy.retries, policy.recovered) == (3, 2)
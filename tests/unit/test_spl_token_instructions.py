@@ -1,7 +1,15 @@
 """Unit tests for SPL-token instructions."""
+import functools
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 import spl.token.instructions as spl_token
+from solana.program_address import ProgramAddressCache
 from solana.publickey import PublicKey
+from solana.transaction import TransactionInstruction
+from spl.token._layouts import INSTRUCTIONS_LAYOUT, InstructionType
 from spl.token.constants import TOKEN_PROGRAM_ID
 
 
@@ -382,3 +390,198 @@ def test_burn_checked(stubbed_receiver):
     )
     instruction = spl_token.burn_checked(multisig_params)
     assert spl_token.decode_burn_checked(instruction) == multisig_params
+
+
+def _random_pubkey(rng):
+    return PublicKey(bytes(rng.getrandbits(8) for _ in range(32)))
+
+
+def _random_instruction_cases(rng):
+    """Random params for each builder, with the args `INSTRUCTIONS_LAYOUT` encodes for them."""
+    pubkey = functools.partial(_random_pubkey, rng)
+    amount, decimals = rng.getrandbits(64), rng.getrandbits(8)
+    freeze_authority = rng.choice([None, pubkey()])
+    new_authority = rng.choice([None, pubkey()])
+    authority = rng.choice(list(spl_token.AuthorityType))
+    owner, signers = pubkey(), [pubkey() for _ in range(rng.randint(0, 3))]
+    mint_authority = pubkey()
+    multisig_signers = [pubkey() for _ in range(rng.randint(1, 11))]
+    common = dict(program_id=TOKEN_PROGRAM_ID, signers=signers)
+    return [
+        (
+            spl_token.initialize_mint,
+            spl_token.decode_initialize_mint,
+            spl_token.InitializeMintParams(
+                decimals=decimals,
+                program_id=TOKEN_PROGRAM_ID,
+                mint=pubkey(),
+                mint_authority=mint_authority,
+                freeze_authority=freeze_authority,
+            ),
+            InstructionType.INITIALIZE_MINT,
+            dict(
+                decimals=decimals,
+                mint_authority=bytes(mint_authority),
+                freeze_authority_option=int(freeze_authority is not None),
+                freeze_authority=bytes(freeze_authority or PublicKey(0)),
+            ),
+        ),
+        (
+            spl_token.initialize_multisig,
+            spl_token.decode_initialize_multisig,
+            spl_token.InitializeMultisigParams(
+                program_id=TOKEN_PROGRAM_ID, multisig=pubkey(), m=len(multisig_signers), signers=multisig_signers
+            ),
+            InstructionType.INITIALIZE_MULTISIG,
+            dict(m=len(multisig_signers)),
+        ),
+        (
+            spl_token.transfer,
+            spl_token.decode_transfer,
+            spl_token.TransferParams(source=pubkey(), dest=pubkey(), owner=owner, amount=amount, **common),
+            InstructionType.TRANSFER,
+            dict(amount=amount),
+        ),
+        (
+            spl_token.approve,
+            spl_token.decode_approve,
+            spl_token.ApproveParams(source=pubkey(), delegate=pubkey(), owner=owner, amount=amount, **common),
+            InstructionType.APPROVE,
+            dict(amount=amount),
+        ),
+        (
+            spl_token.revoke,
+            spl_token.decode_revoke,
+            spl_token.RevokeParams(account=pubkey(), owner=owner, **common),
+            InstructionType.REVOKE,
+            None,
+        ),
+        (
+            spl_token.set_authority,
+            spl_token.decode_set_authority,
+            spl_token.SetAuthorityParams(
+                account=pubkey(),
+                authority=authority,
+                current_authority=owner,
+                new_authority=new_authority,
+                **common,
+            ),
+            InstructionType.SET_AUTHORITY,
+            dict(
+                authority_type=authority,
+                new_authority_option=int(new_authority is not None),
+                new_authority=bytes(new_authority or PublicKey(0)),
+            ),
+        ),
+        (
+            spl_token.mint_to,
+            spl_token.decode_mint_to,
+            spl_token.MintToParams(mint=pubkey(), dest=pubkey(), mint_authority=owner, amount=amount, **common),
+            InstructionType.MINT_TO,
+            dict(amount=amount),
+        ),
+        (
+            spl_token.burn,
+            spl_token.decode_burn,
+            spl_token.BurnParams(account=pubkey(), mint=pubkey(), owner=owner, amount=amount, **common),
+            InstructionType.BURN,
+            dict(amount=amount),
+        ),
+        (
+            spl_token.close_account,
+            spl_token.decode_close_account,
+            spl_token.CloseAccountParams(account=pubkey(), dest=pubkey(), owner=owner, **common),
+            InstructionType.CLOSE_ACCOUNT,
+            None,
+        ),
+        (
+            spl_token.transfer_checked,
+            spl_token.decode_transfer_checked,
+            spl_token.TransferCheckedParams(
+                source=pubkey(), mint=pubkey(), dest=pubkey(), owner=owner, amount=amount, decimals=decimals, **common
+            ),
+            InstructionType.TRANSFER2,
+            dict(amount=amount, decimals=decimals),
+        ),
+        (
+            spl_token.approve_checked,
+            spl_token.decode_approve_checked,
+            spl_token.ApproveCheckedParams(
+                source=pubkey(),
+                mint=pubkey(),
+                delegate=pubkey(),
+                owner=owner,
+                amount=amount,
+                decimals=decimals,
+                **common,
+            ),
+            InstructionType.APPROVE2,
+            dict(amount=amount, decimals=decimals),
+        ),
+        (
+            spl_token.mint_to_checked,
+            spl_token.decode_mint_to_checked,
+            spl_token.MintToCheckedParams(
+                mint=pubkey(), dest=pubkey(), mint_authority=owner, amount=amount, decimals=decimals, **common
+            ),
+            InstructionType.MINT_TO2,
+            dict(amount=amount, decimals=decimals),
+        ),
+        (
+            spl_token.burn_checked,
+            spl_token.decode_burn_checked,
+            spl_token.BurnCheckedParams(
+                account=pubkey(), mint=pubkey(), owner=owner, amount=amount, decimals=decimals, **common
+            ),
+            InstructionType.BURN2,
+            dict(amount=amount, decimals=decimals),
+        ),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_instruction_data_matches_construct_layout(seed):
+    """Instruction data must be byte-identical to `INSTRUCTIONS_LAYOUT` and decode back to the same params."""
+    for build, decode, params, instruction_type, args in _random_instruction_cases(random.Random(seed)):
+        instruction = build(params)
+        assert instruction.data == INSTRUCTIONS_LAYOUT.build(dict(instruction_type=instruction_type, args=args))
+        assert decode(instruction) == params
+
+
+def test_decode_rejects_bad_instruction_data():
+    """Decoding data of another instruction type or truncated data raises ValueError."""
+    params = spl_token.TransferParams(
+        program_id=TOKEN_PROGRAM_ID, source=PublicKey(1), dest=PublicKey(2), owner=PublicKey(3), amount=10
+    )
+    instruction = spl_token.transfer(params)
+    with pytest.raises(ValueError, match="instruction index mismatch"):
+        spl_token.decode_approve(instruction)
+    truncated = TransactionInstruction(keys=instruction.keys, program_id=TOKEN_PROGRAM_ID, data=instruction.data[:-1])
+    with pytest.raises(ValueError, match="invalid instruction data"):
+        spl_token.decode_transfer(truncated)
+
+
+def test_get_associated_token_address_is_memoized():
+    """Repeated derivations of one owner/mint pair are served from the cache."""
+    spl_token.get_associated_token_address.cache_clear()
+    owner, mint = PublicKey(11), PublicKey(12)
+    first = spl_token.get_associated_token_address(owner, mint)
+    assert spl_token.get_associated_token_address(owner, mint) == first
+    info = spl_token.get_associated_token_address.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (1, 1, spl_token.ASSOCIATED_TOKEN_ADDRESS_CACHE_SIZE)
+    expected, _ = PublicKey.find_program_address(
+        [bytes(owner), bytes(TOKEN_PROGRAM_ID), bytes(mint)], spl_token.ASSOCIATED_TOKEN_PROGRAM_ID
+    )
+    assert first == expected
+
+
+def test_get_associated_token_addresses():
+    """Bulk derivation matches one-at-a-time derivation, with or without an executor."""
+    owners, mint = [PublicKey(idx) for idx in range(1, 30)], PublicKey(99)
+    expected = [spl_token.get_associated_token_address(owner, mint) for owner in owners]
+    assert spl_token.get_associated_token_addresses(owners, mint) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert spl_token.get_associated_token_addresses(iter(owners), mint, executor=executor, chunk_size=7) == expected
+    with ProgramAddressCache() as cache:
+        assert spl_token.get_associated_token_addresses(owners, mint, cache=cache) == expected
+        assert len(cache) == len(owners)
@@ -0,0 +1,79 @@
+"""Unit tests for decoding SPL token mint and account data."""
+import base64
+import os
+import random
+
+import pytest
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from spl.token._layouts import ACCOUNT_LAYOUT, ACCOUNT_STRUCT, MINT_LAYOUT, MINT_STRUCT
+from spl.token.constants import TOKEN_PROGRAM_ID
+from spl.token.core import AccountInfo, MintInfo, _TokenCore
+
+
+def _random_data(layout, options):
+    """Random layout data, with each `*_option` field set to 0 or 1 and `state` in 0..2."""
+    container = layout.parse(os.urandom(layout.sizeof()))
+    for name in options:
+        container[name] = random.randint(0, 1)
+    if "state" in container:
+        container.state = random.randint(0, 2)
+    return layout.build(container)
+
+
+def _rpc_info(data):
+    return {"result": {"value": {"owner": str(TOKEN_PROGRAM_ID), "data": [base64.b64encode(data).decode(), "base64"]}}}
+
+
+def test_structs_match_layouts():
+    """The precompiled structs must have the same size as the construct layouts."""
+    assert MINT_STRUCT.size == MINT_LAYOUT.sizeof()
+    assert ACCOUNT_STRUCT.size == ACCOUNT_LAYOUT.sizeof()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_create_mint_info(seed):
+    """Mint info should match what the construct layout decodes."""
+    random.seed(seed)
+    data = _random_data(MINT_LAYOUT, ("mint_authority_option", "freeze_authority_option"))
+    decoded = MINT_LAYOUT.parse(data)
+    token = _TokenCore(PublicKey(1), TOKEN_PROGRAM_ID, Keypair())
+    assert token._create_mint_info(_rpc_info(data)) == MintInfo(  # pylint: disable=protected-access
+        mint_authority=PublicKey(decoded.mint_authority) if decoded.mint_authority_option else None,
+        supply=decoded.supply,
+        decimals=decoded.decimals,
+        is_initialized=decoded.is_initialized != 0,
+        freeze_authority=PublicKey(decoded.freeze_authority) if decoded.freeze_authority_option else None,
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_create_account_info(seed):
+    """Account info should match what the construct layout decodes."""
+    random.seed(seed)
+    data = _random_data(ACCOUNT_LAYOUT, ("delegate_option", "is_native_option", "close_authority_option"))
+    decoded = ACCOUNT_LAYOUT.parse(data)
+    token = _TokenCore(PublicKey(decoded.mint), TOKEN_PROGRAM_ID, Keypair())
+    assert token._create_account_info(_rpc_info(data)) == AccountInfo(  # pylint: disable=protected-access
+        mint=PublicKey(decoded.mint),
+        owner=PublicKey(decoded.owner),
+        amount=decoded.amount,
+        delegate=PublicKey(decoded.delegate) if decoded.delegate_option else None,
+        delegated_amount=decoded.delegated_amount if decoded.delegate_option else 0,
+        is_initialized=decoded.state != 0,
+        is_frozen=decoded.state == 2,
+        is_native=decoded.is_native_option == 1,
+        rent_exempt_reserve=decoded.is_native if decoded.is_native_option == 1 else None,
+        close_authority=PublicKey(decoded.close_authority) if decoded.close_authority_option else None,
+    )
+
+
+def test_create_account_info_rejects_other_mint():
+    """An account of another mint is rejected."""
+    data = _random_data(ACCOUNT_LAYOUT, ())
+    token = _TokenCore(PublicKey(1), TOKEN_PROGRAM_ID, Keypair())
+    with pytest.raises(AttributeError, match="Invalid account mint"):
+        token._create_account_info(_rpc_info(data))  # pylint: disable=protected-access
+    with pytest.raises(ValueError, match="Invalid account size"):
+        token._create_account_info(_rpc_info(data[:-1]))  # pylint: disable=protected-access
@@ -0,0 +1,102 @@
+"""Unit tests for the SPL token clients."""
+import asyncio
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import spl.token.instructions as spl_token
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.transaction import PACKET_DATA_SIZE, Transaction
+from spl.token.async_client import AsyncToken
+from spl.token.client import Token
+from spl.token.constants import TOKEN_PROGRAM_ID
+
+FAILING_DEST = PublicKey(7)
+
+
+def _stub_token_rpc(stub_rpc_server):
+    stub_rpc_server.results["getLatestBlockhash"] = {
+        "context": {"slot": 1},
+        "value": {"blockhash": str(PublicKey(3)), "lastValidBlockHeight": 100},
+    }
+
+    def send_transaction(params):
+        txn = Transaction.deserialize(base64.b64decode(params[0]))
+        assert len(base64.b64decode(params[0])) <= PACKET_DATA_SIZE
+        assert txn.verify_signatures()
+        dests = [spl_token.decode_transfer_checked(ix).dest for ix in txn.instructions]
+        return None if FAILING_DEST in dests else str(txn.signature())
+
+    stub_rpc_server.results["sendTransaction"] = send_transaction
+
+
+def _payouts(count):
+    return [(FAILING_DEST if idx == 150 else Keypair().public_key, idx) for idx in range(count)]
+
+
+def _check_results(stub_rpc_server, payouts, results):
+    sends = [req for req in stub_rpc_server.requests if req["method"] == "sendTransaction"]
+    assert 1 < len(sends) < len(payouts) // 10
+    assert [(result.dest, result.amount) for result in results] == payouts
+    failed = {result.signature for result in results if result.error is not None}
+    assert failed == {None}
+    assert results[150].error is not None
+    assert len({result.signature for result in results}) == len(sends)
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_batch_transfer_checked(stub_rpc_server, use_executor):
+    """Payouts are packed into full transactions and every recipient gets a result."""
+    _stub_token_rpc(stub_rpc_server)
+    payer, owner = Keypair(), Keypair()
+    payouts = _payouts(300)
+    with Client(stub_rpc_server.url) as client, ThreadPoolExecutor(max_workers=2) as executor:
+        token = Token(client, PublicKey(2), TOKEN_PROGRAM_ID, payer)
+        results = token.batch_transfer_checked(
+            PublicKey(1), payouts, owner, 6, executor=executor if use_executor else None
+        )
+    _check_results(stub_rpc_server, payouts, results)
+
+
+async def test_async_batch_transfer_checked(stub_rpc_server):
+    """Payouts are packed into full transactions and every recipient gets a result."""
+    _stub_token_rpc(stub_rpc_server)
+    payouts = _payouts(300)
+    async with AsyncClient(stub_rpc_server.url) as client:
+        token = AsyncToken(client, PublicKey(2), TOKEN_PROGRAM_ID, Keypair())
+        results = await token.batch_transfer_checked(PublicKey(1), payouts, Keypair(), 6, max_concurrency=2)
+        assert await token.batch_transfer_checked(PublicKey(1), [], Keypair(), 6) == []
+    _check_results(stub_rpc_server, payouts, results)
+
+
+async def test_async_batch_signing_runs_off_the_event_loop(stub_rpc_server, monkeypatch):
+    """The event loop keeps running while the transactions are signed, with or without an executor."""
+    _stub_token_rpc(stub_rpc_server)
+    sign_batches = AsyncToken._sign_batches  # pylint: disable=protected-access
+
+    def slow_sign_batches(self, *args):
+        time.sleep(0.2)
+        return sign_batches(self, *args)
+
+    monkeypatch.setattr(AsyncToken, "_sign_batches", slow_sign_batches)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.get_running_loop().create_task(tick())
+    async with AsyncClient(stub_rpc_server.url) as client:
+        token = AsyncToken(client, PublicKey(2), TOKEN_PROGRAM_ID, Keypair())
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = await token.batch_transfer_checked(PublicKey(1), _payouts(20), Keypair(), 6, executor=executor)
+    ticker.cancel()
+    assert all(result.signature for result in results)
+    assert ticks >= 10
@@ -1,4 +1,5 @@
 """Unit tests for solana.transaction."""
+import random
 from base64 import b64decode, b64encode
 
 import pytest
@@ -13,7 +14,7 @@ import solana.system_program as sp
 import solana.transaction as txlib
 from solana.blockhash import Blockhash
 from solana.keypair import Keypair
-from solana.message import CompiledInstruction, Message, MessageArgs, MessageHeader
+from solana.message import CompiledInstruction, Message, MessageArgs, MessageHeader, MessageTemplate
 from solana.publickey import PublicKey
 
 
@@ -501,3 +502,98 @@ def test_sort_account_metas(stubbed_blockhash):
     assert tx_msg.account_keys[3] == sorted_receivers[0]
     assert tx_msg.account_keys[4] == sorted_receivers[1]
     assert tx_msg.account_keys[5] == sorted_receivers[2]
+
+
+def test_transaction_builder_matches_transaction(stubbed_blockhash):
+    """Building once gives the same transaction as adding instructions one by one."""
+    sender = Keypair.from_seed(bytes([8] * PublicKey.LENGTH))
+    ixns = [
+        sp.transfer(sp.TransferParams(from_pubkey=sender.public_key, to_pubkey=PublicKey(i + 1), lamports=i))
+        for i in range(20)
+    ]
+    txn = txlib.Transaction(recent_blockhash=stubbed_blockhash, fee_payer=sender.public_key)
+    builder = txlib.TransactionBuilder(recent_blockhash=stubbed_blockhash, fee_payer=sender.public_key)
+    for ixn in ixns:
+        txn.add(ixn)
+        builder.add(ixn)
+    assert len(builder) == len(ixns)
+    txn.sign(sender)
+    assert builder.sign(sender) == txn
+    assert txlib.Transaction().add(builder).instructions == txn.instructions
+    with pytest.raises(ValueError):
+        builder.add("not an instruction")  # type: ignore
+
+
+def test_message_template(stubbed_blockhash):
+    """Patching a template gives the same wire bytes as building and signing from scratch."""
+    sender = Keypair.from_seed(bytes([9] * PublicKey.LENGTH))
+    receiver = PublicKey(5)
+
+    def _transfer(lamports):
+        return sp.transfer(sp.TransferParams(from_pubkey=sender.public_key, to_pubkey=receiver, lamports=lamports))
+
+    template = MessageTemplate.from_instructions([_transfer(0), _transfer(0)], fee_payer=sender.public_key)
+    assert template.signers == [sender.public_key]
+    assert template.data_lengths == [12, 12]
+
+    txn = txlib.Transaction(recent_blockhash=stubbed_blockhash, fee_payer=sender.public_key)
+    txn.add(_transfer(0), _transfer(123))
+    txn.sign(sender)
+    assert template.sign(stubbed_blockhash, [sender], [None, _transfer(123).data]) == txn.serialize()
+    assert template.serialize_message(stubbed_blockhash, [None, _transfer(123).data]) == txn.serialize_message()
+
+    with pytest.raises(ValueError):
+        template.serialize_message(stubbed_blockhash, [b"\x00"])
+    with pytest.raises(ValueError):
+        template.serialize_message(stubbed_blockhash, [b"\x00", None])
+    with pytest.raises(ValueError):
+        template.sign(stubbed_blockhash, [Keypair()])
+
+
+def test_transaction_size_estimator(stubbed_blockhash):
+    """The estimated size matches the serialized transaction for random instruction mixes."""
+    rng = random.Random(0)
+    keypairs = [Keypair() for _ in range(6)]
+    pubkeys = [PublicKey(idx + 1) for idx in range(40)]
+    for _ in range(30):
+        payer = rng.choice(keypairs)
+        estimator = txlib.TransactionSizeEstimator(fee_payer=payer.public_key)
+        builder = txlib.TransactionBuilder(recent_blockhash=stubbed_blockhash, fee_payer=payer.public_key)
+        signers = {bytes(payer.public_key): payer}
+        for _ in range(rng.randint(1, 12)):
+            metas = []
+            for _ in range(rng.randint(0, 5)):
+                if rng.random() < 0.3:
+                    signer = rng.choice(keypairs)
+                    signers[bytes(signer.public_key)] = signer
+                    metas.append(txlib.AccountMeta(signer.public_key, is_signer=True, is_writable=rng.random() < 0.5))
+                else:
+                    metas.append(
+                        txlib.AccountMeta(rng.choice(pubkeys), is_signer=False, is_writable=rng.random() < 0.5)
+                    )
+            ixn = txlib.TransactionInstruction(
+                keys=metas, program_id=rng.choice(pubkeys), data=bytes(rng.randint(0, 200))
+            )
+            expected = estimator.size_with(ixn)
+            assert estimator.add(ixn) == expected
+            builder.add(ixn)
+        assert len(builder.sign(*signers.values()).serialize()) == estimator.size
+        assert estimator.num_signatures == len(signers)
+
+
+def test_pack_instructions():
+    """Instructions are packed in order into transactions that stay under the limit."""
+    payer = Keypair()
+    instructions = [
+        sp.transfer(sp.TransferParams(from_pubkey=payer.public_key, to_pubkey=PublicKey(idx % 50 + 1), lamports=idx))
+        for idx in range(200)
+    ]
+    batches = txlib.pack_instructions(instructions, payer.public_key)
+    assert [ixn for batch in batches for ixn in batch] == instructions
+    for batch in batches:
+        assert txlib.TransactionSizeEstimator(payer.public_key, batch).size <= txlib.PACKET_DATA_SIZE
+    for batch, following in zip(batches, batches[1:]):
+        assert not txlib.TransactionSizeEstimator(payer.public_key, batch).fits(following[0])
+    oversized = txlib.TransactionInstruction(keys=[], program_id=PublicKey(1), data=bytes(txlib.PACKET_DATA_SIZE))
+    with pytest.raises(ValueError):
+        txlib.pack_instructions([oversized])